@@ -0,0 +1,171 @@
+"""End-to-end benchmark of match creation against the local mock Lichess server
+
+The mock server (:mod:`play_lichess.testing`) runs in a separate process, so the CPU
+time reported is only the time spent by the client. For every ``create`` variant and
+concurrency level, the benchmark reports:
+
+- throughput in create calls per second
+- p50 and p99 latency of a single create call
+- client CPU time per match
+- memory retained per match
+- the number of calls that failed after retries
+
+Run with ``python benchmarks/bench_create.py --help`` for the options.
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+sys.path.insert(0, ".")
+
+from play_lichess import (  # noqa: E402
+    BaseError,
+    CorrespondenceMatch,
+    LichessClient,
+    Match,
+    MatchTemplate,
+    RateLimiter,
+    RealTimeMatch,
+    UnlimitedMatch,
+)
+
+CreateFunction = Callable[[LichessClient], Awaitable[Any]]
+
+
+def _template_create() -> CreateFunction:
+    template: MatchTemplate[Match] = MatchTemplate()
+    return lambda client: template.create(client=client)
+
+
+VARIANTS: Dict[str, Callable[[], CreateFunction]] = {
+    "Match.create": lambda: lambda client: Match.create(client=client),
+    "RealTimeMatch.create": lambda: lambda client: RealTimeMatch.create(client=client),
+    "CorrespondenceMatch.create": lambda: lambda client: CorrespondenceMatch.create(
+        client=client
+    ),
+    "UnlimitedMatch.create": lambda: lambda client: UnlimitedMatch.create(
+        client=client
+    ),
+    "MatchTemplate.create": _template_create,
+}
+
+
+async def run(
+    client: LichessClient, create: CreateFunction, requests: int, concurrency: int
+) -> Tuple[List[float], int]:
+    """Create matches with a number of workers and get the latency of each call
+    and the number of failed calls"""
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                await create(client)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def memory_per_match(client: LichessClient, create: CreateFunction) -> float:
+    """Get the number of bytes retained per created match"""
+    count = 200
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    matches = []
+    for _ in range(count):
+        try:
+            matches.append(await create(client))
+        except BaseError:
+            pass
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used / max(len(matches), 1)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def benchmark(args: argparse.Namespace, base_url: str) -> None:
+    limiter = RateLimiter(cooldown=args.cooldown, backoff_base=0.01)
+    async with LichessClient(
+        base_url=base_url, rate_limiter=limiter, json_backend=args.json_backend
+    ) as client:
+        # open connections before measuring
+        await run(client, VARIANTS["Match.create"](), 20, 10)
+        print(
+            f"{'variant':<28} {'conc':>5} {'calls/s':>10} {'p50 ms':>8} "
+            f"{'p99 ms':>8} {'CPU µs':>8} {'bytes':>7} {'errors':>6}"
+        )
+        for name, make_create in VARIANTS.items():
+            create = make_create()
+            memory = await memory_per_match(client, create)
+            for concurrency in args.concurrency:
+                cpu_start = time.process_time()
+                wall_start = time.perf_counter()
+                latencies, errors = await run(
+                    client, create, args.requests, concurrency
+                )
+                wall = time.perf_counter() - wall_start
+                cpu = time.process_time() - cpu_start
+                print(
+                    f"{name:<28} {concurrency:>5} {len(latencies) / wall:>10.0f} "
+                    f"{statistics.median(latencies) * 1000:>8.2f} "
+                    f"{percentile(latencies, 0.99) * 1000:>8.2f} "
+                    f"{cpu / len(latencies) * 1e6:>8.0f} {memory:>7.0f} {errors:>6}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark match creation")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0)
+    parser.add_argument("--cooldown", type=float, default=0.1)
+    parser.add_argument("--json-backend", default="json")
+    args = parser.parse_args()
+
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "play_lichess.testing",
+            "--latency",
+            str(args.latency),
+            "--error-rate",
+            str(args.error_rate),
+            "--rate-limit-rate",
+            str(args.rate_limit_rate),
+            "--seed",
+            "0",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert server.stdout is not None
+        base_url = server.stdout.readline().strip()
+        asyncio.run(benchmark(args, base_url))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark of the time taken to import play_lichess
+
+Each statement is run in a new interpreter, so nothing is already imported.
+The time of starting an interpreter that only imports :mod:`sys` is subtracted.
+
+Run with ``python benchmarks/bench_import.py --help`` for the options.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+STATEMENTS = [
+    "import play_lichess",
+    "from play_lichess import Variant, TimeMode",
+    "from play_lichess import LichessClient",
+    "from play_lichess import *",
+]
+
+
+def measure(statement: str, runs: int) -> List[float]:
+    """Get the time in seconds to start an interpreter and run a statement, for each run"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True, cwd=".")
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark importing play_lichess")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure("import sys", args.runs))
+    print(f"{'statement':<44} {'median ms':>10} {'min ms':>8}")
+    for statement in STATEMENTS:
+        times = [t - baseline for t in measure(statement, args.runs)]
+        print(
+            f"{statement:<44} {statistics.median(times) * 1000:>10.1f} "
+            f"{min(times) * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark of the memory used per stored :class:`MatchInfo`
+
+Compares matches stored as regular dataclasses with a per-instance ``__dict__``
+(as before ``__slots__`` were added) with the slotted classes, with and without
+keeping the raw response data.
+
+Run with ``python benchmarks/bench_memory.py [number of matches]``
+"""
+
+import json
+import sys
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from typing import Any, Callable, List
+
+sys.path.insert(0, ".")
+
+from play_lichess import MatchInfo, TimeControl, User  # noqa: E402
+
+RESPONSE = json.dumps(
+    {
+        "challenge": {
+            "id": "f1S4BBYW",
+            "url": "https://lichess.org/f1S4BBYW",
+            "status": "created",
+            "challenger": {"id": "alice", "username": "Alice", "rating": 1500},
+            "destUser": None,
+            "variant": {"key": "standard", "name": "Standard", "short": "Std"},
+            "rated": False,
+            "speed": "blitz",
+            "timeControl": {
+                "type": "clock",
+                "limit": 300,
+                "increment": 0,
+                "show": "5+0",
+            },
+            "color": "random",
+            "finalColor": "white",
+            "perf": {"icon": "", "name": "Blitz"},
+            "open": {},
+        },
+        "urlWhite": "https://lichess.org/f1S4BBYW?color=white",
+        "urlBlack": "https://lichess.org/f1S4BBYW?color=black",
+    }
+)
+
+
+def _unslotted(cls: type) -> Any:
+    """Create a regular dataclass with the same fields as a slotted dataclass"""
+    return make_dataclass(
+        cls.__name__,
+        [
+            (
+                (f.name, f.type, field(default=f.default))
+                if f.default is not MISSING
+                else (f.name, f.type)
+            )
+            for f in fields(cls)
+        ],
+    )
+
+
+DictMatchInfo = _unslotted(MatchInfo)
+DictUser = _unslotted(User)
+DictTimeControl = _unslotted(TimeControl)
+
+
+def _as_dict_dataclass(match: MatchInfo) -> Any:
+    values = {f.name: getattr(match, f.name) for f in fields(match)}
+    if match.challenger is not None:
+        values["challenger"] = DictUser(
+            **{f.name: getattr(match.challenger, f.name) for f in fields(User)}
+        )
+    if match.time_control is not None:
+        values["time_control"] = DictTimeControl(
+            **{f.name: getattr(match.time_control, f.name) for f in fields(TimeControl)}
+        )
+    return DictMatchInfo(**values)
+
+
+def measure(count: int, build: Callable[[Any], Any]) -> float:
+    """Get the number of bytes allocated per stored match"""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    # every response is decoded separately, as it is when received from Lichess
+    matches: List[Any] = [build(json.loads(RESPONSE)) for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del matches
+    return used / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = {
+        "dataclass with __dict__, raw data kept (before)": measure(
+            count, lambda data: _as_dict_dataclass(MatchInfo.from_data(data))
+        ),
+        "slots, raw data kept": measure(count, MatchInfo.from_data),
+        "slots, keep_data=False": measure(
+            count, lambda data: MatchInfo.from_data(data, keep_data=False)
+        ),
+    }
+    print(f"Memory per stored match ({count} matches)")
+    for label, size in results.items():
+        print(f"  {label:<50} {size:>8.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark of the ways to store a created match and load it again
+
+For each way, the benchmark reports the size of the stored match and the time
+to encode and decode it.
+
+Run with ``python benchmarks/bench_serialize.py``.
+"""
+
+import json
+import pickle
+import sys
+import timeit
+from typing import Any, Callable, Dict, Tuple
+
+sys.path.insert(0, ".")
+
+from play_lichess import RealTimeMatch  # noqa: E402
+from play_lichess.testing import challenge_response  # noqa: E402
+
+DATA = challenge_response("abcd1234", {"clock.limit": 180, "clock.increment": 2})
+MATCH = RealTimeMatch.from_data(DATA, "Board 1")
+SLIM_MATCH = RealTimeMatch.from_data(DATA, "Board 1", keep_data=False)
+
+Codec = Tuple[Callable[[], Any], Callable[[Any], Any]]
+
+CODECS: Dict[str, Codec] = {
+    "pickle": (lambda: pickle.dumps(MATCH), pickle.loads),
+    "pickle (keep_data=False)": (lambda: pickle.dumps(SLIM_MATCH), pickle.loads),
+    "json + from_data": (
+        lambda: json.dumps(MATCH._data).encode(),
+        lambda data: RealTimeMatch.from_data(json.loads(data), "Board 1"),
+    ),
+    "to_bytes": (MATCH.to_bytes, RealTimeMatch.from_bytes),
+}
+
+
+def main() -> None:
+    print(f"{'codec':<26} {'bytes':>6} {'encode µs':>10} {'decode µs':>10}")
+    for name, (encode, decode) in CODECS.items():
+        data = encode()
+        number = 20000
+        encode_time = min(timeit.repeat(encode, number=number, repeat=5)) / number
+        decode_time = (
+            min(timeit.repeat(lambda: decode(data), number=number, repeat=5)) / number
+        )
+        print(
+            f"{name:<26} {len(data):>6} {encode_time * 1e6:>10.2f} "
+            f"{decode_time * 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
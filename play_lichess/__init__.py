@@ -1,7 +1,48 @@
-from .exceptions import BadArgumentError, BaseError, HttpError
-from .match import CorrespondenceMatch, Match, MatchInfo, RealTimeMatch, UnlimitedMatch
-from .option import Option
-from .types import Color, TimeControl, TimeControlType, TimeMode, User, Variant
+"""Create Lichess matches
+
+The public names are imported from their submodules on first use, so that
+``from play_lichess import Variant`` does not import aiohttp and the HTTP client.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .batch import MatchBatch
+    from .breaker import CircuitBreaker
+    from .bulk import BulkGame, BulkPairing
+    from .client import LichessClient, Timeout
+    from .concurrency import AdaptiveLimiter
+    from .exceptions import (
+        BadArgumentError,
+        BaseError,
+        BulkPairingError,
+        CircuitOpenError,
+        HttpError,
+    )
+    from .fen import validate_fen
+    from .intern import InternStats, InternTable
+    from .journal import MatchJournal
+    from .jsonlib import JSONBackend, get_json_backend
+    from .match import (
+        CorrespondenceMatch,
+        CreateResult,
+        Match,
+        MatchInfo,
+        RealTimeMatch,
+        UnlimitedMatch,
+    )
+    from .metrics import Metrics
+    from .option import Option
+    from .pool import ChallengePool
+    from .ratelimit import RateLimiter, TokenBucket
+    from .template import MatchTemplate
+    from .tokens import TokenPool, TokenState
+    from .tracing import RequestTrace
+    from .types import Color, TimeControl, TimeControlType, TimeMode, User, Variant
+    from .watcher import ChallengeEvent, ChallengeWatcher
 
 __version__ = "1.1.1"
 
@@ -10,11 +51,37 @@ __all__ = [
     "BaseError",
     "HttpError",
     "BadArgumentError",
+    "CircuitOpenError",
+    "BulkPairingError",
+    "LichessClient",
+    "Timeout",
     "MatchInfo",
+    "CreateResult",
+    "MatchTemplate",
     "Match",
     "RealTimeMatch",
     "CorrespondenceMatch",
     "UnlimitedMatch",
+    "BulkPairing",
+    "BulkGame",
+    "MatchJournal",
+    "MatchBatch",
+    "ChallengePool",
+    "ChallengeWatcher",
+    "ChallengeEvent",
+    "RateLimiter",
+    "TokenBucket",
+    "CircuitBreaker",
+    "AdaptiveLimiter",
+    "TokenPool",
+    "TokenState",
+    "RequestTrace",
+    "Metrics",
+    "JSONBackend",
+    "get_json_backend",
+    "validate_fen",
+    "InternTable",
+    "InternStats",
     "Option",
     "Variant",
     "TimeMode",
@@ -23,3 +90,58 @@ __all__ = [
     "TimeControl",
     "User",
 ]
+
+# the submodule defining each public name
+_SUBMODULES: Dict[str, List[str]] = {
+    "batch": ["MatchBatch"],
+    "breaker": ["CircuitBreaker"],
+    "bulk": ["BulkGame", "BulkPairing"],
+    "client": ["LichessClient", "Timeout"],
+    "concurrency": ["AdaptiveLimiter"],
+    "exceptions": [
+        "BadArgumentError",
+        "BaseError",
+        "BulkPairingError",
+        "CircuitOpenError",
+        "HttpError",
+    ],
+    "fen": ["validate_fen"],
+    "intern": ["InternStats", "InternTable"],
+    "journal": ["MatchJournal"],
+    "jsonlib": ["JSONBackend", "get_json_backend"],
+    "match": [
+        "CorrespondenceMatch",
+        "CreateResult",
+        "Match",
+        "MatchInfo",
+        "RealTimeMatch",
+        "UnlimitedMatch",
+    ],
+    "metrics": ["Metrics"],
+    "option": ["Option"],
+    "pool": ["ChallengePool"],
+    "ratelimit": ["RateLimiter", "TokenBucket"],
+    "template": ["MatchTemplate"],
+    "tokens": ["TokenPool", "TokenState"],
+    "tracing": ["RequestTrace"],
+    "types": ["Color", "TimeControl", "TimeControlType", "TimeMode", "User", "Variant"],
+    "watcher": ["ChallengeEvent", "ChallengeWatcher"],
+}
+
+_LOCATIONS: Dict[str, str] = {
+    name: module for module, names in _SUBMODULES.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LOCATIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # later lookups find the name without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
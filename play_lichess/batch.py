@@ -0,0 +1,444 @@
+"""Column-wise storage of many matches for analytics
+
+A :class:`MatchBatch` keeps one array per attribute instead of one object per match.
+Enum attributes are stored as one-byte codes (their position in the Enum, as in
+:mod:`play_lichess.serialization`), and the clock and days as 32-bit integers with -1
+for a missing value, so a batch of tens of thousands of matches takes a few hundred
+kilobytes and is filtered and counted by iterating over the arrays in C.
+"""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from collections import Counter
+from enum import Enum
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Type, cast
+
+from .exceptions import BadArgumentError
+from .match import MatchInfo
+from .serialization import enum_code
+from .types import Color, TimeControlType, TimeMode, Variant
+
+_MISSING = -1
+
+_ENUM_COLUMNS: Mapping[str, Type[Enum]] = {
+    "variant": Variant,
+    "speed": TimeMode,
+    "color": Color,
+    "time_control_type": TimeControlType,
+}
+_INT_COLUMNS = ("clock_limit", "clock_increment", "days")
+
+COLUMNS = ("status", "rated", *_ENUM_COLUMNS, *_INT_COLUMNS)
+"""The names of the columns that can be filtered, grouped and counted"""
+
+_data_codes: Dict[type, Dict[str, int]] = {}
+
+
+def _code_by_data(cls: Any, data: str) -> int:
+    """Get the code of the Enum member with the Lichess name data"""
+    codes = _data_codes.get(cls)
+    if codes is None:
+        codes = _data_codes[cls] = {m.value.data: enum_code(m) for m in cls}
+    code = codes.get(data)
+    if code is None:
+        # raises ValueError for an unknown name
+        code = enum_code(cls.find_by_data(data))
+    return code
+
+
+def _int_or_missing(value: int | None) -> int:
+    return _MISSING if value is None else value
+
+
+class MatchBatch:
+    """Column-wise container of many created matches, for analytics
+
+    Matches are added from the raw challenge responses of Lichess or from :class:`MatchInfo`
+    objects. The batch can then be filtered, grouped and counted by column::
+
+        batch = MatchBatch.from_matches(matches)
+        blitz = batch.filter(speed=TimeMode.BLITZ, rated=False)
+        blitz.count_by("variant")  # {Variant.STANDARD: 812, Variant.ATOMIC: 95, ...}
+        accepted = batch.filter(status="accepted")
+        print(len(accepted) / len(batch))
+
+    The columns are listed in :data:`COLUMNS`: "status", "rated", "variant", "speed",
+    "color", "time_control_type", "clock_limit", "clock_increment" and "days".
+
+    Attributes
+    ----------
+    challenge_ids: List[:class:`str`]
+        The challenge id of each match
+    names: List[Optional[:class:`str`]]
+        The name of each match
+    """
+
+    __slots__ = ("challenge_ids", "names", "_columns", "_statuses", "_status_codes")
+
+    def __init__(self):
+        self.challenge_ids: List[str] = []
+        self.names: List[str | None] = []
+        self._columns: Dict[str, array] = {
+            "status": array("H"),
+            "rated": array("B"),
+            **{name: array("B") for name in _ENUM_COLUMNS},
+            **{name: array("i") for name in _INT_COLUMNS},
+        }
+        # statuses are free-form strings, so each batch has its own codes
+        self._statuses: List[str] = []
+        self._status_codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.challenge_ids)
+
+    def __repr__(self) -> str:
+        return f"<MatchBatch matches={len(self)}>"
+
+    @classmethod
+    def from_data(cls, payloads: Iterable[Mapping[str, Any]]) -> MatchBatch:
+        """Create a batch from the responses of Lichess to challenge creation requests
+
+        Parameters
+        ----------
+        payloads: Iterable[Mapping[:class:`str`, Any]]
+            The decoded responses, as passed to :meth:`MatchInfo.from_data`
+        """
+        batch = cls()
+        for data in payloads:
+            batch.append_data(data)
+        return batch
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[MatchInfo]) -> MatchBatch:
+        """Create a batch from match objects
+
+        Parameters
+        ----------
+        matches: Iterable[:class:`MatchInfo`]
+            The matches to add
+        """
+        batch = cls()
+        for match in matches:
+            batch.append(match)
+        return batch
+
+    def _status_code(self, status: str) -> int:
+        code = self._status_codes.get(status)
+        if code is None:
+            code = self._status_codes[status] = len(self._statuses)
+            self._statuses.append(status)
+        return code
+
+    def _append_row(
+        self,
+        challenge_id: str,
+        name: str | None,
+        status: str,
+        rated: bool,
+        codes: Tuple[int, int, int, int],
+        numbers: Tuple[int | None, int | None, int | None],
+    ) -> None:
+        self.challenge_ids.append(challenge_id)
+        self.names.append(name)
+        columns = self._columns
+        columns["status"].append(self._status_code(status))
+        columns["rated"].append(rated)
+        for column, code in zip(_ENUM_COLUMNS, codes):
+            columns[column].append(code)
+        for column, number in zip(_INT_COLUMNS, numbers):
+            columns[column].append(_int_or_missing(number))
+
+    def append_data(self, data: Mapping[str, Any], name: str | None = None) -> None:
+        """Add a match from the response of Lichess, without creating a :class:`MatchInfo`
+
+        Parameters
+        ----------
+        data: Mapping[:class:`str`, Any]
+            The decoded response, as passed to :meth:`MatchInfo.from_data`
+        name: Optional[:class:`str`]
+            The name of the match, which is not in the response
+        """
+        challenge = data["challenge"]
+        time_control = challenge["timeControl"]
+        self._append_row(
+            challenge["id"],
+            name,
+            challenge["status"],
+            challenge["rated"],
+            (
+                _code_by_data(Variant, challenge["variant"]["key"]),
+                _code_by_data(TimeMode, challenge["speed"]),
+                _code_by_data(Color, challenge["color"]),
+                _code_by_data(TimeControlType, time_control["type"]),
+            ),
+            (
+                time_control.get("limit"),
+                time_control.get("increment"),
+                time_control.get("daysPerTurn"),
+            ),
+        )
+
+    def append(self, match: MatchInfo) -> None:
+        """Add a match object
+
+        Parameters
+        ----------
+        match: :class:`MatchInfo`
+            The match to add
+        """
+        time_control = match.time_control
+        numbers: Tuple[int | None, int | None, int | None]
+        if time_control is None:
+            type_code, numbers = enum_code(TimeControlType.UNLIMITED), (
+                None,
+                None,
+                None,
+            )
+        else:
+            type_code = enum_code(time_control.type)
+            numbers = (
+                time_control.limit,
+                time_control.increment,
+                time_control.days_per_turn,
+            )
+        self._append_row(
+            match.challenge_id,
+            match.name,
+            match.status,
+            match.rated,
+            (
+                enum_code(match.variant),
+                enum_code(match.speed),
+                enum_code(match.color),
+                type_code,
+            ),
+            numbers,
+        )
+
+    def column(self, name: str) -> array:
+        """Get the array of codes or numbers of a column
+
+        Enum columns hold the position of each member in its Enum, "rated" holds 0 or 1,
+        "status" holds codes that are only valid in this batch, and the number columns hold
+        -1 for a missing value. The array must not be changed.
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the column does not exist.
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise BadArgumentError(
+                f"Unknown column {name!r}, must be one of: " + ", ".join(COLUMNS)
+            ) from None
+
+    def _decoder(self, name: str) -> Sequence[Any] | None:
+        """Get the value of each code of a column, or None if the codes are the values"""
+        enum = _ENUM_COLUMNS.get(name)
+        if enum is not None:
+            return tuple(enum)
+        if name == "status":
+            return self._statuses
+        if name == "rated":
+            return (False, True)
+        return None
+
+    def values(self, name: str) -> List[Any]:
+        """Get the values of a column: Enum members, statuses, booleans, or numbers and None
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the column does not exist.
+        """
+        column = self.column(name)
+        decoder = self._decoder(name)
+        if decoder is None:
+            return [None if value == _MISSING else value for value in column]
+        return list(map(decoder.__getitem__, column))
+
+    def _encode(self, name: str, value: Any) -> int:
+        if value is None and name in _INT_COLUMNS:
+            return _MISSING
+        if name == "status":
+            # a status that no match has cannot be matched
+            return self._status_codes.get(cast(str, value), _MISSING)
+        if name in _ENUM_COLUMNS:
+            if not isinstance(value, _ENUM_COLUMNS[name]):
+                raise BadArgumentError(
+                    f"{name} must be a {_ENUM_COLUMNS[name].__name__}, got {value!r}"
+                )
+            return enum_code(value)
+        if value is None:
+            raise BadArgumentError(f"{name} cannot be None")
+        return int(value)
+
+    def _mask(self, name: str, value: Any) -> List[bool]:
+        column = self.column(name)
+        # the Enum members are also tuples, since Option is a NamedTuple
+        if isinstance(value, (set, frozenset, list, tuple)) and not isinstance(
+            value, Enum
+        ):
+            codes = {self._encode(name, item) for item in value}
+            return list(map(codes.__contains__, column))
+        return list(map(self._encode(name, value).__eq__, column))
+
+    def mask(self, **conditions: Any) -> List[bool]:
+        """Get whether each match has the values of all conditions
+
+        Accepts the same conditions as :meth:`filter`.
+        """
+        selected: List[bool] | None = None
+        for name, value in conditions.items():
+            mask = self._mask(name, value)
+            selected = (
+                mask if selected is None else list(map(operator.and_, selected, mask))
+            )
+        return [True] * len(self) if selected is None else selected
+
+    def filter(
+        self, mask: Iterable[bool] | None = None, **conditions: Any
+    ) -> MatchBatch:
+        """Get a new batch with the matches that have the values of all conditions
+
+        Examples:
+
+        - ``batch.filter(variant=Variant.ATOMIC)``
+        - ``batch.filter(speed={TimeMode.BULLET, TimeMode.BLITZ}, rated=True)``
+        - ``batch.filter(clock_limit=180, status="accepted")``
+        - ``batch.filter([limit >= 600 for limit in batch.column("clock_limit")])``
+
+        Parameters
+        ----------
+        mask: Optional[Iterable[:class:`bool`]]
+            Whether to keep each match, in addition to the conditions
+        **conditions: Any
+            A value, or a collection of allowed values, of any columns.
+            None matches a missing clock or days.
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If a column does not exist, or the value of an Enum column is not a member of its Enum.
+        """
+        selected = self.mask(**conditions)
+        if mask is not None:
+            selected = list(map(operator.and_, selected, map(bool, mask)))
+        return self._select(selected)
+
+    def _select(self, selected: Iterable[bool]) -> MatchBatch:
+        selected = list(selected)
+        batch = self._empty_like()
+        batch.challenge_ids = list(compress(self.challenge_ids, selected))
+        batch.names = list(compress(self.names, selected))
+        for name, column in self._columns.items():
+            batch._columns[name] = array(column.typecode, compress(column, selected))
+        return batch
+
+    def _empty_like(self) -> MatchBatch:
+        batch = type(self)()
+        # the codes stay valid since statuses are only added to the table
+        batch._statuses = self._statuses
+        batch._status_codes = self._status_codes
+        return batch
+
+    def _keys(self, names: Sequence[str]) -> Iterable[Any]:
+        if len(names) == 1:
+            return self.column(names[0])
+        return zip(*(self.column(name) for name in names))
+
+    def _decode_key(self, names: Sequence[str], key: Any) -> Any:
+        if len(names) == 1:
+            return self._decode_code(names[0], key)
+        return tuple(self._decode_code(name, code) for name, code in zip(names, key))
+
+    def _decode_code(self, name: str, code: int) -> Any:
+        decoder = self._decoder(name)
+        if decoder is None:
+            return None if code == _MISSING else code
+        return decoder[code]
+
+    def count_by(self, *names: str) -> Dict[Any, int]:
+        """Count the matches by the values of one or more columns, most common first
+
+        Examples:
+
+        - ``batch.count_by("variant")`` gives ``{Variant.STANDARD: 812, ...}``
+        - ``batch.count_by("clock_limit", "clock_increment")`` gives ``{(180, 2): 301, ...}``
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If no column is given or a column does not exist.
+        """
+        if not names:
+            raise BadArgumentError("count_by needs at least one column")
+        counts = Counter(self._keys(names))
+        return {
+            self._decode_key(names, key): count for key, count in counts.most_common()
+        }
+
+    def group_by(self, *names: str) -> Dict[Any, MatchBatch]:
+        """Split the matches into batches by the values of one or more columns
+
+        The keys are the same as those of :meth:`count_by`, in the order they first appear.
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If no column is given or a column does not exist.
+        """
+        if not names:
+            raise BadArgumentError("group_by needs at least one column")
+        rows: Dict[Any, List[int]] = {}
+        for index, key in enumerate(self._keys(names)):
+            group = rows.get(key)
+            if group is None:
+                rows[key] = [index]
+            else:
+                group.append(index)
+        return {
+            self._decode_key(names, key): self._take(indices)
+            for key, indices in rows.items()
+        }
+
+    def _take(self, indices: List[int]) -> MatchBatch:
+        batch = self._empty_like()
+        batch.challenge_ids = list(map(self.challenge_ids.__getitem__, indices))
+        batch.names = list(map(self.names.__getitem__, indices))
+        for name, column in self._columns.items():
+            batch._columns[name] = array(
+                column.typecode, map(column.__getitem__, indices)
+            )
+        return batch
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Get the columns as NumPy arrays (``pip install numpy``)
+
+        The arrays are copies of the columns, with the same codes as :meth:`column`.
+        The "challenge_id" and "name" arrays hold Python objects.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`numpy.ndarray`]
+            The array of each column
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        import numpy  # type: ignore
+
+        arrays: Dict[str, Any] = {
+            "challenge_id": numpy.array(self.challenge_ids, dtype=object),
+            "name": numpy.array(self.names, dtype=object),
+        }
+        for name, column in self._columns.items():
+            arrays[name] = numpy.frombuffer(column, dtype=column.typecode).copy()
+        return arrays
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+import aiohttp
+
+from .exceptions import BadArgumentError, CircuitOpenError, HttpError
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_outage(error: BaseException) -> bool:
+    """Whether an error means that Lichess cannot be reached or is failing
+
+    Connection errors, timeouts and responses with a 5xx status count toward opening
+    the circuit. Other errors, such as invalid arguments or a 429 response, show that
+    Lichess is responding.
+    """
+    if isinstance(error, HttpError):
+        return 500 <= error.status_code < 600
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+class CircuitBreaker:
+    """Circuit breaker that fails fast while Lichess is unavailable
+
+    - While the circuit is closed, requests are sent normally.
+    - After ``failure_threshold`` consecutive connection errors, timeouts or 5xx responses,
+      the circuit opens and requests raise :class:`CircuitOpenError` at once instead of
+      waiting for the connection or server to time out.
+    - After ``reset_timeout`` seconds, the circuit is half-open: up to ``half_open_probes``
+      requests are sent as probes. If a probe succeeds, the circuit closes again,
+      and if it fails, the circuit opens for another ``reset_timeout`` seconds.
+
+    The state can be read for health checks::
+
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        client = LichessClient(circuit_breaker=breaker)
+        ...
+        healthy = breaker.state == "closed"
+
+    Parameters
+    ----------
+    failure_threshold: :class:`int`
+        The number of consecutive failures that open the circuit. The default is 5
+    reset_timeout: :class:`float`
+        The number of seconds the circuit stays open before probes are sent. The default is 30
+    half_open_probes: :class:`int`
+        The maximum number of probes in flight while the circuit is half-open. The default is 1
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If failure_threshold or half_open_probes is less than 1, or reset_timeout is negative.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        half_open_probes: int = 1,
+    ):
+        if failure_threshold < 1:
+            raise BadArgumentError("failure_threshold must be at least 1")
+        if reset_timeout < 0:
+            raise BadArgumentError("reset_timeout cannot be negative")
+        if half_open_probes < 1:
+            raise BadArgumentError("half_open_probes must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at: float | None = None
+        self._probes = 0
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker state={self.state!r} failures={self.failures}>"
+
+    @property
+    def state(self) -> str:
+        """The state of the circuit: "closed", "open" or "half_open" """
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """The number of seconds until probes are sent, or 0 if the circuit is not open"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the state of the circuit breaker as a dictionary, for health checks
+
+        Returns
+        -------
+        :class:`dict`
+            The state, the number of consecutive failures, the number of times the
+            circuit opened, the number of rejected requests and the seconds until
+            probes are sent
+        """
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after,
+        }
+
+    def reset(self) -> None:
+        """Close the circuit and forget the failures"""
+        self.failures = 0
+        self._opened_at = None
+        self._probes = 0
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self.opened += 1
+
+    async def run(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Send a request unless the circuit is open
+
+        Parameters
+        ----------
+        send: Callable[[], Awaitable[T]]
+            A function that sends the request
+
+        Returns
+        -------
+        T
+            The result of the request
+
+        Raises
+        ------
+        :class:`CircuitOpenError`
+            If the circuit is open, or half-open with the maximum number of probes in flight.
+        """
+        state = self.state
+        probe = state == HALF_OPEN
+        if state == OPEN or (probe and self._probes >= self.half_open_probes):
+            self.rejected += 1
+            raise CircuitOpenError(self.failures, self.retry_after)
+        if probe:
+            self._probes += 1
+        try:
+            result = await send()
+        except BaseException as error:
+            if is_outage(error):
+                self.failures += 1
+                if probe or (
+                    self._opened_at is None and self.failures >= self.failure_threshold
+                ):
+                    self._open()
+            elif isinstance(error, HttpError):
+                # Lichess responded, so it is available
+                self.reset()
+            raise
+        finally:
+            if probe:
+                self._probes = max(0, self._probes - 1)
+        self.reset()
+        return result
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Type, TypeVar
+
+from .client import LichessClient
+from .exceptions import BadArgumentError, BulkPairingError
+from .match import _match_params
+from .types import TimeControl, Variant
+from .utils import slotted_dataclass
+
+BulkPairingT = TypeVar("BulkPairingT", bound="BulkPairing")
+
+MAX_PAIRS_PER_REQUEST = 500
+"""The maximum number of games Lichess accepts in one bulk pairing request"""
+
+
+@slotted_dataclass(frozen=True)
+class BulkGame:
+    """Class representing one game of a :class:`BulkPairing`
+
+    Attributes
+    ----------
+    game_id: :class:`str`
+        The id of the game
+    white: :class:`str`
+        The username of the player with the white pieces
+    black: :class:`str`
+        The username of the player with the black pieces
+    """
+
+    game_id: str
+    white: str
+    black: str
+
+    @property
+    def url(self) -> str:
+        """The url of the game"""
+        return f"https://lichess.org/{self.game_id}"
+
+    @classmethod
+    def from_data(cls: Type["BulkGame"], data: Mapping[str, Any]) -> "BulkGame":
+        """Create a :class:`BulkGame` object from a dictionary of data"""
+        return cls(game_id=data["id"], white=data["white"], black=data["black"])
+
+
+def _time_control(data: Mapping[str, Any]) -> TimeControl:
+    """Get the time control of a bulk pairing, which is not in the format of challenges"""
+    clock = data.get("clock")
+    if clock is not None:
+        return TimeControl.from_data(
+            {"type": "clock", "limit": clock["limit"], "increment": clock["increment"]}
+        )
+    days = data.get("days")
+    if days is not None:
+        return TimeControl.from_data({"type": "correspondence", "daysPerTurn": days})
+    return TimeControl.from_data({"type": "unlimited"})
+
+
+def _form_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+@slotted_dataclass()
+class BulkPairing:
+    """Class for storing the games created at once by a bulk pairing
+
+    Attributes
+    ----------
+    bulk_id: :class:`str`
+        The id of the bulk pairing
+    games: List[:class:`BulkGame`]
+        The games of the bulk pairing
+    variant: :class:`Variant`
+        The variant of the games
+    time_control: :class:`TimeControl`
+        The time control of the games
+    rated: :class:`bool`
+        Whether the games are rated
+    pair_at: Optional[:class:`int`]
+        When the games are created, in milliseconds since the epoch
+    paired_at: Optional[:class:`int`]
+        When the games were created, if they were, in milliseconds since the epoch
+    start_clocks_at: Optional[:class:`int`]
+        When the clocks start, in milliseconds since the epoch
+    scheduled_at: Optional[:class:`int`]
+        When the bulk pairing was scheduled, in milliseconds since the epoch
+    """
+
+    bulk_id: str
+    games: List[BulkGame]
+    variant: Variant = Variant.STANDARD
+    time_control: TimeControl | None = None
+    rated: bool = False
+    pair_at: int | None = None
+    paired_at: int | None = None
+    start_clocks_at: int | None = None
+    scheduled_at: int | None = None
+    _data: Mapping[str, Any] | None = None
+
+    @classmethod
+    def from_data(
+        cls: Type[BulkPairingT], data: Mapping[str, Any], *, keep_data: bool = True
+    ) -> BulkPairingT:
+        """Create a :class:`BulkPairing` object from a dictionary of data
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            A dictionary of data to create the :class:`BulkPairing` object from
+        keep_data: :class:`bool`
+            Whether to keep a reference to the dictionary of data in the object. The default is True
+        """
+        return cls(
+            bulk_id=data["id"],
+            games=[BulkGame.from_data(game) for game in data["games"]],
+            variant=Variant.find_by_data(data.get("variant", "standard")),
+            time_control=_time_control(data),
+            rated=data.get("rated", False),
+            pair_at=data.get("pairAt"),
+            paired_at=data.get("pairedAt"),
+            start_clocks_at=data.get("startClocksAt"),
+            scheduled_at=data.get("scheduledAt"),
+            _data=data if keep_data else None,
+        )
+
+    @classmethod
+    async def create(
+        cls: Type[BulkPairingT],
+        pairs: Sequence[Tuple[str, str]],
+        *,
+        token: str,
+        rated: bool = False,
+        clock_limit: int | None = 300,
+        clock_increment: int | None = 0,
+        days: int | None = None,
+        variant: Variant = Variant.STANDARD,
+        fen: str | None = None,
+        message: str | None = None,
+        pair_at: int | None = None,
+        start_clocks_at: int | None = None,
+        chunk_size: int = MAX_PAIRS_PER_REQUEST,
+        client: LichessClient | None = None,
+    ) -> List[BulkPairingT]:
+        """Create the games of a round at once with the bulk pairing API of Lichess
+
+        Rounds with more than ``chunk_size`` games are split into several bulk pairings,
+        which are created one after another.
+
+        Parameters
+        ----------
+        pairs: Sequence[Tuple[:class:`str`, :class:`str`]]
+            The OAuth tokens of the white and black player of each game,
+            with the ``challenge:write`` scope
+        token: :class:`str`
+            The OAuth token of the account creating the games, with the ``challenge:bulk`` scope
+        rated: :class:`bool`
+            Games are rated and impact players ratings
+        clock_limit: Optional[:class:`int`]
+            Clock initial time in seconds. Leave blank for correspondence or unlimited games.
+        clock_increment: Optional[:class:`int`]
+            Clock increment in seconds. Leave blank for correspondence or unlimited games.
+        days: Optional[:class:`int`]
+            Days per turn for correspondence games. Leave blank for live or unlimited games.
+        variant: :class:`Variant`
+            The variant of the games. The default is STANDARD
+        fen: Optional[:class:`str`]
+            Custom initial position (in FEN). Variant must be standard, and the games cannot be rated.
+        message: Optional[:class:`str`]
+            The message sent to the players when their game is created
+        pair_at: Optional[:class:`int`]
+            When to create the games, in milliseconds since the epoch. The default is now
+        start_clocks_at: Optional[:class:`int`]
+            When to start the clocks, in milliseconds since the epoch
+        chunk_size: :class:`int`
+            The maximum number of games in one request. The default is 500
+        client: Optional[:class:`LichessClient`]
+            The client to make the requests with. The shared default client is used if not specified.
+
+        Returns
+        -------
+        List[:class:`BulkPairing`]
+            The bulk pairings created, one per chunk of games
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the arguments are invalid, as with :meth:`Match.create`.
+            If pairs is empty or chunk_size is not between 1 and 500.
+        :class:`HttpError`
+            If the first request fails, for example:
+            If a player token is invalid or the players are already paired.
+            If a rate-limit or server error occurs.
+        :class:`BulkPairingError`
+            If a request fails after some chunks were created. The exception has
+            the bulk pairings created and the pairs that were not paired.
+        """
+        if not pairs:
+            raise BadArgumentError("pairs must have at least one pair of players")
+        if not 1 <= chunk_size <= MAX_PAIRS_PER_REQUEST:
+            raise BadArgumentError(
+                f"chunk_size must be between 1 and {MAX_PAIRS_PER_REQUEST}"
+            )
+        if client is None:
+            client = LichessClient.default()
+        params: Dict[str, Any] = _match_params(
+            rated=rated,
+            clock_limit=clock_limit,
+            clock_increment=clock_increment,
+            days=days,
+            variant=variant,
+            fen=fen,
+            name=None,
+            strict_fen=client.strict_fen,
+        )
+        if message is not None:
+            params["message"] = message
+        if pair_at is not None:
+            params["pairAt"] = pair_at
+        if start_clocks_at is not None:
+            params["startClocksAt"] = start_clocks_at
+        form = {key: _form_value(value) for key, value in params.items()}
+        headers = {"Authorization": f"Bearer {token}"}
+        keep_data = client.keep_data
+        pairings: List[BulkPairingT] = []
+        for start in range(0, len(pairs), chunk_size):
+            players = ",".join(
+                f"{white}:{black}" for white, black in pairs[start : start + chunk_size]
+            )
+            try:
+                pairing = await client.request(
+                    "POST",
+                    "/api/bulk-pairing",
+                    data={**form, "players": players},
+                    headers=headers,
+                    parse=lambda data: cls.from_data(data, keep_data=keep_data),
+                    # a pairing created before a server error would be created twice
+                    idempotent=False,
+                )
+            except Exception as error:
+                if not pairings:
+                    raise
+                raise BulkPairingError(pairings, pairs[start:], error) from error
+            pairings.append(pairing)
+        return pairings
@@ -0,0 +1,692 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Iterable,
+    List,
+    Mapping,
+)
+
+import aiohttp
+
+from .breaker import CircuitBreaker
+from .concurrency import AdaptiveLimiter
+from .exceptions import BadArgumentError, HttpError
+from .jsonlib import JSONBackend, get_json_backend
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .tokens import TokenPool
+from .tracing import RequestHook, RequestTrace, _PhaseTimer, create_trace_config
+from .utils import slotted_dataclass
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Type
+
+    from .journal import MatchJournal
+    from .match import CorrespondenceMatch, Match, RealTimeMatch, UnlimitedMatch
+
+_log = logging.getLogger(__name__)
+
+_JSON_HEADERS: Mapping[str, str] = {"Content-Type": "application/json"}
+
+
+@slotted_dataclass(frozen=True)
+class Timeout:
+    """Time limits of the requests made by a :class:`LichessClient`
+
+    A limit of None means no limit.
+
+    Attributes
+    ----------
+    total: Optional[:class:`float`]
+        The maximum number of seconds for a whole call, including retries and waiting
+        for the rate limiter. The call is cancelled and raises :class:`asyncio.TimeoutError`
+        when it is over. The default is None
+    connect: Optional[:class:`float`]
+        The maximum number of seconds to open a connection to Lichess, for each attempt.
+        The default is 10
+    read: Optional[:class:`float`]
+        The maximum number of seconds to wait for the next part of a response, for each
+        attempt. The default is 30
+    """
+
+    total: float | None = None
+    connect: float | None = 10
+    read: float | None = 30
+
+    def _attempt_timeout(self) -> aiohttp.ClientTimeout:
+        # the total limit is enforced around the retries, not by aiohttp
+        return aiohttp.ClientTimeout(
+            total=None, sock_connect=self.connect, sock_read=self.read
+        )
+
+
+class LichessClient:
+    """Client holding a pooled HTTP session that is reused for all requests to Lichess
+
+    Reusing one session keeps connections to Lichess alive between requests, so only
+    the first request pays for the TCP and TLS handshake.
+
+    The client can be used as an async context manager, which closes the session on exit::
+
+        async with LichessClient() as client:
+            match = await client.create_real_time_match(clock_limit=180)
+
+    When no client is passed to the ``create`` methods of the :class:`MatchInfo`
+    subclasses, a shared client returned by :meth:`LichessClient.default` is used.
+
+    Parameters
+    ----------
+    base_url: :class:`str`
+        The base url of the Lichess server. The default is "https://lichess.org"
+    user_agent: :class:`str`
+        The User-Agent header sent with every request. The default is "play-lichess"
+    limit: :class:`int`
+        The maximum number of simultaneous connections in the pool. The default is 100
+    limit_per_host: :class:`int`
+        The maximum number of simultaneous connections to the same host, or 0 for no limit.
+        The default is 0
+    keepalive_timeout: :class:`float`
+        The number of seconds an idle connection is kept open. The default is 30
+    ttl_dns_cache: Optional[:class:`int`]
+        The number of seconds DNS lookups are cached, or None to cache them forever.
+        The default is 10
+    timeout: Union[:class:`Timeout`, :class:`float`]
+        The time limits of requests, or the total number of seconds for each call.
+        Each call can set its own limits instead. The default is ``Timeout()``
+    warm_up_connections: :class:`int`
+        The number of connections to open when the client is entered as a context manager,
+        so that the first requests do not wait for DNS and the TLS handshake.
+        See :meth:`warm_up`. The default is 0
+    rate_limiter: Optional[:class:`RateLimiter`]
+        The scheduler that spaces out requests and retries rate-limited and failed requests.
+        A :class:`RateLimiter` with the default settings is used if not specified.
+    circuit_breaker: Optional[:class:`CircuitBreaker`]
+        The circuit breaker that makes requests fail fast with :class:`CircuitOpenError`
+        while Lichess is unavailable, if any. Every attempt, including retries, goes through it.
+    concurrency_limiter: Optional[:class:`AdaptiveLimiter`]
+        The limiter that adapts the number of requests in flight to the latency and
+        rate limits of Lichess, if any. Every attempt waits for a slot.
+    keep_data: :class:`bool`
+        Whether created matches keep a reference to the raw response data.
+        Set to False to save memory when many matches are stored. The default is True
+    lazy: :class:`bool`
+        Whether created matches wait until their nested attributes are first accessed
+        to create them from the response data. See :meth:`MatchInfo.from_data`. The default is False
+    json_backend: Union[:class:`JSONBackend`, :class:`str`]
+        The JSON library used to encode requests and decode responses, or its name
+        ("json", "orjson", "msgspec" or "auto"). See :func:`get_json_backend`. The default is "json"
+    hooks: Iterable[Callable[[:class:`RequestTrace`], None]]
+        Functions to call with the :class:`RequestTrace` of every request. See :meth:`add_hook`
+    metrics: Optional[:class:`Metrics`]
+        The registry to record the created matches, errors and latencies in, if any
+    tokens: Optional[Union[:class:`TokenPool`, Iterable[:class:`str`]]]
+        OAuth tokens to spread the requests across, so each request counts toward
+        the rate limit of one account. Requests are anonymous if not specified.
+        A request with its own Authorization header does not use the pool.
+    journal: Optional[:class:`MatchJournal`]
+        A durable journal to record every created match in, if any
+    strict_fen: :class:`bool`
+        Whether FEN strings are checked for a valid position and not only valid syntax
+        before creating a match. See :func:`validate_fen`. The default is False
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If lazy is set without keep_data.
+    """
+
+    _default: ClassVar[LichessClient | None] = None
+
+    def __init__(
+        self,
+        *,
+        base_url: str = "https://lichess.org",
+        user_agent: str = "play-lichess",
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        ttl_dns_cache: int | None = 10,
+        timeout: Timeout | float = Timeout(),
+        warm_up_connections: int = 0,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        concurrency_limiter: AdaptiveLimiter | None = None,
+        keep_data: bool = True,
+        lazy: bool = False,
+        json_backend: JSONBackend | str = "json",
+        hooks: Iterable[RequestHook] = (),
+        metrics: Metrics | None = None,
+        tokens: TokenPool | Iterable[str] | None = None,
+        journal: MatchJournal | None = None,
+        strict_fen: bool = False,
+    ):
+        if lazy and not keep_data:
+            # checked before any challenge is created that could not be returned
+            raise BadArgumentError("lazy cannot be set without keep_data")
+        self.base_url = base_url.rstrip("/")
+        self.user_agent = user_agent
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = _to_timeout(timeout)
+        self.warm_up_connections = warm_up_connections
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.circuit_breaker = circuit_breaker
+        self.concurrency_limiter = concurrency_limiter
+        self.keep_data = keep_data
+        self.lazy = lazy
+        self.json_backend = (
+            get_json_backend(json_backend)
+            if isinstance(json_backend, str)
+            else json_backend
+        )
+        self.metrics = metrics
+        self.token_pool = (
+            tokens
+            if tokens is None or isinstance(tokens, TokenPool)
+            else TokenPool(tokens)
+        )
+        self.journal = journal
+        self.strict_fen = strict_fen
+        self._hooks: List[RequestHook] = list(hooks)
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closer: asyncio.Task[None] | None = None
+
+    @classmethod
+    def default(cls) -> LichessClient:
+        """Get the shared client used when no client is passed to a create method
+
+        Returns
+        -------
+        :class:`LichessClient`
+            The shared client
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client has no open session"""
+        return self._session is None or self._session.closed
+
+    async def __aenter__(self) -> LichessClient:
+        await self._get_session()
+        if self.warm_up_connections:
+            await self.warm_up(self.warm_up_connections)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session and all pooled connections"""
+        if self._closer is not None and self._loop is asyncio.get_running_loop():
+            self._closer.cancel()
+        self._closer = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the open session, creating it if needed
+
+        A session is bound to the event loop it was created in, so a new session
+        is created if the client is used from a different event loop
+        (for example, between calls to :func:`asyncio.run`). The session is closed
+        when :func:`asyncio.run` cancels the remaining tasks of its event loop.
+        """
+        loop = asyncio.get_running_loop()
+        old_session, old_loop = self._session, self._loop
+        if old_session is not None and not old_session.closed:
+            if old_loop is loop:
+                return old_session
+            # the connections belong to another event loop and cannot be reused
+            if old_loop is not None and old_loop.is_running():
+                asyncio.run_coroutine_threadsafe(old_session.close(), old_loop)
+            else:
+                # the loop was stopped without cancelling its tasks
+                old_session.detach()
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        # tracing adds overhead to every request, so it is only set up if needed
+        trace_configs = [create_trace_config()] if self._hooks else None
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": self.user_agent},
+            trace_configs=trace_configs,
+        )
+        self._loop = loop
+        self._closer = loop.create_task(_close_with_loop(self._session))
+        return self._session
+
+    async def warm_up(self, connections: int = 1) -> int:
+        """Open connections to Lichess ahead of the first requests
+
+        This resolves the host name and makes the TLS handshake of each connection,
+        which are then kept in the pool for ``keepalive_timeout`` seconds.
+        Connections that cannot be opened are logged instead of raising.
+
+        Parameters
+        ----------
+        connections: :class:`int`
+            The number of connections to open. The default is 1
+
+        Returns
+        -------
+        :class:`int`
+            The number of connections opened
+        """
+        session = await self._get_session()
+        url = self.base_url + "/"
+        timeout = self.timeout._attempt_timeout()
+
+        async def connect() -> None:
+            async with session.head(url, timeout=timeout) as response:
+                await response.read()
+
+        results = await asyncio.gather(
+            *(connect() for _ in range(connections)), return_exceptions=True
+        )
+        opened = 0
+        for result in results:
+            if isinstance(result, Exception):
+                _log.warning("Could not open a connection to %s: %r", url, result)
+            else:
+                opened += 1
+        return opened
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Register a function to call with the :class:`RequestTrace` of every request
+
+        Requests are only timed while at least one hook is registered.
+        The connection phases (queued, dns, connect and server) are only timed
+        if a hook was registered before the client made its first request.
+        Hooks are called on the event loop, so they should return quickly.
+
+        Parameters
+        ----------
+        hook: Callable[[:class:`RequestTrace`], None]
+            The function to call when a request is done
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Unregister a function registered with :meth:`add_hook`
+
+        Parameters
+        ----------
+        hook: Callable[[:class:`RequestTrace`], None]
+            The function to unregister
+        """
+        self._hooks.remove(hook)
+
+    def _emit(self, trace: RequestTrace) -> None:
+        for hook in tuple(self._hooks):
+            try:
+                hook(trace)
+            except Exception:
+                _log.exception("Error in request hook %r", hook)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        data: Any = None,
+        json: Any = None,
+        headers: Mapping[str, str] | None = None,
+        parse: Callable[[Any], Any] | None = None,
+        timeout: Timeout | float | None = None,
+        idempotent: bool = True,
+    ) -> Any:
+        """Make a request to the Lichess API and return the decoded JSON response
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The HTTP method of the request
+        path: :class:`str`
+            The path of the endpoint, relative to the base url (eg. "/api/challenge/open")
+        data: Any
+            The body of the request
+        json: Any
+            An object to send as the JSON body of the request instead of data
+        headers: Optional[Mapping[:class:`str`, :class:`str`]]
+            Additional headers to send with the request
+        parse: Optional[Callable[[Any], Any]]
+            A function that creates the result from the decoded JSON response.
+            Its time is included in the :class:`RequestTrace` of the request.
+        timeout: Optional[Union[:class:`Timeout`, :class:`float`]]
+            The time limits of the call, or its total number of seconds.
+            The timeout of the client is used if not specified.
+        idempotent: :class:`bool`
+            Whether sending the request again has the same effect as sending it once.
+            Requests that are not idempotent are not retried after a server error,
+            since Lichess may have processed them. The default is True
+
+        Returns
+        -------
+        Any
+            The decoded JSON response, or the result of parse if given
+
+        Raises
+        ------
+        :class:`HttpError`
+            If the response status is not 200 after any retries made by the rate limiter
+        :class:`CircuitOpenError`
+            If the circuit breaker is open
+        :class:`asyncio.TimeoutError`
+            If a time limit is exceeded
+        """
+        endpoint_url = self.base_url + path
+        if json is not None:
+            data = self.json_backend.dumps(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+
+        limits = self.timeout if timeout is None else _to_timeout(timeout, self.timeout)
+        attempt_timeout = limits._attempt_timeout()
+        trace = RequestTrace(method, endpoint_url) if self._hooks else None
+
+        async def send_with(request_headers: Mapping[str, str] | None) -> Any:
+            session = await self._get_session()
+            timer = None
+            download_start = parse_start = 0.0
+            if trace is not None:
+                trace._start_attempt()
+                timer = _PhaseTimer(trace)
+            async with session.request(
+                method,
+                endpoint_url,
+                data=data,
+                headers=request_headers,
+                timeout=attempt_timeout,
+                trace_request_ctx=timer,
+            ) as response:
+                if trace is not None:
+                    trace.status = response.status
+                    download_start = time.perf_counter()
+                body = await response.read()
+                if trace is not None:
+                    trace.download = time.perf_counter() - download_start
+                if response.status != 200:
+                    raise HttpError(
+                        status_code=response.status,
+                        reason=response.reason,
+                        endpoint=endpoint_url,
+                        response_text=body.decode("utf-8", errors="replace"),
+                        retry_after=_parse_retry_after(
+                            response.headers.get("Retry-After")
+                        ),
+                    )
+            if trace is not None:
+                parse_start = time.perf_counter()
+            result = self.json_backend.loads(body)
+            if parse is not None:
+                result = parse(result)
+            if trace is not None:
+                trace.parse = time.perf_counter() - parse_start
+            return result
+
+        token_pool = self.token_pool
+        if token_pool is None or (headers is not None and "Authorization" in headers):
+
+            async def send() -> Any:
+                return await send_with(headers)
+
+        else:
+
+            async def send() -> Any:
+                # try each token at most once before letting the rate limiter pause
+                remaining = len(token_pool)
+                while True:
+                    state = await token_pool.acquire()
+                    try:
+                        return await send_with(
+                            {
+                                **(headers or {}),
+                                "Authorization": f"Bearer {state.token}",
+                            }
+                        )
+                    except HttpError as error:
+                        if error.status_code != 429:
+                            raise
+                        token_pool.rate_limited(state, error.retry_after)
+                        remaining -= 1
+                        if remaining == 0:
+                            raise
+
+        attempt: Callable[[], Awaitable[Any]] = send
+        if self.concurrency_limiter is not None:
+            attempt = functools.partial(self.concurrency_limiter.run, attempt)
+        # an open circuit rejects requests without waiting for a slot
+        if self.circuit_breaker is not None:
+            attempt = functools.partial(self.circuit_breaker.run, attempt)
+
+        call: Awaitable[Any] = self.rate_limiter.run(
+            attempt, retry_server_errors=idempotent
+        )
+        if limits.total is not None:
+            call = self._with_deadline(call, limits.total)
+
+        if trace is None:
+            return await call
+        start = time.perf_counter()
+        try:
+            trace.result = await call
+            return trace.result
+        except BaseException as error:
+            trace.error = error
+            raise
+        finally:
+            trace.total = time.perf_counter() - start
+            self._emit(trace)
+
+    async def _with_deadline(self, call: Awaitable[Any], total: float) -> Any:
+        """Wait for a call, cancelling the pending attempt or wait when the time is up"""
+        limiter = self.concurrency_limiter
+        epoch = limiter._epoch if limiter is not None else 0
+        try:
+            return await asyncio.wait_for(call, total)
+        except asyncio.TimeoutError:
+            # the limiter only saw the attempt in flight being cancelled
+            if limiter is not None:
+                limiter._decrease(epoch)
+            raise
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        data: Any = None,
+        headers: Mapping[str, str] | None = None,
+        on_open: Callable[[], Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Make a request to a streaming endpoint of the Lichess API and yield each decoded line
+
+        Lichess streams newline-delimited JSON and sends empty lines to keep the
+        connection alive, which are skipped. The stream is not retried by the rate limiter.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The HTTP method to use
+        path: :class:`str`
+            The path of the endpoint, starting with a slash
+        data: Any
+            The body of the request
+        headers: Optional[Mapping[:class:`str`, :class:`str`]]
+            Additional headers to send with the request
+        on_open: Optional[Callable[[], Any]]
+            A function to call once the stream is open, before the first line is received
+
+        Yields
+        ------
+        Any
+            The decoded JSON object of each line
+
+        Raises
+        ------
+        :class:`HttpError`
+            If the response status is not 200
+        """
+        session = await self._get_session()
+        endpoint_url = self.base_url + path
+        # streams stay open for as long as there are events to send
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=self.timeout.connect, sock_read=None
+        )
+        async with session.request(
+            method, endpoint_url, data=data, headers=headers, timeout=timeout
+        ) as response:
+            if response.status != 200:
+                body = await response.read()
+                raise HttpError(
+                    status_code=response.status,
+                    reason=response.reason,
+                    endpoint=endpoint_url,
+                    response_text=body.decode("utf-8", errors="replace"),
+                    retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+                )
+            if on_open is not None:
+                on_open()
+            async for line in response.content:
+                if line.strip():
+                    yield self.json_backend.loads(line)
+
+    async def _create_challenge(
+        self,
+        params: Mapping[str, Any],
+        parse: Callable[[Any], Any],
+        *,
+        body: bytes | None = None,
+        timeout: Timeout | float | None = None,
+    ) -> Any:
+        """Create an open challenge, recording it in the metrics and journal
+
+        The request body is encoded from params unless it was already encoded.
+        """
+        if body is None:
+            kwargs: Any = {"json": params}
+        else:
+            kwargs = {"data": body, "headers": _JSON_HEADERS}
+        metrics = self.metrics
+        if metrics is None:
+            match = await self.request(
+                "POST", "/api/challenge/open", parse=parse, timeout=timeout, **kwargs
+            )
+        else:
+            start = metrics._create_started()
+            error = None
+            try:
+                match = await self.request(
+                    "POST",
+                    "/api/challenge/open",
+                    parse=parse,
+                    timeout=timeout,
+                    **kwargs,
+                )
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                metrics._create_finished(params, start, error)
+        if self.journal is not None:
+            # the challenge exists on Lichess, so it is returned even if it is not recorded
+            try:
+                self.journal.record(match)
+            except Exception:
+                _log.exception("Could not record %r in the journal", match)
+        return match
+
+    async def create_match(self, **kwargs: Any) -> Match:
+        """Start a match that two players can join using this client
+
+        Accepts the same arguments as :meth:`Match.create`
+        """
+        from .match import Match
+
+        return await Match.create(client=self, **kwargs)
+
+    async def create_real_time_match(self, **kwargs: Any) -> RealTimeMatch:
+        """Start a real-time match that two players can join using this client
+
+        Accepts the same arguments as :meth:`RealTimeMatch.create`
+        """
+        from .match import RealTimeMatch
+
+        return await RealTimeMatch.create(client=self, **kwargs)
+
+    async def create_correspondence_match(self, **kwargs: Any) -> CorrespondenceMatch:
+        """Start a correspondence match that two players can join using this client
+
+        Accepts the same arguments as :meth:`CorrespondenceMatch.create`
+        """
+        from .match import CorrespondenceMatch
+
+        return await CorrespondenceMatch.create(client=self, **kwargs)
+
+    async def create_unlimited_match(self, **kwargs: Any) -> UnlimitedMatch:
+        """Start an unlimited match that two players can join using this client
+
+        Accepts the same arguments as :meth:`UnlimitedMatch.create`
+        """
+        from .match import UnlimitedMatch
+
+        return await UnlimitedMatch.create(client=self, **kwargs)
+
+
+async def _close_with_loop(session: aiohttp.ClientSession) -> None:
+    """Wait until cancelled, then close a session
+
+    :func:`asyncio.run` cancels the pending tasks before closing its event loop,
+    so a session that was not closed explicitly is closed with its loop.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Get the number of seconds from a Retry-After header, if it is given in seconds"""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def _to_timeout(timeout: Timeout | float, default: Timeout | None = None) -> Timeout:
+    """Get the :class:`Timeout` of a timeout given as a number of seconds or a :class:`Timeout`"""
+    if isinstance(timeout, Timeout):
+        return timeout
+    if default is None:
+        return Timeout(total=timeout)
+    return Timeout(total=timeout, connect=default.connect, read=default.read)
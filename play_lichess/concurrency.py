@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, TypeVar
+
+from .exceptions import BadArgumentError, HttpError
+
+T = TypeVar("T")
+
+_SUCCESS = "success"
+_OVERLOAD = "overload"
+_OTHER = "other"
+
+# how fast the baseline latency follows a lasting rise in latency
+_BASELINE_DRIFT = 0.01
+# a rise in latency smaller than this many seconds is noise, not a spike
+_LATENCY_NOISE = 0.01
+
+
+def _is_overload(error: BaseException) -> bool:
+    """Whether an error means that Lichess is receiving too many requests"""
+    if isinstance(error, HttpError):
+        return error.status_code == 429
+    return isinstance(error, asyncio.TimeoutError)
+
+
+class AdaptiveLimiter:
+    """Limit of requests in flight that adapts to the latency and errors observed (AIMD)
+
+    - While the latency stays close to the lowest latency seen, the limit grows by
+      ``increase`` each time a full limit of requests succeeds (additive increase),
+      as long as the requests use the whole limit.
+    - After a 429 response, a timeout, or a smoothed latency more than ``latency_tolerance``
+      times the lowest latency, the limit is multiplied by ``backoff`` (multiplicative
+      decrease). Requests that were already in flight do not cut the limit again.
+      A call of the client that exceeds its total :class:`Timeout` counts as a timeout.
+
+    A limiter can be given to a :class:`LichessClient`, where every request waits for a
+    slot, or to :meth:`MatchInfo.create_many` for one batch::
+
+        limiter = AdaptiveLimiter(initial=5, max_limit=50)
+        client = LichessClient(concurrency_limiter=limiter)
+        results = await RealTimeMatch.create_many(params, concurrency=limiter, client=client)
+        print(limiter.limit)
+
+    Parameters
+    ----------
+    initial: :class:`int`
+        The limit to start with. The default is 10
+    min_limit: :class:`int`
+        The lowest limit. The default is 1
+    max_limit: :class:`int`
+        The highest limit. The default is 100
+    increase: :class:`float`
+        The amount the limit grows by for each full limit of successful requests. The default is 1
+    backoff: :class:`float`
+        The factor the limit is multiplied by when Lichess is overloaded. The default is 0.5
+    latency_tolerance: :class:`float`
+        How many times the lowest latency the smoothed latency can reach before
+        the limit is cut. The default is 2
+    smoothing: :class:`float`
+        The weight of each new latency in the smoothed latency, between 0 and 1. The default is 0.2
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If the limits are not 1 <= min_limit <= initial <= max_limit,
+        or backoff is not between 0 and 1, or smoothing is not between 0 and 1.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2,
+        smoothing: float = 0.2,
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise BadArgumentError(
+                "The limits must be 1 <= min_limit <= initial <= max_limit"
+            )
+        if not 0 < backoff < 1:
+            raise BadArgumentError("backoff must be between 0 and 1")
+        if not 0 < smoothing <= 1:
+            raise BadArgumentError("smoothing must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.latency: float | None = None
+        self.baseline: float | None = None
+        self.decreases = 0
+        self._limit = float(initial)
+        self._epoch = 0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+
+    def __repr__(self) -> str:
+        return f"<AdaptiveLimiter limit={self.limit} in_flight={self.in_flight}>"
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight"""
+        return int(self._limit)
+
+    @property
+    def waiting(self) -> int:
+        """The number of requests waiting for a slot"""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the state of the limiter as a dictionary, for monitoring
+
+        Returns
+        -------
+        :class:`dict`
+            The limit, the requests in flight and waiting, the smoothed and lowest
+            latencies in seconds, and the number of times the limit was cut
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "latency": self.latency,
+            "baseline": self.baseline,
+            "decreases": self.decreases,
+        }
+
+    def _wake(self) -> None:
+        waiters = self._waiters
+        while waiters and self.in_flight < self.limit:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                # the slot is taken on behalf of the waiter
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def _acquire(self) -> int:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return self._epoch
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # cancelled after being given a slot, so it goes to the next waiter
+                self.in_flight -= 1
+                self._wake()
+            raise
+        return self._epoch
+
+    def _decrease(self, epoch: int) -> None:
+        if epoch != self._epoch:
+            # the limit was already cut since the request started
+            return
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self._epoch += 1
+        self.decreases += 1
+
+    def _observe(self, latency: float, epoch: int, saturated: bool) -> None:
+        smoothed = self.latency
+        smoothed = (
+            latency
+            if smoothed is None
+            else smoothed + self.smoothing * (latency - smoothed)
+        )
+        self.latency = smoothed
+        baseline = self.baseline
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += _BASELINE_DRIFT * (latency - baseline)
+        self.baseline = baseline
+        if smoothed > self.latency_tolerance * baseline + _LATENCY_NOISE:
+            self._decrease(epoch)
+        elif saturated:
+            self._limit = min(
+                float(self.max_limit), self._limit + self.increase / self._limit
+            )
+
+    async def run(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Send a request once there is a slot, and adapt the limit to its outcome
+
+        Parameters
+        ----------
+        send: Callable[[], Awaitable[T]]
+            A function that sends the request
+
+        Returns
+        -------
+        T
+            The result of the request
+        """
+        epoch = await self._acquire()
+        # the limit only grows if it is what holds the requests back
+        saturated = self.in_flight >= self.limit
+        outcome = _OTHER
+        start = time.perf_counter()
+        try:
+            result = await send()
+            outcome = _SUCCESS
+            return result
+        except BaseException as error:
+            if _is_overload(error):
+                outcome = _OVERLOAD
+            raise
+        finally:
+            self.in_flight -= 1
+            if outcome == _SUCCESS:
+                self._observe(time.perf_counter() - start, epoch, saturated)
+            elif outcome == _OVERLOAD:
+                self._decrease(epoch)
+            self._wake()
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .bulk import BulkPairing
+
 
 class BaseError(RuntimeError):
     """Base exception for exceptions caused by this package"""
@@ -20,12 +25,18 @@ class HttpError(BaseError):
     """Exception caused by requests that were unsuccessful"""
 
     def __init__(
-        self, status_code: int, reason: str | None, endpoint: str, response_text: str
+        self,
+        status_code: int,
+        reason: str | None,
+        endpoint: str,
+        response_text: str,
+        retry_after: float | None = None,
     ):
         self.status_code = status_code
         self.reason = reason
         self.endpoint = endpoint
         self.response_text = response_text
+        self.retry_after = retry_after
 
     @property
     def message(self):
@@ -41,3 +52,42 @@ class BadArgumentError(BaseError):
     @property
     def message(self):
         return self.description
+
+
+class CircuitOpenError(BaseError):
+    """Exception raised instead of sending a request while the circuit breaker is open"""
+
+    def __init__(self, failures: int, retry_after: float):
+        self.failures = failures
+        self.retry_after = retry_after
+
+    @property
+    def message(self):
+        return (
+            f"Lichess is unavailable after {self.failures} consecutive failures, "
+            f"retry in {self.retry_after:.1f} seconds"
+        )
+
+
+class BulkPairingError(BaseError):
+    """Exception raised when a chunk of a bulk pairing fails after other chunks were created
+
+    The games of the created chunks exist on Lichess, so they are kept with the exception.
+    """
+
+    def __init__(
+        self,
+        pairings: Sequence[BulkPairing],
+        unpaired: Sequence[Tuple[str, str]],
+        error: Exception,
+    ):
+        self.pairings: List[BulkPairing] = list(pairings)
+        self.unpaired: List[Tuple[str, str]] = list(unpaired)
+        self.error = error
+
+    @property
+    def message(self):
+        return (
+            f"{len(self.pairings)} bulk pairings were created and "
+            f"{len(self.unpaired)} pairs were not paired: {self.error}"
+        )
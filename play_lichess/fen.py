@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from .exceptions import BadArgumentError
+
+_PIECES = frozenset("pnbrqkPNBRQK")
+# standard castling rights, and the rook files of X-FEN and Shredder-FEN (Chess960)
+_CASTLING = frozenset("KQkqABCDEFGHabcdefgh")
+_FILES = frozenset("abcdefgh")
+
+
+def _check_board(board: str, strict: bool) -> None:
+    rank = 0
+    squares = 0
+    white_kings = 0
+    black_kings = 0
+    for char in board:
+        if char == "/":
+            if squares != 8:
+                raise BadArgumentError(
+                    f"Rank {8 - rank} of the FEN does not have 8 squares"
+                )
+            rank += 1
+            squares = 0
+        elif char in _PIECES:
+            if strict:
+                if char == "K":
+                    white_kings += 1
+                elif char == "k":
+                    black_kings += 1
+                elif (char == "P" or char == "p") and (rank == 0 or rank == 7):
+                    raise BadArgumentError("Pawns cannot be on the first or last rank")
+            squares += 1
+        elif "1" <= char <= "8":
+            squares += ord(char) - 48
+        else:
+            raise BadArgumentError(f"Invalid character {char!r} in the FEN board")
+        if squares > 8:
+            raise BadArgumentError(
+                f"Rank {8 - rank} of the FEN has more than 8 squares"
+            )
+    if rank != 7 or squares != 8:
+        raise BadArgumentError("The FEN board must have 8 ranks of 8 squares")
+    if strict and (white_kings != 1 or black_kings != 1):
+        raise BadArgumentError("The FEN must have exactly one king of each color")
+
+
+def validate_fen(fen: str, *, strict: bool = False) -> None:
+    """Check the syntax of a FEN string without sending it to Lichess
+
+    The board must have 8 ranks of 8 squares, and any other fields that are present
+    must be valid: the side to move, castling rights, en passant square and the move counters.
+
+    Parameters
+    ----------
+    fen: :class:`str`
+        The FEN string of a position
+    strict: :class:`bool`
+        Whether to also require the side to move, exactly one king of each color,
+        no pawns on the first or last rank, and castling rights with at most two of
+        each color, as KQkq or as the files of the rooks (X-FEN and Shredder-FEN).
+        The default is False
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If the FEN is not valid.
+    """
+    fields = fen.split()
+    if not fields:
+        raise BadArgumentError("The FEN is empty")
+    if len(fields) > 6:
+        raise BadArgumentError("The FEN has more than 6 fields")
+    _check_board(fields[0], strict)
+    if len(fields) < 2:
+        if strict:
+            raise BadArgumentError("The FEN must have the side to move")
+        return
+    if fields[1] != "w" and fields[1] != "b":
+        raise BadArgumentError("The side to move in the FEN must be 'w' or 'b'")
+    if len(fields) > 2:
+        castling = fields[2]
+        if castling != "-":
+            if strict:
+                white = sum(1 for char in castling if char.isupper())
+                if (
+                    not _CASTLING.issuperset(castling)
+                    or len(set(castling)) != len(castling)
+                    or white > 2
+                    or len(castling) - white > 2
+                ):
+                    raise BadArgumentError("Invalid castling rights in the FEN")
+            elif not castling.isascii() or not castling.isalpha():
+                raise BadArgumentError("Invalid castling rights in the FEN")
+    if len(fields) > 3:
+        en_passant = fields[3]
+        if en_passant != "-" and (
+            len(en_passant) != 2
+            or en_passant[0] not in _FILES
+            or en_passant[1] not in "36"
+        ):
+            raise BadArgumentError("Invalid en passant square in the FEN")
+    for counter in fields[4:]:
+        if not counter.isdigit() or not counter.isascii():
+            raise BadArgumentError("The move counters in the FEN must be numbers")
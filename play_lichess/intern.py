@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class InternStats(NamedTuple):
+    """Statistics of an :class:`InternTable`"""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that returned a shared object"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class InternTable(Generic[K, V]):
+    """Table of shared immutable objects, so equal values are only stored once
+
+    The least recently used objects are removed when the table is full.
+
+    Parameters
+    ----------
+    maxsize: Optional[:class:`int`]
+        The maximum number of objects in the table, or None for no limit.
+        Set to 0 to disable interning. The default is 1024
+    """
+
+    def __init__(self, maxsize: int | None = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._objects: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, key: K, create: Callable[[], V]) -> V:
+        """Get the shared object for a key, creating it if it is not in the table
+
+        Parameters
+        ----------
+        key: Hashable
+            The key identifying the value of the object
+        create: Callable[[], V]
+            A function that creates the object if it is not in the table
+
+        Returns
+        -------
+        V
+            The shared object
+        """
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None:
+                self.hits += 1
+                self._objects.move_to_end(key)
+                return obj
+            self.misses += 1
+        obj = create()
+        if self.maxsize == 0:
+            return obj
+        with self._lock:
+            obj = self._objects.setdefault(key, obj)
+            if self.maxsize is not None and len(self._objects) > self.maxsize:
+                self._objects.popitem(last=False)
+        return obj
+
+    def stats(self) -> InternStats:
+        """Get the number of hits and misses and the size of the table"""
+        return InternStats(self.hits, self.misses, len(self._objects), self.maxsize)
+
+    def clear(self) -> None:
+        """Remove all objects from the table and reset the statistics"""
+        with self._lock:
+            self._objects.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Type
+
+from . import match as _match
+from .exceptions import BadArgumentError
+from .serialization import enum_code
+from .types import Variant
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    challenge_id TEXT PRIMARY KEY,
+    name TEXT,
+    variant INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    match_class TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_name ON matches (name);
+CREATE INDEX IF NOT EXISTS matches_variant ON matches (variant, created_at);
+CREATE INDEX IF NOT EXISTS matches_created_at ON matches (created_at);
+"""
+
+_COLUMNS = "match_class, data"
+
+_SYNCHRONOUS = frozenset(("OFF", "NORMAL", "FULL", "EXTRA"))
+
+
+class MatchJournal:
+    """Durable record of created matches in a local SQLite database
+
+    A :class:`LichessClient` with a journal records every match it creates, so a process
+    that restarts knows which challenges it already created without asking Lichess::
+
+        journal = MatchJournal("matches.db")
+        client = LichessClient(journal=journal)
+        ...
+        # after a restart
+        created = journal.load()
+
+    Matches are stored in the format of :meth:`MatchInfo.to_bytes` and indexed by
+    challenge id, name, variant and creation time. The journal can be used as a
+    context manager, which closes it on exit.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the database file, which is created if needed. Use ":memory:" for a
+        journal that is not saved.
+    synchronous: :class:`str`
+        The SQLite synchronous setting. "NORMAL" is durable across crashes of the process,
+        and "FULL" also across power failures. The default is "NORMAL"
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If synchronous is not "OFF", "NORMAL", "FULL" or "EXTRA".
+    """
+
+    def __init__(self, path: str, *, synchronous: str = "NORMAL"):
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS:
+            raise BadArgumentError(
+                'synchronous must be "OFF", "NORMAL", "FULL" or "EXTRA"'
+            )
+        self.path = path
+        # the synchronous API uses the journal from its event loop thread
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(f"PRAGMA synchronous={synchronous}")
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> MatchJournal:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._scalar("SELECT COUNT(*) FROM matches")
+
+    def __contains__(self, challenge_id: object) -> bool:
+        return bool(
+            self._scalar(
+                "SELECT COUNT(*) FROM matches WHERE challenge_id = ?", (challenge_id,)
+            )
+        )
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
+
+    def record(
+        self, match: _match.MatchInfo, *, created_at: float | None = None
+    ) -> None:
+        """Save a created match. A match that was already saved is not changed.
+
+        Parameters
+        ----------
+        match: :class:`MatchInfo`
+            The match to save
+        created_at: Optional[:class:`float`]
+            When the match was created, as a Unix timestamp. The default is now
+        """
+        row = (
+            match.challenge_id,
+            match.name,
+            enum_code(match.variant),
+            time.time() if created_at is None else created_at,
+            type(match).__name__,
+            match.to_bytes(),
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO matches VALUES (?, ?, ?, ?, ?, ?)", row
+            )
+
+    def get(self, challenge_id: str) -> _match.MatchInfo | None:
+        """Get a saved match by its challenge id, if it was saved"""
+        matches = self._select("WHERE challenge_id = ?", (challenge_id,))
+        return matches[0] if matches else None
+
+    def find_by_name(self, name: str) -> List[_match.MatchInfo]:
+        """Get the saved matches with a name, oldest first"""
+        return self._select("WHERE name = ? ORDER BY created_at", (name,))
+
+    def find_by_variant(
+        self, variant: Variant, *, start: float = 0, end: float = float("inf")
+    ) -> List[_match.MatchInfo]:
+        """Get the saved matches of a variant created between two Unix timestamps, oldest first"""
+        return self._select(
+            "WHERE variant = ? AND created_at >= ? AND created_at < ? ORDER BY created_at",
+            (enum_code(variant), start, end),
+        )
+
+    def between(
+        self, start: float = 0, end: float = float("inf")
+    ) -> List[_match.MatchInfo]:
+        """Get the matches created between two Unix timestamps, oldest first
+
+        Parameters
+        ----------
+        start: :class:`float`
+            The earliest creation time, included
+        end: :class:`float`
+            The latest creation time, excluded
+        """
+        return self._select(
+            "WHERE created_at >= ? AND created_at < ? ORDER BY created_at", (start, end)
+        )
+
+    def load(self) -> Dict[str, _match.MatchInfo]:
+        """Get all saved matches by challenge id, in the order they were created
+
+        This rebuilds the state of a process from the journal after a restart.
+        """
+        return {match.challenge_id: match for match in self}
+
+    def __iter__(self) -> Iterator[_match.MatchInfo]:
+        return iter(self._select("ORDER BY created_at"))
+
+    def _scalar(self, sql: str, parameters: tuple = ()) -> Any:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()[0]
+
+    def _select(self, where: str, parameters: tuple = ()) -> List[_match.MatchInfo]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM matches {where}", parameters
+            ).fetchall()
+        return [_match_class(name).from_bytes(data) for name, data in rows]
+
+
+def _match_class(name: str) -> Type[_match.MatchInfo]:
+    cls = getattr(_match, name, None)
+    if isinstance(cls, type) and issubclass(cls, _match.MatchInfo):
+        return cls
+    return _match.MatchInfo
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict
+
+from .exceptions import BadArgumentError
+
+
+class JSONBackend:
+    """Base class for the JSON libraries used to encode requests and decode responses
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the backend
+    """
+
+    name: str = ""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to JSON bytes"""
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes to an object"""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{type(self).__name__} name={self.name!r}>"
+
+
+class StdlibJSONBackend(JSONBackend):
+    """JSON backend using the :mod:`json` module of the standard library"""
+
+    name = "json"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """JSON backend using `orjson <https://github.com/ijl/orjson>`_ (``pip install orjson``)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # type: ignore
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecBackend(JSONBackend):
+    """JSON backend using `msgspec <https://github.com/jcrist/msgspec>`_ (``pip install msgspec``)"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec  # type: ignore
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+_BACKENDS: Dict[str, Callable[[], JSONBackend]] = {
+    "json": StdlibJSONBackend,
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+}
+
+
+def get_json_backend(name: str = "json") -> JSONBackend:
+    """Get a JSON backend by name
+
+    Examples:
+
+    - ``get_json_backend("orjson")``
+    - ``get_json_backend("auto")``
+
+    Parameters
+    ----------
+    name: :class:`str`
+        "json" for the standard library, "orjson" or "msgspec" if installed,
+        or "auto" for the fastest one that is installed. The default is "json"
+
+    Returns
+    -------
+    :class:`JSONBackend`
+        The JSON backend
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If the name is not one of the backends.
+    ImportError
+        If the library of the backend is not installed.
+    """
+    if name == "auto":
+        for backend in ("orjson", "msgspec"):
+            try:
+                return _BACKENDS[backend]()
+            except ImportError:
+                pass
+        return StdlibJSONBackend()
+    try:
+        backend_class = _BACKENDS[name]
+    except KeyError:
+        raise BadArgumentError(
+            f"Unknown JSON backend {name!r}, must be one of: auto, "
+            + ", ".join(_BACKENDS)
+        ) from None
+    return backend_class()
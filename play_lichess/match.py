@@ -1,23 +1,152 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Mapping, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Type,
+    TypeVar,
+)
 
 import aiohttp
 
-from .exceptions import BadArgumentError, HttpError
+from .client import LichessClient, Timeout
+from .concurrency import AdaptiveLimiter
+from .exceptions import BadArgumentError, BaseError
+from .fen import validate_fen
+from .serialization import (
+    KIND_MATCH,
+    Reader,
+    Writer,
+    decode,
+    enum_code,
+    enum_member,
+)
 from .types import Color, TimeControl, TimeMode, User, Variant
+from .utils import slotted_dataclass
 
 MatchInfoT = TypeVar("MatchInfoT", bound="MatchInfo")
 
+# the errors of one match that are reported in its result instead of stopping a batch
+_CREATE_ERRORS = (BaseError, aiohttp.ClientError, asyncio.TimeoutError)
+
 if TYPE_CHECKING:
     from typing import Literal
 
     _NumberOfDays = Literal[1, 2, 3, 5, 7, 10, 14]
 
 
+def _parse_user(data: Mapping[str, Any] | None) -> User | None:
+    return User.from_data(data) if data else None
+
+
+# parsers for the fields of a lazy MatchInfo, which take the "challenge" object
+_LAZY_FIELDS: Dict[str, Callable[[Mapping[str, Any]], Any]] = {
+    "challenger": lambda challenge: _parse_user(challenge["challenger"]),
+    "dest_user": lambda challenge: _parse_user(challenge["destUser"]),
+    "variant": lambda challenge: Variant.find_by_data(challenge["variant"]["key"]),
+    "speed": lambda challenge: TimeMode.find_by_data(challenge["speed"]),
+    "time_control": lambda challenge: TimeControl.from_data(challenge["timeControl"]),
+    "color": lambda challenge: Color.find_by_data(challenge["color"]),
+}
+
+
+_LICHESS_URL = "https://lichess.org/"
+
+_VALID_DAYS = frozenset((1, 2, 3, 5, 7, 10, 14))
+
+
+def _match_params(
+    *,
+    rated: bool,
+    clock_limit: int | None,
+    clock_increment: int | None,
+    days: int | None,
+    variant: Variant,
+    fen: str | None,
+    name: str | None,
+    strict_fen: bool = False,
+) -> Dict[str, Any]:
+    """Check the arguments of a match and get the parameters of the request to create it
+
+    Everything Lichess would reject is checked here, so invalid arguments do not cost a request.
+    """
+    if days and (clock_limit or clock_increment):
+        raise BadArgumentError("days cannot be set with clock_limit or clock_increment")
+    if not days and (clock_limit is None) ^ (clock_increment is None):
+        raise BadArgumentError(
+            "Both clock_limit and clock_increment must be specified or neither"
+        )
+    if clock_limit is not None and clock_increment is not None and not days:
+        if not 0 <= clock_limit <= 10800:
+            raise BadArgumentError("clock_limit must be between 0 and 10800 seconds")
+        if not 0 <= clock_increment <= 180:
+            raise BadArgumentError("clock_increment must be between 0 and 180 seconds")
+        if clock_limit == 0 and clock_increment == 0:
+            raise BadArgumentError("clock_limit and clock_increment cannot both be 0")
+    elif days is not None:
+        if days not in _VALID_DAYS:
+            raise BadArgumentError("days must be 1, 2, 3, 5, 7, 10 or 14")
+    elif rated:
+        raise BadArgumentError("Unlimited games cannot be rated")
+    if fen is not None:
+        if variant != Variant.STANDARD:
+            raise BadArgumentError("fen can only be specified for STANDARD variants")
+        if rated:
+            raise BadArgumentError("fen can only be specified for unrated games")
+        validate_fen(fen, strict=strict_fen)
+
+    params = {
+        "rated": rated,
+        "clock.limit": clock_limit,
+        "clock.increment": clock_increment,
+        "variant": variant.value.data,
+        "days": days,
+        "fen": fen,
+        "name": name,
+    }
+    return {k: v for k, v in params.items() if v is not None}
+
+
 @dataclass
+class CreateResult(Generic[MatchInfoT]):
+    """Class for storing the outcome of one match created by :meth:`MatchInfo.create_many`
+
+    Attributes
+    ----------
+    index: :class:`int`
+        The position of the parameters in the batch
+    params: Mapping[:class:`str`, Any]
+        The parameters the match was created with
+    match: Optional[:class:`MatchInfo`]
+        The created match, if the request was successful
+    error: Optional[:class:`Exception`]
+        The exception raised while creating the match, if the request failed: a :class:`BaseError`,
+        an :class:`aiohttp.ClientError` if Lichess could not be reached,
+        or an :class:`asyncio.TimeoutError` if a time limit was exceeded
+    """
+
+    index: int
+    params: Mapping[str, Any]
+    match: MatchInfoT | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the match was created successfully"""
+        return self.error is None
+
+
+@slotted_dataclass()
 class MatchInfo:
     """Class for storing results about a created match link
 
@@ -68,7 +197,12 @@ class MatchInfo:
 
     @classmethod
     def from_data(
-        cls: Type[MatchInfoT], data: Mapping[str, Any], name: str | None = None
+        cls: Type[MatchInfoT],
+        data: Mapping[str, Any],
+        name: str | None = None,
+        *,
+        keep_data: bool = True,
+        lazy: bool = False,
     ) -> MatchInfoT:
         """Create a :class:`Match` object from a dictionary of data
 
@@ -78,12 +212,38 @@ class MatchInfo:
             A dictionary of data to create the :class:`Match` object from
         name: Optional[:class:`str`]
             The name of the match
+        keep_data: :class:`bool`
+            Whether to keep a reference to the dictionary of data in the object.
+            Set to False to save memory when many matches are stored. The default is True
+        lazy: :class:`bool`
+            Whether to wait until the challenger, dest_user, variant, speed, time_control
+            and color attributes are first accessed to create them from the data.
+            This saves time when only the ids and urls of the match are used. The default is False
 
         Returns
         -------
         :class:`Match`
             A :class:`Match` object with the data from the dictionary
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If lazy is set but keep_data is not.
         """
+        if lazy:
+            if not keep_data:
+                raise BadArgumentError("lazy cannot be set without keep_data")
+            # the lazy fields are left unset and created by __getattr__
+            match = cls.__new__(cls)
+            match.challenge_id = data["challenge"]["id"]
+            match.challenge_url = data["challenge"]["url"]
+            match.status = data["challenge"]["status"]
+            match.rated = data["challenge"]["rated"]
+            match.url_white = data["urlWhite"]
+            match.url_black = data["urlBlack"]
+            match.name = name
+            match._data = data
+            return match
         return cls(
             challenge_id=data["challenge"]["id"],
             challenge_url=data["challenge"]["url"],
@@ -106,9 +266,269 @@ class MatchInfo:
             url_white=data["urlWhite"],
             url_black=data["urlBlack"],
             name=name,
-            _data=data,
+            _data=data if keep_data else None,
         )
 
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # only called for unset slots, which are the fields of a lazy match
+            parse = _LAZY_FIELDS.get(name)
+            if parse is None:
+                raise AttributeError(
+                    f"{type(self).__name__!r} object has no attribute {name!r}"
+                )
+            value = parse(self._data["challenge"])
+            setattr(self, name, value)
+            return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the match as a dictionary of plain values, without the raw response data
+
+        The Enum attributes are given by their Lichess name (eg. "standard" for the variant).
+        """
+        return {
+            "challenge_id": self.challenge_id,
+            "challenge_url": self.challenge_url,
+            "status": self.status,
+            "challenger": self.challenger and self.challenger.to_dict(),
+            "dest_user": self.dest_user and self.dest_user.to_dict(),
+            "variant": self.variant.value.data,
+            "rated": self.rated,
+            "speed": self.speed.value.data,
+            "time_control": self.time_control and self.time_control.to_dict(),
+            "color": self.color.value.data,
+            "url_white": self.url_white,
+            "url_black": self.url_black,
+            "name": self.name,
+        }
+
+    def to_bytes(self) -> bytes:
+        """Encode the match in a compact binary format, without the raw response data
+
+        The format is versioned, and the Enum attributes are stored as small integer codes.
+        This is smaller and faster to decode than pickling the match or parsing the response again.
+
+        Returns
+        -------
+        :class:`bytes`
+            The encoded match, to decode with :meth:`from_bytes`
+        """
+        writer = Writer(KIND_MATCH)
+        url = self.challenge_url
+        url_white, url_black = self.url_white, self.url_black
+        challenger, dest_user = self.challenger, self.dest_user
+        time_control, name = self.time_control, self.name
+        writer.string(self.challenge_id)
+        writer.string(self.status)
+        writer.u8(enum_code(self.variant))
+        writer.u8(enum_code(self.speed))
+        writer.u8(enum_code(self.color))
+        # urls that follow the usual pattern are not stored
+        url_is_usual = url == _LICHESS_URL + self.challenge_id
+        white_is_usual = url_white == url + "?color=white"
+        black_is_usual = url_black == url + "?color=black"
+        writer.u8(
+            bool(self.rated)
+            | (challenger is not None) << 1
+            | (dest_user is not None) << 2
+            | (time_control is not None) << 3
+            | (name is not None) << 4
+            | url_is_usual << 5
+            | (url_white is not None and not white_is_usual) << 6
+            | (url_black is not None and not black_is_usual) << 7
+        )
+        writer.u8(white_is_usual | black_is_usual << 1)
+        if not url_is_usual:
+            writer.string(url)
+        if url_white is not None and not white_is_usual:
+            writer.string(url_white)
+        if url_black is not None and not black_is_usual:
+            writer.string(url_black)
+        if challenger is not None:
+            challenger._write(writer)
+        if dest_user is not None:
+            dest_user._write(writer)
+        if time_control is not None:
+            time_control._write(writer)
+        if name is not None:
+            writer.string(name)
+        return writer.to_bytes()
+
+    @classmethod
+    def from_bytes(cls: Type[MatchInfoT], data: bytes) -> MatchInfoT:
+        """Decode a match encoded by :meth:`to_bytes`
+
+        Parameters
+        ----------
+        data: :class:`bytes`
+            The encoded match
+
+        Returns
+        -------
+        :class:`MatchInfo`
+            An object of this class with the attributes of the encoded match
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the data is not an encoded match of the same format version.
+        """
+        return decode(data, KIND_MATCH, cls._read)
+
+    @classmethod
+    def _read(cls: Type[MatchInfoT], reader: Reader) -> MatchInfoT:
+        challenge_id = reader.string()
+        status = reader.string()
+        variant = enum_member(Variant, reader.u8())
+        speed = enum_member(TimeMode, reader.u8())
+        color = enum_member(Color, reader.u8())
+        flags = reader.u8()
+        usual_urls = reader.u8()
+        url = _LICHESS_URL + challenge_id if flags & 32 else reader.string()
+        if usual_urls & 1:
+            url_white: str | None = url + "?color=white"
+        else:
+            url_white = reader.string() if flags & 64 else None
+        if usual_urls & 2:
+            url_black: str | None = url + "?color=black"
+        else:
+            url_black = reader.string() if flags & 128 else None
+        return cls(
+            challenge_id=challenge_id,
+            challenge_url=url,
+            status=status,
+            challenger=User._read(reader) if flags & 2 else None,
+            dest_user=User._read(reader) if flags & 4 else None,
+            variant=variant,
+            rated=bool(flags & 1),
+            speed=speed,
+            time_control=TimeControl._read(reader) if flags & 8 else None,
+            color=color,
+            url_white=url_white,
+            url_black=url_black,
+            name=reader.string() if flags & 16 else None,
+        )
+
+    @classmethod
+    async def create_many(
+        cls: Type[MatchInfoT],
+        params: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int | AdaptiveLimiter = 10,
+        client: LichessClient | None = None,
+    ) -> List[CreateResult[MatchInfoT]]:
+        """Create many matches, with at most ``concurrency`` requests in flight at once
+
+        Examples:
+
+        - ``await RealTimeMatch.create_many([{"clock_limit": 180}] * 100)``
+        - ``await Match.create_many([{"days": 1, "clock_limit": None, "clock_increment": None}])``
+
+        Parameters
+        ----------
+        params: Iterable[Mapping[:class:`str`, Any]]
+            The keyword arguments to pass to ``create`` for each match
+        concurrency: Union[:class:`int`, :class:`AdaptiveLimiter`]
+            The maximum number of requests in flight at once, or a limiter that adapts it
+            to the latency and rate limits of Lichess, up to its ``max_limit``. The default is 10
+        client: Optional[:class:`LichessClient`]
+            The client to make the requests with. The shared default client is used if not specified.
+
+        Returns
+        -------
+        List[:class:`CreateResult`]
+            The results in the same order as the parameters.
+            A failed request is reported in :attr:`CreateResult.error` instead of raising.
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If concurrency is less than 1.
+        """
+        results = [
+            result
+            async for result in cls.create_as_completed(
+                params, concurrency=concurrency, client=client
+            )
+        ]
+        results.sort(key=lambda result: result.index)
+        return results
+
+    @classmethod
+    async def create_as_completed(
+        cls: Type[MatchInfoT],
+        params: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int | AdaptiveLimiter = 10,
+        client: LichessClient | None = None,
+    ) -> AsyncIterator[CreateResult[MatchInfoT]]:
+        """Create many matches and yield the results in the order they complete
+
+        Accepts the same arguments as :meth:`create_many`.
+        Breaking out of the iteration cancels the requests that are still pending.
+
+        Yields
+        ------
+        :class:`CreateResult`
+            The result of each match, as soon as it is created or fails
+        """
+        limiter = None
+        if isinstance(concurrency, AdaptiveLimiter):
+            worker_count = concurrency.max_limit
+            # the limiter of the client already holds back each request
+            if (
+                client or LichessClient.default()
+            ).concurrency_limiter is not concurrency:
+                limiter = concurrency
+        elif concurrency < 1:
+            raise BadArgumentError("concurrency must be at least 1")
+        else:
+            worker_count = concurrency
+        create: Callable[..., Awaitable[MatchInfoT]] = getattr(
+            cls, "create", cls._create_match
+        )
+        create_one: Callable[..., Awaitable[MatchInfoT]] = create
+        if limiter is not None:
+
+            async def create_limited(**kwargs: Any) -> MatchInfoT:
+                return await limiter.run(lambda: create(**kwargs))
+
+            create_one = create_limited
+
+        jobs = list(enumerate(params))
+        pending = iter(jobs)
+        queue: asyncio.Queue[CreateResult[MatchInfoT] | BaseException] = asyncio.Queue()
+
+        async def worker() -> None:
+            for index, kwargs in pending:
+                try:
+                    if client is None:
+                        match = await create_one(**kwargs)
+                    else:
+                        match = await create_one(**{"client": client, **kwargs})
+                except _CREATE_ERRORS as error:
+                    queue.put_nowait(CreateResult(index, kwargs, error=error))
+                except Exception as error:
+                    queue.put_nowait(error)
+                    return
+                else:
+                    queue.put_nowait(CreateResult(index, kwargs, match=match))
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(min(worker_count, len(jobs)))
+        ]
+        try:
+            for _ in jobs:
+                result = await queue.get()
+                if isinstance(result, BaseException):
+                    raise result
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     @classmethod
     async def _create_match(
         cls: Type[MatchInfoT],
@@ -120,54 +540,40 @@ class MatchInfo:
         variant: Variant = Variant.STANDARD,
         fen: str | None = None,
         name: str | None = None,
+        client: LichessClient | None = None,
+        timeout: Timeout | float | None = None,
     ) -> MatchInfoT:
         """Start a match that two players can join. This method is called by the create methods of the subclasses."""
-        if days and (clock_limit or clock_increment):
-            raise BadArgumentError(
-                "days cannot be set with clock_limit or clock_increment"
-            )
-        if not days and (clock_limit is None) ^ (clock_increment is None):
-            raise BadArgumentError(
-                "Both clock_limit and clock_increment must be specified or neither"
+        if client is None:
+            client = LichessClient.default()
+        try:
+            params = _match_params(
+                rated=rated,
+                clock_limit=clock_limit,
+                clock_increment=clock_increment,
+                days=days,
+                variant=variant,
+                fen=fen,
+                name=name,
+                strict_fen=client.strict_fen,
             )
-        if fen is not None:
-            if variant != Variant.STANDARD:
-                raise BadArgumentError(
-                    "fen can only be specified for STANDARD variants"
-                )
-            if rated:
-                raise BadArgumentError("fen can only be specified for unrated games")
-
-        endpoint_url = "https://lichess.org/api/challenge/open"
-        params = {
-            "rated": rated,
-            "clock.limit": clock_limit,
-            "clock.increment": clock_increment,
-            "variant": variant.value.data,
-            "days": days,
-            "fen": fen,
-            "name": name,
-        }
-        data = json.dumps({k: v for k, v in params.items() if v is not None})
-        headers = {"User-Agent": "play-lichess", "Content-Type": "application/json"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint_url, data=data, headers=headers
-            ) as response:
-                if response.status != 200:
-                    raise HttpError(
-                        status_code=response.status,
-                        reason=response.reason,
-                        endpoint=endpoint_url,
-                        response_text=await response.json(),
-                    )
-                return cls.from_data(await response.json(), name)
+        except BadArgumentError:
+            if client.metrics is not None:
+                client.metrics.bad_arguments += 1
+            raise
+        keep_data, lazy = client.keep_data, client.lazy
+        return await client._create_challenge(
+            params,
+            lambda data: cls.from_data(data, name, keep_data=keep_data, lazy=lazy),
+            timeout=timeout,
+        )
 
 
 class Match(MatchInfo):
     """Subclass of :class:`MatchInfo` for creating matches of any type"""
 
+    __slots__ = ()
+
     @classmethod
     async def create(
         cls: Type["Match"],
@@ -179,6 +585,8 @@ class Match(MatchInfo):
         variant: Variant = Variant.STANDARD,
         fen: str | None = None,
         name: str | None = None,
+        client: LichessClient | None = None,
+        timeout: Timeout | float | None = None,
     ) -> "Match":
         """Start a match that two players can join
 
@@ -203,6 +611,11 @@ class Match(MatchInfo):
             The default position is "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
         name: :class:`str`
             Optional name for the challenge that players will see on the challenge page.
+        client: Optional[:class:`LichessClient`]
+            The client to make the request with. The shared default client is used if not specified.
+        timeout: Optional[Union[:class:`Timeout`, :class:`float`]]
+            The time limits of the request, or its total number of seconds including retries.
+            The timeout of the client is used if not specified.
 
         Returns
         -------
@@ -214,13 +627,16 @@ class Match(MatchInfo):
         :class:`BadArgumentError`
             If days is set and clock_limit or clock_increment is also set.
             If one of clock_limit or clock_increment is set but the other is not.
-        :class:`HttpError`
-            If the HTTP request fails, for example:
             If clock_limit or clock_increment is not in the valid range.
             If clock_limit and clock_increment are both set to 0.
             If days is not in the valid range.
             If rated is set, but there is no time control.
+            If fen is not a valid FEN, or is set for a rated or non-standard game.
+        :class:`HttpError`
+            If the HTTP request fails, for example:
             If a rate-limit or server error occurs.
+        :class:`asyncio.TimeoutError`
+            If a time limit is exceeded.
         """
         return await super()._create_match(
             rated=rated,
@@ -230,12 +646,16 @@ class Match(MatchInfo):
             variant=variant,
             fen=fen,
             name=name,
+            client=client,
+            timeout=timeout,
         )
 
 
 class RealTimeMatch(MatchInfo):
     """Subclass of :class:`MatchInfo` for creating real-time matches"""
 
+    __slots__ = ()
+
     @classmethod
     async def create(
         cls: Type["RealTimeMatch"],
@@ -246,6 +666,8 @@ class RealTimeMatch(MatchInfo):
         variant: Variant = Variant.STANDARD,
         fen: str | None = None,
         name: str | None = None,
+        client: LichessClient | None = None,
+        timeout: Timeout | float | None = None,
     ) -> "RealTimeMatch":
         """Start a real-time match that two players can join
 
@@ -265,6 +687,11 @@ class RealTimeMatch(MatchInfo):
             The default position is "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
         name: :class:`str`
             Optional name for the challenge that players will see on the challenge page.
+        client: Optional[:class:`LichessClient`]
+            The client to make the request with. The shared default client is used if not specified.
+        timeout: Optional[Union[:class:`Timeout`, :class:`float`]]
+            The time limits of the request, or its total number of seconds including retries.
+            The timeout of the client is used if not specified.
 
         Returns
         -------
@@ -275,12 +702,14 @@ class RealTimeMatch(MatchInfo):
         ------
         :class:`BadArgumentError`
             If None is passed to one of clock_limit or clock_increment.
-        :class:`HttpError`
-            If the HTTP request fails, for example:
             If clock_limit or clock_increment is not in the valid range.
             If clock_limit and clock_increment are both set to 0.
-            If rated is set, but there is no time control.
+            If fen is not a valid FEN, or is set for a rated or non-standard game.
+        :class:`HttpError`
+            If the HTTP request fails, for example:
             If a rate-limit or server error occurs.
+        :class:`asyncio.TimeoutError`
+            If a time limit is exceeded.
         """
         return await super()._create_match(
             rated=rated,
@@ -289,12 +718,16 @@ class RealTimeMatch(MatchInfo):
             variant=variant,
             fen=fen,
             name=name,
+            client=client,
+            timeout=timeout,
         )
 
 
 class CorrespondenceMatch(MatchInfo):
     """Subclass of :class:`MatchInfo` for creating correspondence matches"""
 
+    __slots__ = ()
+
     @classmethod
     async def create(
         cls: Type["CorrespondenceMatch"],
@@ -304,6 +737,8 @@ class CorrespondenceMatch(MatchInfo):
         variant: Variant = Variant.STANDARD,
         fen: str | None = None,
         name: str | None = None,
+        client: LichessClient | None = None,
+        timeout: Timeout | float | None = None,
     ) -> "CorrespondenceMatch":
         """Start a correspondence match that two players can join
 
@@ -321,6 +756,11 @@ class CorrespondenceMatch(MatchInfo):
             The default position is "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
         name: :class:`str`
             Optional name for the challenge that players will see on the challenge page.
+        client: Optional[:class:`LichessClient`]
+            The client to make the request with. The shared default client is used if not specified.
+        timeout: Optional[Union[:class:`Timeout`, :class:`float`]]
+            The time limits of the request, or its total number of seconds including retries.
+            The timeout of the client is used if not specified.
 
         Returns
         -------
@@ -329,11 +769,14 @@ class CorrespondenceMatch(MatchInfo):
 
         Raises
         ------
+        :class:`BadArgumentError`
+            If days is not in the valid range.
+            If fen is not a valid FEN, or is set for a rated or non-standard game.
         :class:`HttpError`
             If the HTTP request fails, for example:
-            If days is not in the valid range.
-            If rated is set, but there is no time control.
             If a rate-limit or server error occurs.
+        :class:`asyncio.TimeoutError`
+            If a time limit is exceeded.
         """
         return await super()._create_match(
             rated=rated,
@@ -343,12 +786,16 @@ class CorrespondenceMatch(MatchInfo):
             variant=variant,
             fen=fen,
             name=name,
+            client=client,
+            timeout=timeout,
         )
 
 
 class UnlimitedMatch(MatchInfo):
     """Subclass of :class:`MatchInfo` for creating unlimited matches"""
 
+    __slots__ = ()
+
     @classmethod
     async def create(
         cls: Type["UnlimitedMatch"],
@@ -356,6 +803,8 @@ class UnlimitedMatch(MatchInfo):
         variant: Variant = Variant.STANDARD,
         fen: str | None = None,
         name: str | None = None,
+        client: LichessClient | None = None,
+        timeout: Timeout | float | None = None,
     ) -> "UnlimitedMatch":
         """Start an unlimited match that two players can join
 
@@ -369,6 +818,11 @@ class UnlimitedMatch(MatchInfo):
             The default position is "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
         name: :class:`str`
             Optional name for the challenge that players will see on the challenge page.
+        client: Optional[:class:`LichessClient`]
+            The client to make the request with. The shared default client is used if not specified.
+        timeout: Optional[Union[:class:`Timeout`, :class:`float`]]
+            The time limits of the request, or its total number of seconds including retries.
+            The timeout of the client is used if not specified.
 
         Returns
         -------
@@ -377,9 +831,13 @@ class UnlimitedMatch(MatchInfo):
 
         Raises
         ------
+        :class:`BadArgumentError`
+            If fen is not a valid FEN, or is set for a non-standard game.
         :class:`HttpError`
             If the HTTP request fails, for example:
             If a rate-limit or server error occurs.
+        :class:`asyncio.TimeoutError`
+            If a time limit is exceeded.
         """
         return await super()._create_match(
             rated=False,
@@ -389,4 +847,6 @@ class UnlimitedMatch(MatchInfo):
             variant=variant,
             fen=fen,
             name=name,
+            client=client,
+            timeout=timeout,
         )
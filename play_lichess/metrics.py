@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from .exceptions import HttpError
+from .types import TimeMode
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""The default upper bounds in seconds of the buckets of a :class:`Histogram`"""
+
+# the time modes Lichess assigns from the estimated game duration (limit + 40 * increment)
+_SPEEDS = (
+    (29, TimeMode.ULTRABULLET),
+    (179, TimeMode.BULLET),
+    (479, TimeMode.BLITZ),
+    (1499, TimeMode.RAPID),
+)
+
+
+def _time_mode(params: Mapping[str, Any]) -> TimeMode:
+    """Get the time mode Lichess gives a challenge with the given parameters"""
+    limit = params.get("clock.limit")
+    if limit is None:
+        return TimeMode.CORRESPONDENCE
+    estimate = limit + 40 * params.get("clock.increment", 0)
+    for upper, time_mode in _SPEEDS:
+        if estimate <= upper:
+            return time_mode
+    return TimeMode.CLASSICAL
+
+
+class Histogram:
+    """Histogram counting observed values in fixed buckets
+
+    Parameters
+    ----------
+    buckets: Sequence[:class:`float`]
+        The sorted upper bounds of the buckets. Larger values are counted in a last, unbounded bucket.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Count a value in its bucket"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Get the number of values less than or equal to each upper bound, ending with infinity"""
+        result = []
+        total = 0
+        for upper, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((upper, total))
+        return result
+
+
+class Metrics:
+    """In-process metrics of the matches created by a :class:`LichessClient`
+
+    Pass an instance to the client to record every create call::
+
+        metrics = Metrics()
+        client = LichessClient(metrics=metrics)
+        ...
+        print(metrics.to_prometheus())
+
+    The metrics are plain counters updated on the event loop of the client, without locks,
+    so recording a create call only costs a few dictionary updates.
+
+    Parameters
+    ----------
+    buckets: Sequence[:class:`float`]
+        The upper bounds in seconds of the latency histogram buckets. See :data:`DEFAULT_BUCKETS`
+    namespace: :class:`str`
+        The prefix of the metric names in the Prometheus export. The default is "play_lichess"
+
+    Attributes
+    ----------
+    created: Dict[Tuple[:class:`str`, :class:`str`], :class:`int`]
+        The number of matches created by variant and time mode
+    http_errors: Dict[:class:`int`, :class:`int`]
+        The number of create calls that failed with an :class:`HttpError` by status code
+    errors: Dict[:class:`str`, :class:`int`]
+        The number of create calls that failed with another exception by exception name
+    bad_arguments: :class:`int`
+        The number of create calls rejected with a :class:`BadArgumentError`
+    in_flight: :class:`int`
+        The number of create calls waiting for a response
+    latency: Dict[:class:`str`, :class:`Histogram`]
+        The duration in seconds of create calls by time mode, including retries
+    """
+
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        namespace: str = "play_lichess",
+    ):
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all metrics back to zero"""
+        self.created: Dict[Tuple[str, str], int] = {}
+        self.http_errors: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.bad_arguments = 0
+        self.in_flight = 0
+        self.latency: Dict[str, Histogram] = {}
+
+    def _create_started(self) -> float:
+        self.in_flight += 1
+        return time.perf_counter()
+
+    def _create_finished(
+        self, params: Mapping[str, Any], start: float, error: BaseException | None
+    ) -> None:
+        elapsed = time.perf_counter() - start
+        self.in_flight -= 1
+        time_mode = _time_mode(params).data
+        histogram = self.latency.get(time_mode)
+        if histogram is None:
+            histogram = self.latency[time_mode] = Histogram(self.buckets)
+        histogram.observe(elapsed)
+        if error is None:
+            key = (params.get("variant", "standard"), time_mode)
+            self.created[key] = self.created.get(key, 0) + 1
+        elif isinstance(error, HttpError):
+            status = error.status_code
+            self.http_errors[status] = self.http_errors.get(status, 0) + 1
+        else:
+            name = type(error).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a copy of the metrics as plain dictionaries
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            The metrics, with the histograms as cumulative counts by upper bound
+        """
+        created: Dict[str, Dict[str, int]] = {}
+        for (variant, time_mode), count in list(self.created.items()):
+            created.setdefault(variant, {})[time_mode] = count
+        return {
+            "created": created,
+            "http_errors": dict(self.http_errors),
+            "errors": dict(self.errors),
+            "bad_arguments": self.bad_arguments,
+            "in_flight": self.in_flight,
+            "latency": {
+                time_mode: {
+                    "buckets": dict(histogram.cumulative()),
+                    "sum": histogram.sum,
+                    "count": histogram.count,
+                }
+                for time_mode, histogram in list(self.latency.items())
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Export the metrics in the Prometheus text format
+
+        Returns
+        -------
+        :class:`str`
+            The metrics, ready to be served on a ``/metrics`` endpoint
+        """
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_matches_created_total Matches created by variant and time mode",
+            f"# TYPE {ns}_matches_created_total counter",
+        ]
+        for (variant, time_mode), count in sorted(list(self.created.items())):
+            lines.append(
+                f'{ns}_matches_created_total{{variant="{variant}",time_mode="{time_mode}"}} {count}'
+            )
+        lines += [
+            f"# HELP {ns}_http_errors_total Create calls that failed with an HTTP error by status",
+            f"# TYPE {ns}_http_errors_total counter",
+        ]
+        for status, count in sorted(list(self.http_errors.items())):
+            lines.append(f'{ns}_http_errors_total{{status="{status}"}} {count}')
+        lines += [
+            f"# HELP {ns}_errors_total Create calls that failed with another error by type",
+            f"# TYPE {ns}_errors_total counter",
+        ]
+        for name, count in sorted(list(self.errors.items())):
+            lines.append(f'{ns}_errors_total{{error="{name}"}} {count}')
+        lines += [
+            f"# HELP {ns}_bad_arguments_total Create calls rejected because of invalid arguments",
+            f"# TYPE {ns}_bad_arguments_total counter",
+            f"{ns}_bad_arguments_total {self.bad_arguments}",
+            f"# HELP {ns}_in_flight Create calls waiting for a response",
+            f"# TYPE {ns}_in_flight gauge",
+            f"{ns}_in_flight {self.in_flight}",
+            f"# HELP {ns}_create_duration_seconds Duration of create calls by time mode",
+            f"# TYPE {ns}_create_duration_seconds histogram",
+        ]
+        for time_mode, histogram in sorted(list(self.latency.items())):
+            for upper, count in histogram.cumulative():
+                le = "+Inf" if upper == float("inf") else repr(upper)
+                lines.append(
+                    f'{ns}_create_duration_seconds_bucket{{time_mode="{time_mode}",le="{le}"}} {count}'
+                )
+            lines.append(
+                f'{ns}_create_duration_seconds_sum{{time_mode="{time_mode}"}} {histogram.sum}'
+            )
+            lines.append(
+                f'{ns}_create_duration_seconds_count{{time_mode="{time_mode}"}} {histogram.count}'
+            )
+        return "\n".join(lines) + "\n"
@@ -1,10 +1,50 @@
 from __future__ import annotations
 
-from typing import Any, NamedTuple, Type, TypeVar
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Type, TypeVar
 
 OptionT = TypeVar("OptionT", bound="Option")
 
 
+class _OptionIndex(NamedTuple):
+    """Lookup tables for the members of an :class:`Option` Enum"""
+
+    by_description: Mapping[str, Any]
+    by_data: Mapping[Any, Any]
+    by_key: Mapping[Any, Any]
+    by_description_folded: Mapping[str, Any]
+    by_data_folded: Mapping[Any, Any]
+    by_key_folded: Mapping[Any, Any]
+
+
+_indexes: Dict[type, _OptionIndex] = {}
+
+
+def _fold(key: Any) -> Any:
+    return key.casefold() if isinstance(key, str) else key
+
+
+def _build_index(cls: type) -> _OptionIndex:
+    """Build the lookup tables for an :class:`Option` Enum. This is done once per class."""
+    options = list(cls)  # type: ignore  # must be an Enum
+    # earlier members take precedence if keys are repeated, as with a linear search
+    by_description = {o.description: o for o in reversed(options)}
+    by_data = {o.data: o for o in reversed(options)}
+    by_description_folded = {_fold(o.description): o for o in reversed(options)}
+    by_data_folded = {_fold(o.data): o for o in reversed(options)}
+    # descriptions take precedence over data, as in Option.find
+    index = _OptionIndex(
+        by_description=MappingProxyType(by_description),
+        by_data=MappingProxyType(by_data),
+        by_key=MappingProxyType({**by_data, **by_description}),
+        by_description_folded=MappingProxyType(by_description_folded),
+        by_data_folded=MappingProxyType(by_data_folded),
+        by_key_folded=MappingProxyType({**by_data_folded, **by_description_folded}),
+    )
+    _indexes[cls] = index
+    return index
+
+
 class Option(NamedTuple):
     """Base class for options. All subclasses should inherit from this class and Enum."""
 
@@ -15,7 +55,15 @@ class Option(NamedTuple):
         return self.description
 
     @classmethod
-    def find_by_description(cls: Type[OptionT], description: str) -> OptionT:
+    def _index(cls) -> _OptionIndex:
+        """Get the lookup tables for this Enum, building them on first use"""
+        index = _indexes.get(cls)
+        return index if index is not None else _build_index(cls)
+
+    @classmethod
+    def find_by_description(
+        cls: Type[OptionT], description: str, *, case_sensitive: bool = True
+    ) -> OptionT:
         """Get an option from a description
 
         Examples:
@@ -28,6 +76,8 @@ class Option(NamedTuple):
         ----------
         description: :class:`str`
             The description of the option
+        case_sensitive: :class:`bool`
+            Whether the case of the description must match. The default is True
 
         Returns
         -------
@@ -39,13 +89,19 @@ class Option(NamedTuple):
         ValueError
             If the description is not found
         """
-        for option in cls:  # type: ignore  # must be an Enum
-            if description == option.description:
-                return option
-        raise ValueError("Unknown option")
+        index = cls._index()
+        if case_sensitive:
+            option = index.by_description.get(description)
+        else:
+            option = index.by_description_folded.get(_fold(description))
+        if option is None:
+            raise ValueError("Unknown option")
+        return option
 
     @classmethod
-    def find_by_data(cls: Type[OptionT], data: str) -> OptionT:
+    def find_by_data(
+        cls: Type[OptionT], data: str, *, case_sensitive: bool = True
+    ) -> OptionT:
         """Get an option from its data
 
         Examples:
@@ -58,6 +114,8 @@ class Option(NamedTuple):
         ----------
         data: :class:`str`
             The data of the option
+        case_sensitive: :class:`bool`
+            Whether the case of the data must match. The default is True
 
         Returns
         -------
@@ -69,13 +127,17 @@ class Option(NamedTuple):
         ValueError
             If the option doesn't exist
         """
-        for option in cls:  # type: ignore  # must be an Enum
-            if data == option.data:
-                return option
-        raise ValueError("Unknown option")
+        index = cls._index()
+        if case_sensitive:
+            option = index.by_data.get(data)
+        else:
+            option = index.by_data_folded.get(_fold(data))
+        if option is None:
+            raise ValueError("Unknown option")
+        return option
 
     @classmethod
-    def find(cls: Type[OptionT], key: str) -> OptionT:
+    def find(cls: Type[OptionT], key: str, *, case_sensitive: bool = True) -> OptionT:
         """Get an option from description or data
 
         Examples:
@@ -89,6 +151,8 @@ class Option(NamedTuple):
         ----------
         key: :class:`str`
             The description or data of the option
+        case_sensitive: :class:`bool`
+            Whether the case of the key must match. The default is True
 
         Returns
         -------
@@ -100,7 +164,11 @@ class Option(NamedTuple):
         ValueError
             If the option doesn't exist
         """
-        try:
-            return cls.find_by_description(key)
-        except ValueError:
-            return cls.find_by_data(key)
+        index = cls._index()
+        if case_sensitive:
+            option = index.by_key.get(key)
+        else:
+            option = index.by_key_folded.get(_fold(key))
+        if option is None:
+            raise ValueError("Unknown option")
+        return option
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Hashable, Tuple, Type, TypeVar
+
+from .exceptions import BadArgumentError
+from .match import MatchInfo
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from .client import LichessClient
+
+_log = logging.getLogger(__name__)
+
+MatchInfoT = TypeVar("MatchInfoT", bound=MatchInfo)
+
+_PoolKey = Tuple[type, Tuple[Tuple[str, Hashable], ...]]
+
+
+class _PoolEntry:
+    """The ready matches of one configuration and the task refilling them"""
+
+    def __init__(self, cls: Type[MatchInfo], params: Dict[str, Any]):
+        self.cls = cls
+        self.params = params
+        self.matches: Deque[Tuple[float, MatchInfo]] = deque()
+        self.wanted = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+
+    def discard_expired(self, ttl: float) -> int:
+        """Remove the matches created more than ``ttl`` seconds ago"""
+        expired_before = time.monotonic() - ttl
+        discarded = 0
+        while self.matches and self.matches[0][0] <= expired_before:
+            self.matches.popleft()
+            discarded += 1
+        return discarded
+
+
+class ChallengePool:
+    """Pool of open challenges created ahead of time, so a match link can be handed out immediately
+
+    For each configuration (match class and arguments to its ``create`` method), the pool
+    keeps up to ``size`` open challenges ready and refills them in the background.
+    Challenges older than ``ttl`` seconds are thrown away.
+
+    The pool can be used as an async context manager, which stops the refill tasks on exit::
+
+        async with ChallengePool(size=5) as pool:
+            pool.register(RealTimeMatch, clock_limit=180, clock_increment=2)
+            match = await pool.acquire(RealTimeMatch, clock_limit=180, clock_increment=2)
+
+    Parameters
+    ----------
+    size: :class:`int`
+        The number of challenges to keep ready per configuration. The default is 5
+    ttl: :class:`float`
+        The number of seconds a challenge is kept in the pool. The default is 600
+    client: Optional[:class:`LichessClient`]
+        The client to make the requests with. The shared default client is used if not specified.
+    concurrency: :class:`int`
+        The maximum number of requests in flight when refilling a configuration. The default is 2
+    retry_delay: :class:`float`
+        The number of seconds to wait before refilling again after a request failed. The default is 5
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 5,
+        ttl: float = 600,
+        client: LichessClient | None = None,
+        concurrency: int = 2,
+        retry_delay: float = 5,
+    ):
+        if size < 1:
+            raise BadArgumentError("size must be at least 1")
+        self.size = size
+        self.ttl = ttl
+        self.client = client
+        self.concurrency = concurrency
+        self.retry_delay = retry_delay
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._entries: Dict[_PoolKey, _PoolEntry] = {}
+
+    async def __aenter__(self) -> ChallengePool:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @staticmethod
+    def _key(match_class: type, params: Dict[str, Any]) -> _PoolKey:
+        return (match_class, tuple(sorted(params.items())))
+
+    def _entry(self, cls: Type[MatchInfo], params: Dict[str, Any]) -> _PoolEntry:
+        key = self._key(cls, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _PoolEntry(cls, params)
+            entry.task = asyncio.ensure_future(self._refill(entry))
+        return entry
+
+    def register(self, cls: Type[MatchInfo], **params: Any) -> None:
+        """Start keeping challenges ready for a configuration
+
+        Must be called while the event loop is running.
+        Configurations are also registered the first time they are passed to :meth:`acquire`.
+
+        Parameters
+        ----------
+        cls: Type[:class:`MatchInfo`]
+            The match class to create challenges with (eg. :class:`RealTimeMatch`)
+        **params: Any
+            The arguments to pass to the ``create`` method of the class
+        """
+        self._entry(cls, params)
+
+    def available(self, cls: Type[MatchInfo], **params: Any) -> int:
+        """Get the number of challenges ready for a configuration
+
+        Parameters
+        ----------
+        cls: Type[:class:`MatchInfo`]
+            The match class of the configuration
+        **params: Any
+            The arguments of the configuration
+
+        Returns
+        -------
+        :class:`int`
+            The number of challenges that have not expired
+        """
+        entry = self._entries.get(self._key(cls, params))
+        if entry is None:
+            return 0
+        self.expired += entry.discard_expired(self.ttl)
+        return len(entry.matches)
+
+    async def acquire(self, cls: Type[MatchInfoT], **params: Any) -> MatchInfoT:
+        """Get a challenge from the pool, or create one if the pool is empty
+
+        Parameters
+        ----------
+        cls: Type[:class:`MatchInfo`]
+            The match class to create challenges with (eg. :class:`RealTimeMatch`)
+        **params: Any
+            The arguments to pass to the ``create`` method of the class
+
+        Returns
+        -------
+        :class:`MatchInfo`
+            A challenge of the given class that has not been handed out before
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the pool is empty and the arguments are invalid.
+        :class:`HttpError`
+            If the pool is empty and the HTTP request fails.
+        """
+        entry = self._entry(cls, params)
+        self.expired += entry.discard_expired(self.ttl)
+        entry.wanted.set()
+        if entry.matches:
+            self.hits += 1
+            return entry.matches.popleft()[1]  # type: ignore  # created by cls
+        self.misses += 1
+        create = getattr(cls, "create", cls._create_match)
+        if self.client is None:
+            return await create(**params)
+        return await create(**{"client": self.client, **params})
+
+    async def _refill(self, entry: _PoolEntry) -> None:
+        while True:
+            self.expired += entry.discard_expired(self.ttl)
+            missing = self.size - len(entry.matches)
+            if missing > 0:
+                try:
+                    results = await entry.cls.create_many(
+                        [entry.params] * missing,
+                        concurrency=self.concurrency,
+                        client=self.client,
+                    )
+                except Exception:
+                    # keep refilling, since the error may not happen again
+                    _log.exception("Error refilling the pool of %s", entry.cls.__name__)
+                    await asyncio.sleep(self.retry_delay)
+                    continue
+                created_at = time.monotonic()
+                entry.matches.extend(
+                    (created_at, result.match)
+                    for result in results
+                    if result.match is not None
+                )
+                errors = [result.error for result in results if result.error]
+                if any(isinstance(error, BadArgumentError) for error in errors):
+                    # the arguments are invalid, so refilling can never succeed
+                    return
+                if errors:
+                    await asyncio.sleep(self.retry_delay)
+                continue
+            # sleep until a challenge is taken or the oldest challenge expires
+            entry.wanted.clear()
+            timeout = entry.matches[0][0] + self.ttl - time.monotonic()
+            try:
+                await asyncio.wait_for(entry.wanted.wait(), max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self) -> None:
+        """Stop refilling the pool and discard the challenges that are ready"""
+        tasks = [entry.task for entry in self._entries.values() if entry.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._entries.clear()
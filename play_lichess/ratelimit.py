@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from .exceptions import BadArgumentError, HttpError
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Token bucket that limits how often an action can happen
+
+    Tokens are added at ``rate`` per second, up to ``capacity``.
+    Each call to :meth:`acquire` takes one token, waiting for it if the bucket is empty.
+
+    Parameters
+    ----------
+    rate: :class:`float`
+        The number of tokens added per second
+    capacity: Optional[:class:`float`]
+        The maximum number of tokens in the bucket, which is the largest burst allowed.
+        The default is the same as the rate, with a minimum of 1
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise BadArgumentError("rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available"""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take a token from the bucket, waiting until one is available"""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return
+        # the token is reserved, so concurrent callers queue up behind this one
+        try:
+            await asyncio.sleep(-self._tokens / self.rate)
+        except asyncio.CancelledError:
+            self._tokens += 1
+            raise
+
+
+class RateLimiter:
+    """Scheduler that every request made by a :class:`LichessClient` goes through
+
+    - Requests are spaced out by a :class:`TokenBucket` if ``rate`` is set.
+    - When a request is rate-limited (status 429), all requests are paused for
+      ``cooldown`` seconds, as requested by the Lichess API, and the request is retried.
+    - When a request fails with a server error (status 5xx), it is retried after an
+      exponential backoff with random jitter.
+
+    Parameters
+    ----------
+    rate: Optional[:class:`float`]
+        The maximum number of requests per second. Not limited by default.
+    burst: Optional[:class:`float`]
+        The maximum number of requests that can be sent at once when ``rate`` is set.
+        The default is the same as the rate.
+    cooldown: :class:`float`
+        The number of seconds to pause all requests after a 429 response,
+        unless the response has a Retry-After header. The default is 60
+    max_retries: :class:`int`
+        The maximum number of times a request is retried. The default is 3
+    backoff_base: :class:`float`
+        The maximum delay in seconds before the first retry of a server error.
+        The maximum delay doubles with every retry. The default is 0.5
+    backoff_max: :class:`float`
+        The maximum delay in seconds before retrying a server error. The default is 30
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float | None = None,
+        burst: float | None = None,
+        cooldown: float = 60,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+    ):
+        if max_retries < 0:
+            raise BadArgumentError("max_retries cannot be negative")
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.cooldown = cooldown
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._resume_at = 0.0
+
+    @property
+    def paused(self) -> bool:
+        """Whether requests are paused after a 429 response"""
+        return time.monotonic() < self._resume_at
+
+    def pause(self, seconds: float) -> None:
+        """Pause all requests for a number of seconds
+
+        Parameters
+        ----------
+        seconds: :class:`float`
+            The number of seconds to pause for
+        """
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def backoff(self, attempt: int) -> float:
+        """Get the delay before retrying a server error
+
+        Parameters
+        ----------
+        attempt: :class:`int`
+            The number of retries already made
+
+        Returns
+        -------
+        :class:`float`
+            A random delay between 0 and the exponential backoff for the attempt
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def _wait_for_resume(self) -> None:
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def run(
+        self, send: Callable[[], Awaitable[T]], *, retry_server_errors: bool = True
+    ) -> T:
+        """Send a request, waiting for the rate limit and retrying if needed
+
+        Parameters
+        ----------
+        send: Callable[[], Awaitable[T]]
+            A function that sends the request, raising :class:`HttpError` if it fails
+        retry_server_errors: :class:`bool`
+            Whether to retry the request after a server error. Requests that are not
+            idempotent may have been processed before the error, so they are only
+            retried after a 429 response. The default is True
+
+        Returns
+        -------
+        T
+            The result of the request
+
+        Raises
+        ------
+        :class:`HttpError`
+            If the request fails with a status that is not retried,
+            or if it still fails after ``max_retries`` retries.
+        """
+        attempt = 0
+        while True:
+            await self._wait_for_resume()
+            if self.bucket is not None:
+                await self.bucket.acquire()
+                # another request may have been rate-limited while waiting for a token
+                await self._wait_for_resume()
+            try:
+                return await send()
+            except HttpError as error:
+                if attempt >= self.max_retries:
+                    raise
+                if error.status_code == 429:
+                    self.pause(error.retry_after or self.cooldown)
+                elif retry_server_errors and 500 <= error.status_code < 600:
+                    await asyncio.sleep(self.backoff(attempt))
+                else:
+                    raise
+                attempt += 1
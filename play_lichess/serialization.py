@@ -0,0 +1,157 @@
+"""Compact binary format of :class:`MatchInfo`, :class:`User` and :class:`TimeControl`
+
+Every encoded object starts with the format version and the kind of object, so data
+written by another version is rejected instead of being decoded wrong. Enum members are
+encoded as their position in the Enum, so new members must only be added at the end.
+
+Strings are prefixed with their length in one byte, or in five bytes if they are 255 bytes
+or longer. Optional values are only written if they are set, as listed in a byte of flags.
+"""
+
+from __future__ import annotations
+
+import struct
+from enum import Enum
+from typing import Callable, Dict, Tuple, Type, TypeVar
+
+from .exceptions import BadArgumentError
+
+FORMAT_VERSION = 1
+"""The version of the binary format written by ``to_bytes``"""
+
+KIND_TIME_CONTROL = 1
+KIND_USER = 2
+KIND_MATCH = 3
+
+EnumT = TypeVar("EnumT", bound=Enum)
+T = TypeVar("T")
+
+_HEADER = struct.Struct("<BB")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+_members: Dict[type, Tuple[Enum, ...]] = {}
+_codes: Dict[type, Dict[Enum, int]] = {}
+
+
+def enum_code(member: Enum) -> int:
+    """Get the code of an Enum member, which is its position in the Enum"""
+    cls = type(member)
+    codes = _codes.get(cls)
+    if codes is None:
+        codes = _codes[cls] = {m: i for i, m in enumerate(cls)}
+    return codes[member]
+
+
+def enum_member(cls: Type[EnumT], code: int) -> EnumT:
+    """Get the Enum member with a code returned by :func:`enum_code`"""
+    members = _members.get(cls)
+    if members is None:
+        members = _members[cls] = tuple(cls)
+    try:
+        return members[code]  # type: ignore  # members of cls
+    except IndexError:
+        raise BadArgumentError(f"Unknown {cls.__name__} code {code}") from None
+
+
+class Writer:
+    """Buffer that values are appended to in the binary format"""
+
+    __slots__ = ("buffer",)
+
+    def __init__(self, kind: int):
+        self.buffer = bytearray(_HEADER.pack(FORMAT_VERSION, kind))
+
+    def u8(self, value: int) -> None:
+        self.buffer += _U8.pack(value)
+
+    def u16(self, value: int) -> None:
+        self.buffer += _U16.pack(value)
+
+    def u32(self, value: int) -> None:
+        self.buffer += _U32.pack(value)
+
+    def string(self, value: str) -> None:
+        encoded = value.encode()
+        if len(encoded) < 255:
+            self.buffer += _U8.pack(len(encoded))
+        else:
+            self.buffer += _U8.pack(255) + _U32.pack(len(encoded))
+        self.buffer += encoded
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.buffer)
+
+
+class Reader:
+    """Cursor over data written by a :class:`Writer`
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If the data was written by another version of the format or for another kind of object.
+    """
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes, kind: int):
+        self.data = data
+        if len(data) < _HEADER.size:
+            raise BadArgumentError("The data is too short")
+        version, data_kind = _HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise BadArgumentError(f"Unsupported format version {version}")
+        if data_kind != kind:
+            raise BadArgumentError(f"Expected object kind {kind}, got {data_kind}")
+        self.pos = _HEADER.size
+
+    def u8(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def u16(self) -> int:
+        (value,) = _U16.unpack_from(self.data, self.pos)
+        self.pos += 2
+        return value
+
+    def u32(self) -> int:
+        (value,) = _U32.unpack_from(self.data, self.pos)
+        self.pos += 4
+        return value
+
+    def string(self) -> str:
+        length = self.u8()
+        if length == 255:
+            length = self.u32()
+        start = self.pos
+        self.pos += length
+        return self.data[start : self.pos].decode()
+
+
+def decode(data: bytes, kind: int, read: Callable[[Reader], T]) -> T:
+    """Read one object from data written by ``to_bytes``
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The encoded object
+    kind: :class:`int`
+        The kind of object expected
+    read: Callable[[:class:`Reader`], T]
+        The function that reads the fields of the object
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If the data is not a valid encoded object of the expected kind.
+    """
+    reader = Reader(data, kind)
+    try:
+        obj = read(reader)
+    except (IndexError, struct.error, UnicodeDecodeError) as error:
+        raise BadArgumentError("The data is truncated or corrupted") from error
+    if reader.pos != len(data):
+        raise BadArgumentError("Unexpected data after the encoded object")
+    return obj
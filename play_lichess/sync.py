@@ -0,0 +1,246 @@
+"""Synchronous API for code that does not run an event loop
+
+Requests are run on one long-lived event loop in a background thread, which owns a
+:class:`LichessClient`, so synchronous callers also reuse connections::
+
+    from play_lichess.sync import RealTimeMatch
+
+    match = RealTimeMatch.create(clock_limit=180, clock_increment=2)
+
+The functions in this module can be called from any number of threads at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Coroutine,
+    Iterable,
+    List,
+    Mapping,
+    Type,
+    TypeVar,
+)
+
+from . import match as _match
+from .client import LichessClient
+from .exceptions import BadArgumentError
+from .match import CreateResult, MatchInfo
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from .concurrency import AdaptiveLimiter
+
+T = TypeVar("T")
+MatchInfoT = TypeVar("MatchInfoT", bound=MatchInfo)
+
+
+class SyncClient:
+    """Synchronous client running a :class:`LichessClient` on an event loop in a background thread
+
+    The client can be used as a context manager, which closes it on exit::
+
+        with SyncClient() as client:
+            match = client.create_real_time_match(clock_limit=180)
+
+    Parameters
+    ----------
+    **kwargs: Any
+        Arguments to pass to :class:`LichessClient`
+    """
+
+    def __init__(self, **kwargs: Any):
+        self.client = LichessClient(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="play-lichess", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client was closed"""
+        return self._loop.is_closed()
+
+    def __enter__(self) -> SyncClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the client's session and stop the background thread"""
+        if self.closed:
+            return
+        self.run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule a coroutine on the background event loop
+
+        Parameters
+        ----------
+        coro: Coroutine
+            The coroutine to run
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future for the result of the coroutine
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the client was closed.
+        """
+        if self.closed:
+            coro.close()
+            raise BadArgumentError("The client was closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background event loop and wait for its result"""
+        return self.submit(coro).result()
+
+    def submit_create(
+        self, match_class: Type[MatchInfoT], **kwargs: Any
+    ) -> Future[MatchInfoT]:
+        """Start creating a match without waiting for it
+
+        Parameters
+        ----------
+        match_class: Type[:class:`MatchInfo`]
+            The class to create the match with (eg. :class:`play_lichess.RealTimeMatch`)
+        **kwargs: Any
+            Arguments to pass to the ``create`` method of the class
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future for the created match
+        """
+        create = getattr(match_class, "create", match_class._create_match)
+        return self.submit(create(client=self.client, **kwargs))
+
+    def create_many(
+        self,
+        match_class: Type[MatchInfoT],
+        params: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int | AdaptiveLimiter = 10,
+    ) -> List[CreateResult[MatchInfoT]]:
+        """Create many matches at once. See :meth:`MatchInfo.create_many`"""
+        return self.run(
+            match_class.create_many(params, concurrency=concurrency, client=self.client)
+        )
+
+    def create_match(self, **kwargs: Any) -> _match.Match:
+        """Start a match. Accepts the same arguments as :meth:`play_lichess.Match.create`"""
+        return self.run(self.client.create_match(**kwargs))
+
+    def create_real_time_match(self, **kwargs: Any) -> _match.RealTimeMatch:
+        """Start a real-time match. Accepts the same arguments as :meth:`play_lichess.RealTimeMatch.create`"""
+        return self.run(self.client.create_real_time_match(**kwargs))
+
+    def create_correspondence_match(self, **kwargs: Any) -> _match.CorrespondenceMatch:
+        """Start a correspondence match. Accepts the same arguments as :meth:`play_lichess.CorrespondenceMatch.create`"""
+        return self.run(self.client.create_correspondence_match(**kwargs))
+
+    def create_unlimited_match(self, **kwargs: Any) -> _match.UnlimitedMatch:
+        """Start an unlimited match. Accepts the same arguments as :meth:`play_lichess.UnlimitedMatch.create`"""
+        return self.run(self.client.create_unlimited_match(**kwargs))
+
+
+_default_client: SyncClient | None = None
+_default_lock = threading.Lock()
+
+
+def default_client() -> SyncClient:
+    """Get the shared client used when no client is passed to a create method"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None or _default_client.closed:
+            _default_client = SyncClient()
+            atexit.register(_default_client.close)
+        return _default_client
+
+
+class _SyncMatch:
+    """Base class for the synchronous versions of the :class:`MatchInfo` subclasses"""
+
+    _match_class: Type[MatchInfo]
+
+    @classmethod
+    def create_many(
+        cls,
+        params: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int | AdaptiveLimiter = 10,
+        client: SyncClient | None = None,
+    ) -> List[CreateResult[Any]]:
+        """Create many matches at once. See :meth:`MatchInfo.create_many`"""
+        client = client or default_client()
+        return client.create_many(cls._match_class, params, concurrency=concurrency)
+
+
+class Match(_SyncMatch):
+    """Synchronous version of :class:`play_lichess.Match`"""
+
+    _match_class = _match.Match
+
+    @staticmethod
+    def create(*, client: SyncClient | None = None, **kwargs: Any) -> _match.Match:
+        """Start a match. Accepts the same arguments as :meth:`play_lichess.Match.create`"""
+        return (client or default_client()).create_match(**kwargs)
+
+
+class RealTimeMatch(_SyncMatch):
+    """Synchronous version of :class:`play_lichess.RealTimeMatch`"""
+
+    _match_class = _match.RealTimeMatch
+
+    @staticmethod
+    def create(
+        *, client: SyncClient | None = None, **kwargs: Any
+    ) -> _match.RealTimeMatch:
+        """Start a real-time match. Accepts the same arguments as :meth:`play_lichess.RealTimeMatch.create`"""
+        return (client or default_client()).create_real_time_match(**kwargs)
+
+
+class CorrespondenceMatch(_SyncMatch):
+    """Synchronous version of :class:`play_lichess.CorrespondenceMatch`"""
+
+    _match_class = _match.CorrespondenceMatch
+
+    @staticmethod
+    def create(
+        *, client: SyncClient | None = None, **kwargs: Any
+    ) -> _match.CorrespondenceMatch:
+        """Start a correspondence match. Accepts the same arguments as :meth:`play_lichess.CorrespondenceMatch.create`"""
+        return (client or default_client()).create_correspondence_match(**kwargs)
+
+
+class UnlimitedMatch(_SyncMatch):
+    """Synchronous version of :class:`play_lichess.UnlimitedMatch`"""
+
+    _match_class = _match.UnlimitedMatch
+
+    @staticmethod
+    def create(
+        *, client: SyncClient | None = None, **kwargs: Any
+    ) -> _match.UnlimitedMatch:
+        """Start an unlimited match. Accepts the same arguments as :meth:`play_lichess.UnlimitedMatch.create`"""
+        return (client or default_client()).create_unlimited_match(**kwargs)
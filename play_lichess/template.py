@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, Type, TypeVar
+
+from .client import LichessClient, Timeout
+from .exceptions import BadArgumentError
+from .jsonlib import get_json_backend
+from .match import Match, MatchInfo, _match_params
+from .types import Variant
+
+MatchInfoT = TypeVar("MatchInfoT", bound=MatchInfo)
+
+if TYPE_CHECKING:
+    from .match import _NumberOfDays
+
+
+class MatchTemplate(Generic[MatchInfoT]):
+    """Reusable match configuration that is checked and encoded once
+
+    Creating a match from a template only sends the request, since the arguments
+    were already checked and the request body already encoded::
+
+        template = MatchTemplate(clock_limit=180, clock_increment=2, variant=Variant.ATOMIC)
+        match = await template.create()
+        named_match = await template.create(name="Board 1")
+
+    Parameters
+    ----------
+    rated: :class:`bool`
+        Game is rated and impacts players ratings
+    clock_limit: Optional[:class:`int`]
+        Clock initial time in seconds. Leave blank for a correspondence or unlimited match.
+    clock_increment: Optional[:class:`int`]
+        Clock increment in seconds. Leave blank for a correspondence or unlimited match.
+    days: Optional[:class:`int`]
+        Days per turn for correspondence matches. Leave blank for a live or unlimited match.
+    variant: :class:`Variant`
+        The variant of the match. The default is STANDARD
+    fen: :class:`str`
+        Custom initial position (in FEN). Variant must be standard, and the game cannot be rated.
+    name: :class:`str`
+        Optional name for the challenge that players will see on the challenge page.
+    client: Optional[:class:`LichessClient`]
+        The client to make the requests with. The shared default client is used if not specified.
+    match_class: Type[:class:`MatchInfo`]
+        The class of the created matches. The default is :class:`Match`
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If the arguments are invalid, as with :meth:`Match.create`.
+    """
+
+    def __init__(
+        self,
+        *,
+        rated: bool = False,
+        clock_limit: int | None = 300,
+        clock_increment: int | None = 0,
+        days: _NumberOfDays | None = None,
+        variant: Variant = Variant.STANDARD,
+        fen: str | None = None,
+        name: str | None = None,
+        client: LichessClient | None = None,
+        match_class: Type[MatchInfoT] = Match,  # type: ignore  # default for MatchInfoT
+    ):
+        try:
+            self.params = _match_params(
+                rated=rated,
+                clock_limit=clock_limit,
+                clock_increment=clock_increment,
+                days=days,
+                variant=variant,
+                fen=fen,
+                name=name,
+                strict_fen=client.strict_fen if client is not None else False,
+            )
+        except BadArgumentError:
+            if client is not None and client.metrics is not None:
+                client.metrics.bad_arguments += 1
+            raise
+        self.name = name
+        self.client = client
+        self.match_class = match_class
+        backend = client.json_backend if client is not None else get_json_backend()
+        self._encode = backend.dumps
+        self._body = backend.dumps(self.params)
+        # the body without the name and closing brace, to append another name to
+        self._body_prefix = backend.dumps(
+            {k: v for k, v in self.params.items() if k != "name"}
+        )[:-1]
+
+    def __repr__(self):
+        return f"<MatchTemplate match_class={self.match_class.__name__} params={self.params!r}>"
+
+    def _body_with_name(self, name: str) -> bytes:
+        return self._body_prefix + b',"name":' + self._encode(name) + b"}"
+
+    async def create(
+        self,
+        *,
+        name: str | None = None,
+        client: LichessClient | None = None,
+        timeout: Timeout | float | None = None,
+    ) -> MatchInfoT:
+        """Start a match from the template
+
+        Parameters
+        ----------
+        name: Optional[:class:`str`]
+            A name to use instead of the name of the template
+        client: Optional[:class:`LichessClient`]
+            A client to use instead of the client of the template
+        timeout: Optional[Union[:class:`Timeout`, :class:`float`]]
+            The time limits of the request, or its total number of seconds including retries.
+            The timeout of the client is used if not specified.
+
+        Returns
+        -------
+        :class:`MatchInfo`
+            An object of the template's match class with the data from the API
+
+        Raises
+        ------
+        :class:`HttpError`
+            If the HTTP request fails.
+        :class:`asyncio.TimeoutError`
+            If a time limit is exceeded.
+        """
+        if name is None:
+            name = self.name
+            body = self._body
+        else:
+            body = self._body_with_name(name)
+        client = client or self.client or LichessClient.default()
+        match_class, keep_data, lazy = self.match_class, client.keep_data, client.lazy
+        return await client._create_challenge(
+            self.params,
+            lambda data: match_class.from_data(
+                data, name, keep_data=keep_data, lazy=lazy
+            ),
+            body=body,
+            timeout=timeout,
+        )
@@ -0,0 +1,339 @@
+"""Local stand-in for the Lichess API, for tests and benchmarks
+
+:class:`MockLichessServer` answers ``POST /api/challenge/open`` and ``POST /api/bulk-pairing``
+with the same response shape as Lichess, and can add latency, server errors and rate limiting.
+It also streams games by id (``/api/stream/games/{id}``), with game updates set by
+:meth:`MockLichessServer.update_game`::
+
+    async with MockLichessServer(latency=0.05, error_rate=0.01) as server:
+        async with LichessClient(base_url=server.base_url) as client:
+            match = await RealTimeMatch.create(client=client)
+
+The server can also be run on its own with ``python -m play_lichess.testing --port 8080``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Set, Tuple
+
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Type
+
+_SPEEDS = ((29, "ultraBullet"), (179, "bullet"), (479, "blitz"), (1499, "rapid"))
+_FRACTIONS = {15: "¼", 30: "½", 45: "¾", 90: "1.5"}
+
+
+def _speed(params: Dict[str, Any]) -> str:
+    if "clock.limit" not in params:
+        return "correspondence"
+    estimate = params["clock.limit"] + 40 * params["clock.increment"]
+    for limit, speed in _SPEEDS:
+        if estimate <= limit:
+            return speed
+    return "classical"
+
+
+def _time_control(params: Dict[str, Any]) -> Dict[str, Any]:
+    if "clock.limit" in params:
+        limit, increment = params["clock.limit"], params["clock.increment"]
+        minutes = _FRACTIONS.get(limit, str(limit // 60))
+        return {
+            "type": "clock",
+            "limit": limit,
+            "increment": increment,
+            "show": f"{minutes}+{increment}",
+        }
+    if "days" in params:
+        return {"type": "correspondence", "daysPerTurn": params["days"]}
+    return {"type": "unlimited"}
+
+
+def challenge_response(challenge_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Create the response Lichess sends when an open challenge is created
+
+    Parameters
+    ----------
+    challenge_id: :class:`str`
+        The id of the challenge
+    params: Dict[:class:`str`, Any]
+        The parameters of the request to create the challenge
+
+    Returns
+    -------
+    Dict[:class:`str`, Any]
+        The data that :meth:`MatchInfo.from_data` expects
+    """
+    url = f"https://lichess.org/{challenge_id}"
+    return {
+        "challenge": {
+            "id": challenge_id,
+            "url": url,
+            "status": "created",
+            "challenger": None,
+            "destUser": None,
+            "variant": {"key": params.get("variant", "standard")},
+            "rated": params.get("rated", False),
+            "speed": _speed(params),
+            "timeControl": _time_control(params),
+            "color": "random",
+        },
+        "urlWhite": f"{url}?color=white",
+        "urlBlack": f"{url}?color=black",
+    }
+
+
+class MockLichessServer:
+    """Local server answering ``POST /api/challenge/open`` like Lichess does
+
+    The server can be used as an async context manager, which starts and stops it.
+
+    Parameters
+    ----------
+    host: :class:`str`
+        The host to listen on. The default is "127.0.0.1"
+    port: :class:`int`
+        The port to listen on, or 0 for any free port. The default is 0
+    latency: :class:`float`
+        The number of seconds to wait before responding. The default is 0
+    error_rate: :class:`float`
+        The fraction of requests that fail with a 500 status. The default is 0
+    rate_limit_rate: :class:`float`
+        The fraction of requests that fail with a 429 status. The default is 0
+    retry_after: Optional[:class:`float`]
+        The value of the Retry-After header of 429 responses, if any. The default is None
+    seed: Optional[:class:`int`]
+        The seed of the random failures, to make them repeatable. The default is None
+
+    Attributes
+    ----------
+    base_url: :class:`str`
+        The url to pass to :class:`LichessClient` once the server is started
+    requests: List[Dict[:class:`str`, Any]]
+        The parameters of every challenge that was created
+    peers: List[Any]
+        The address of the client connection for every challenge that was created
+    authorizations: List[Optional[:class:`str`]]
+        The Authorization header of every request to create a challenge, including failed ones
+    failures: List[:class:`int`]
+        Statuses to respond with, in order, before responding normally again
+    games: Dict[:class:`str`, Dict[:class:`str`, Any]]
+        The data of the games started with :meth:`update_game`, by id
+    bulk_requests: List[Dict[:class:`str`, Any]]
+        The form of every bulk pairing request
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        error_rate: float = 0,
+        rate_limit_rate: float = 0,
+        retry_after: float | None = None,
+        seed: int | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.base_url = ""
+        self.requests: List[Dict[str, Any]] = []
+        self.peers: List[Any] = []
+        self.authorizations: List[str | None] = []
+        self.failures: List[int] = []
+        self.games: Dict[str, Dict[str, Any]] = {}
+        self.bulk_requests: List[Dict[str, Any]] = []
+        # the ids watched by each open stream, and the games to send to it (None to close it)
+        self._streams: Dict[
+            str, Tuple[Set[str], asyncio.Queue[Dict[str, Any] | None]]
+        ] = {}
+        self._ids = itertools.count()
+        self._random = random.Random(seed)
+        app = web.Application()
+        app.router.add_post("/api/challenge/open", self._open_challenge)
+        app.router.add_post("/api/bulk-pairing", self._bulk_pairing)
+        app.router.add_post("/api/stream/games/{stream_id}", self._stream_games)
+        app.router.add_post("/api/stream/games/{stream_id}/add", self._add_games)
+        self._runner = web.AppRunner(app)
+
+    async def __aenter__(self) -> MockLichessServer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def _failure(self) -> int | None:
+        if self.failures:
+            return self.failures.pop(0)
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+    async def _open_challenge(self, request: web.Request) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.authorizations.append(request.headers.get("Authorization"))
+        status = self._failure()
+        if status == 429 and self.retry_after is not None:
+            return web.Response(
+                status=429,
+                text="Too many requests. Try again later.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        if status is not None:
+            return web.Response(status=status, text="failure")
+        params = await request.json()
+        self.requests.append(params)
+        transport = request.transport
+        self.peers.append(transport and transport.get_extra_info("peername"))
+        challenge_id = f"mock{next(self._ids):04d}"
+        return web.json_response(challenge_response(challenge_id, params))
+
+    async def _bulk_pairing(self, request: web.Request) -> web.Response:
+        authorization = request.headers.get("Authorization", "")
+        if not authorization.startswith("Bearer ") or not authorization[7:].strip():
+            return web.json_response({"error": "No such token"}, status=401)
+        status = self._failure()
+        if status is not None:
+            return web.Response(status=status, text="failure")
+        form = dict(await request.post())
+        pairs = [pair.split(":") for pair in str(form["players"]).split(",")]
+        if not all(white and black for white, black in pairs):
+            return web.json_response({"error": "Invalid player token"}, status=400)
+        self.bulk_requests.append(form)
+        games = []
+        for white, black in pairs:
+            games.append(
+                {"id": f"mock{next(self._ids):04d}", "white": white, "black": black}
+            )
+        data: Dict[str, Any] = {
+            "id": f"bulk{len(self.bulk_requests):04d}",
+            "games": games,
+            "variant": form.get("variant", "standard"),
+            "rated": form.get("rated") == "true",
+            "pairAt": int(str(form.get("pairAt", 0))),
+            "pairedAt": None,
+            "startClocksAt": form.get("startClocksAt")
+            and int(str(form["startClocksAt"])),
+            "scheduledAt": 0,
+        }
+        if "clock.limit" in form:
+            data["clock"] = {
+                "limit": int(str(form["clock.limit"])),
+                "increment": int(str(form["clock.increment"])),
+            }
+        elif "days" in form:
+            data["days"] = int(str(form["days"]))
+        return web.json_response(data)
+
+    def update_game(self, game_id: str, status: str = "started") -> None:
+        """Set the status of a game and send it to the streams watching it
+
+        Parameters
+        ----------
+        game_id: :class:`str`
+            The id of the game, which is the id of the challenge it was created from
+        status: :class:`str`
+            The status name of the game (eg. "started", "mate" or "aborted"). The default is "started"
+        """
+        game = {"id": game_id, "statusName": status}
+        self.games[game_id] = game
+        for ids, queue in self._streams.values():
+            if game_id in ids:
+                queue.put_nowait(game)
+
+    async def _stream_games(self, request: web.Request) -> web.StreamResponse:
+        ids = set(filter(None, (await request.text()).split(",")))
+        queue: asyncio.Queue[Dict[str, Any] | None] = asyncio.Queue()
+        for game_id in ids:
+            if game_id in self.games:
+                queue.put_nowait(self.games[game_id])
+        stream_id = request.match_info["stream_id"]
+        self._streams[stream_id] = (ids, queue)
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        # an empty keep-alive line, as Lichess sends, so the headers are sent right away
+        await response.write(b"\n")
+        try:
+            while True:
+                game = await queue.get()
+                if game is None:
+                    break
+                await response.write(json.dumps(game).encode() + b"\n")
+        finally:
+            del self._streams[stream_id]
+        return response
+
+    async def _add_games(self, request: web.Request) -> web.Response:
+        stream = self._streams.get(request.match_info["stream_id"])
+        if stream is None:
+            return web.Response(status=404, text="Stream not found")
+        ids, queue = stream
+        for game_id in filter(None, (await request.text()).split(",")):
+            ids.add(game_id)
+            if game_id in self.games:
+                queue.put_nowait(self.games[game_id])
+        return web.json_response({"ok": True})
+
+    async def start(self) -> None:
+        """Start listening for requests"""
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        """Stop the server"""
+        for _, queue in self._streams.values():
+            queue.put_nowait(None)
+        await self._runner.cleanup()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the mock server until interrupted, printing its url on the first line"""
+    parser = argparse.ArgumentParser(
+        description="Run a local stand-in for the Lichess API"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0)
+    parser.add_argument("--retry-after", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    async def serve() -> None:
+        async with MockLichessServer(**vars(args)) as server:
+            print(server.base_url, flush=True)
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Iterable, List
+
+from .exceptions import BadArgumentError
+from .utils import slotted_dataclass
+
+STRATEGIES = ("round_robin", "least_recently_limited")
+"""The ways a :class:`TokenPool` can pick the token of the next request"""
+
+
+@slotted_dataclass()
+class TokenState:
+    """Rate-limit state of one token of a :class:`TokenPool`
+
+    Attributes
+    ----------
+    token: :class:`str`
+        The OAuth token
+    requests: :class:`int`
+        The number of requests sent with the token
+    rate_limited: :class:`int`
+        The number of 429 responses to requests sent with the token
+    limited_until: :class:`float`
+        The :func:`time.monotonic` time until which the token is not used
+    last_limited: :class:`float`
+        The :func:`time.monotonic` time of the last 429 response, or 0 if there was none
+    """
+
+    token: str
+    requests: int = 0
+    rate_limited: int = 0
+    limited_until: float = 0.0
+    last_limited: float = 0.0
+
+    def __repr__(self) -> str:
+        # do not show the secret token in logs
+        return (
+            f"TokenState(token='{self.token[:4]}...', requests={self.requests}, "
+            f"rate_limited={self.rate_limited}, limited_until={self.limited_until})"
+        )
+
+    @property
+    def available(self) -> bool:
+        """Whether the token is not cooling down after a 429 response"""
+        return time.monotonic() >= self.limited_until
+
+
+class TokenPool:
+    """Pool of OAuth tokens that a :class:`LichessClient` spreads its requests across
+
+    Lichess rate-limits each account separately, so sending requests with several
+    tokens raises the number of requests that can be made. A token that gets a
+    429 response is skipped until its cooldown is over::
+
+        client = LichessClient(tokens=TokenPool(["lip_a...", "lip_b..."]))
+
+    Parameters
+    ----------
+    tokens: Iterable[:class:`str`]
+        The OAuth tokens
+    strategy: :class:`str`
+        How to pick the token of each request: "round_robin" uses the tokens in turn,
+        and "least_recently_limited" prefers the tokens that were rate-limited longest ago.
+        The default is "round_robin"
+    cooldown: :class:`float`
+        The number of seconds a token is skipped after a 429 response,
+        unless the response has a Retry-After header. The default is 60
+
+    Raises
+    ------
+    :class:`BadArgumentError`
+        If there are no tokens or the strategy is unknown.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        *,
+        strategy: str = "round_robin",
+        cooldown: float = 60,
+    ):
+        self.states: List[TokenState] = [TokenState(token) for token in tokens]
+        if not self.states:
+            raise BadArgumentError("The token pool must have at least one token")
+        if strategy not in STRATEGIES:
+            raise BadArgumentError(
+                f"Unknown strategy {strategy!r}, expected one of {', '.join(STRATEGIES)}"
+            )
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __repr__(self) -> str:
+        return f"<TokenPool tokens={len(self.states)} strategy={self.strategy!r}>"
+
+    @property
+    def available(self) -> int:
+        """The number of tokens that are not cooling down"""
+        now = time.monotonic()
+        return sum(1 for state in self.states if now >= state.limited_until)
+
+    def _pick(self, now: float) -> TokenState | None:
+        states = self.states
+        if self.strategy == "round_robin":
+            for offset in range(len(states)):
+                state = states[(self._next + offset) % len(states)]
+                if now >= state.limited_until:
+                    self._next = (self._next + offset + 1) % len(states)
+                    return state
+            return None
+        available = [state for state in states if now >= state.limited_until]
+        if not available:
+            return None
+        return min(available, key=lambda state: (state.last_limited, state.requests))
+
+    async def acquire(self) -> TokenState:
+        """Get the token to send the next request with, waiting if all tokens are cooling down
+
+        Returns
+        -------
+        :class:`TokenState`
+            The state of the token, to pass to :meth:`rate_limited` if the request gets a 429 response
+        """
+        while True:
+            now = time.monotonic()
+            state = self._pick(now)
+            if state is not None:
+                state.requests += 1
+                return state
+            await asyncio.sleep(min(other.limited_until for other in self.states) - now)
+
+    def rate_limited(self, state: TokenState, retry_after: float | None = None) -> None:
+        """Skip a token until its cooldown is over after a 429 response
+
+        Parameters
+        ----------
+        state: :class:`TokenState`
+            The state returned by :meth:`acquire` for the request
+        retry_after: Optional[:class:`float`]
+            The number of seconds to wait given by the response, if any
+        """
+        now = time.monotonic()
+        state.rate_limited += 1
+        state.last_limited = now
+        seconds = retry_after if retry_after is not None else self.cooldown
+        state.limited_until = max(state.limited_until, now + seconds)
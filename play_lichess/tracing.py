@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import aiohttp
+
+from .utils import slotted_dataclass
+
+
+@slotted_dataclass()
+class RequestTrace:
+    """Timings and outcome of a request made by a :class:`LichessClient`
+
+    Passed to the hooks registered with :meth:`LichessClient.add_hook` once the request is done.
+    The phase timings are in seconds and are for the last attempt of the request.
+    They are None if the phase did not happen (eg. no DNS lookup when a connection is reused).
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The HTTP method of the request
+    url: :class:`str`
+        The url of the request
+    attempts: :class:`int`
+        The number of times the request was sent, including retries
+    status: Optional[:class:`int`]
+        The status of the last response, or None if no response was received
+    queued: Optional[:class:`float`]
+        Time spent waiting for a free connection in the pool
+    dns: Optional[:class:`float`]
+        Time spent resolving the host name
+    connect: Optional[:class:`float`]
+        Time spent opening a new connection, including the DNS lookup and TLS handshake
+    connection_reused: :class:`bool`
+        Whether a pooled connection was reused
+    server: Optional[:class:`float`]
+        Time from sending the request headers to receiving the response headers
+    download: Optional[:class:`float`]
+        Time spent reading the response body
+    parse: Optional[:class:`float`]
+        Time spent decoding the JSON and creating the result (eg. :meth:`MatchInfo.from_data`)
+    total: Optional[:class:`float`]
+        Time of the whole request, including waiting for the rate limiter and retries
+    result: Any
+        The result of the request (eg. the created :class:`MatchInfo`), if successful
+    error: Optional[:class:`BaseException`]
+        The exception raised by the request, if it failed
+    """
+
+    method: str
+    url: str
+    attempts: int = 0
+    status: int | None = None
+    queued: float | None = None
+    dns: float | None = None
+    connect: float | None = None
+    connection_reused: bool = False
+    server: float | None = None
+    download: float | None = None
+    parse: float | None = None
+    total: float | None = None
+    result: Any = None
+    error: BaseException | None = None
+
+    def _start_attempt(self) -> None:
+        self.attempts += 1
+        self.status = None
+        self.queued = None
+        self.dns = None
+        self.connect = None
+        self.connection_reused = False
+        self.server = None
+        self.download = None
+
+
+RequestHook = Callable[[RequestTrace], None]
+
+
+class _PhaseTimer:
+    """The state of a traced attempt, passed to aiohttp as ``trace_request_ctx``"""
+
+    __slots__ = ("trace", "started")
+
+    def __init__(self, trace: RequestTrace):
+        self.trace = trace
+        self.started: dict = {}
+
+
+def _start(phase: str) -> Callable[..., Any]:
+    async def on_start(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        timer = context.trace_request_ctx
+        if timer is not None:
+            timer.started[phase] = time.perf_counter()
+
+    return on_start
+
+
+def _end(phase: str) -> Callable[..., Any]:
+    async def on_end(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        timer = context.trace_request_ctx
+        if timer is not None and phase in timer.started:
+            elapsed = time.perf_counter() - timer.started.pop(phase)
+            setattr(timer.trace, phase, elapsed)
+
+    return on_end
+
+
+async def _on_connection_reuseconn(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    timer = context.trace_request_ctx
+    if timer is not None:
+        timer.trace.connection_reused = True
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Create the :class:`aiohttp.TraceConfig` that records the phases of a :class:`RequestTrace`
+
+    Requests that are not traced pass None as ``trace_request_ctx`` and are ignored.
+    """
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(_start("queued"))
+    config.on_connection_queued_end.append(_end("queued"))
+    config.on_dns_resolvehost_start.append(_start("dns"))
+    config.on_dns_resolvehost_end.append(_end("dns"))
+    config.on_connection_create_start.append(_start("connect"))
+    config.on_connection_create_end.append(_end("connect"))
+    config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    config.on_request_headers_sent.append(_start("server"))
+    config.on_request_end.append(_end("server"))
+    return config
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from enum import Enum
-from typing import Type
+from typing import Any, Dict, Hashable, Mapping, Tuple, Type
 
+from .intern import InternTable
 from .option import Option
+from .serialization import (
+    KIND_TIME_CONTROL,
+    KIND_USER,
+    Reader,
+    Writer,
+    decode,
+    enum_code,
+    enum_member,
+)
+from .utils import slotted_dataclass
 
 
 class Variant(Option, Enum):
@@ -48,7 +58,7 @@ class TimeControlType(Option, Enum):
     CLOCK = Option("Clock", "clock")
 
 
-@dataclass
+@slotted_dataclass(frozen=True)
 class TimeControl:
     """
     Class representing a time control
@@ -74,18 +84,96 @@ class TimeControl:
     days_per_turn: int | None
 
     @classmethod
-    def from_data(cls: Type["TimeControl"], data: dict) -> "TimeControl":
-        """Create a time control from a dictionary"""
+    def from_data(cls: Type["TimeControl"], data: Mapping[str, Any]) -> "TimeControl":
+        """Create a time control from a dictionary
+
+        Equal time controls are shared through :data:`time_control_table`.
+        """
+        key = (
+            data["type"],
+            data.get("limit", None),
+            data.get("increment", None),
+            data.get("show", None),
+            data.get("daysPerTurn", None),
+        )
+        return time_control_table.get(key, lambda: cls._from_key(*key))
+
+    @classmethod
+    def _from_key(
+        cls: Type["TimeControl"],
+        time_control_type: str,
+        limit: int | None,
+        increment: int | None,
+        show: str | None,
+        days_per_turn: int | None,
+    ) -> "TimeControl":
         return cls(
-            type=TimeControlType.find_by_data(data["type"]),
-            limit=data.get("limit", None),
-            increment=data.get("increment", None),
-            show=data.get("show", None),
-            days_per_turn=data.get("daysPerTurn", None),
+            type=TimeControlType.find_by_data(time_control_type),
+            limit=limit,
+            increment=increment,
+            show=show,
+            days_per_turn=days_per_turn,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the time control as a dictionary, with the type as its Lichess name"""
+        return {
+            "type": self.type.value.data,
+            "limit": self.limit,
+            "increment": self.increment,
+            "show": self.show,
+            "days_per_turn": self.days_per_turn,
+        }
+
+    def to_bytes(self) -> bytes:
+        """Encode the time control in a compact binary format. See :meth:`from_bytes`"""
+        writer = Writer(KIND_TIME_CONTROL)
+        self._write(writer)
+        return writer.to_bytes()
+
+    @classmethod
+    def from_bytes(cls: Type["TimeControl"], data: bytes) -> "TimeControl":
+        """Decode a time control encoded by :meth:`to_bytes`
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the data is not an encoded time control of the same format version.
+        """
+        return decode(data, KIND_TIME_CONTROL, cls._read)
+
+    def _write(self, writer: Writer) -> None:
+        writer.u8(enum_code(self.type))
+        writer.u8(
+            (self.limit is not None)
+            | (self.increment is not None) << 1
+            | (self.show is not None) << 2
+            | (self.days_per_turn is not None) << 3
+        )
+        if self.limit is not None:
+            writer.u32(self.limit)
+        if self.increment is not None:
+            writer.u16(self.increment)
+        if self.show is not None:
+            writer.string(self.show)
+        if self.days_per_turn is not None:
+            writer.u16(self.days_per_turn)
+
+    @classmethod
+    def _read(cls: Type["TimeControl"], reader: Reader) -> "TimeControl":
+        time_control_type = enum_member(TimeControlType, reader.u8())
+        flags = reader.u8()
+        key = (
+            time_control_type.value.data,
+            reader.u32() if flags & 1 else None,
+            reader.u16() if flags & 2 else None,
+            reader.string() if flags & 4 else None,
+            reader.u16() if flags & 8 else None,
         )
+        return time_control_table.get(key, lambda: cls._from_key(*key))
 
 
-@dataclass
+@slotted_dataclass(frozen=True)
 class User:
     """
     Class to represent a Lichess user
@@ -114,9 +202,11 @@ class User:
     title: str | None
 
     @classmethod
-    def from_data(cls: Type["User"], data: dict) -> "User":
+    def from_data(cls: Type["User"], data: Mapping[str, Any]) -> "User":
         """Create a :class:`User` object from a dictionary of data
 
+        Equal users are shared through :data:`user_table`.
+
         Parameters
         ----------
         data: :class:`dict`
@@ -127,11 +217,80 @@ class User:
         :class:`User`
             A :class:`User` object with the data from the dictionary
         """
-        return cls(
-            id=data["id"],
-            name=data["username"],
-            online=data.get("online", None),
-            provisional=data.get("provisional", None),
-            rating=data.get("rating", None),
-            title=data.get("title", None),
+        key = (
+            data["id"],
+            data["username"],
+            data.get("online", None),
+            data.get("provisional", None),
+            data.get("rating", None),
+            data.get("title", None),
+        )
+        return user_table.get(key, lambda: cls(*key))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the user as a dictionary"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "online": self.online,
+            "provisional": self.provisional,
+            "rating": self.rating,
+            "title": self.title,
+        }
+
+    def to_bytes(self) -> bytes:
+        """Encode the user in a compact binary format. See :meth:`from_bytes`"""
+        writer = Writer(KIND_USER)
+        self._write(writer)
+        return writer.to_bytes()
+
+    @classmethod
+    def from_bytes(cls: Type["User"], data: bytes) -> "User":
+        """Decode a user encoded by :meth:`to_bytes`
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the data is not an encoded user of the same format version.
+        """
+        return decode(data, KIND_USER, cls._read)
+
+    def _write(self, writer: Writer) -> None:
+        writer.u8(
+            (self.online is not None)
+            | bool(self.online) << 1
+            | (self.provisional is not None) << 2
+            | bool(self.provisional) << 3
+            | (self.rating is not None) << 4
+            | (self.title is not None) << 5
+        )
+        writer.string(self.id)
+        writer.string(self.name)
+        if self.rating is not None:
+            writer.u16(self.rating)
+        if self.title is not None:
+            writer.string(self.title)
+
+    @classmethod
+    def _read(cls: Type["User"], reader: Reader) -> "User":
+        flags = reader.u8()
+        user_id = reader.string()
+        name = reader.string()
+        key = (
+            user_id,
+            name,
+            bool(flags & 2) if flags & 1 else None,
+            bool(flags & 8) if flags & 4 else None,
+            reader.u16() if flags & 16 else None,
+            reader.string() if flags & 32 else None,
         )
+        return user_table.get(key, lambda: cls(*key))
+
+
+time_control_table: InternTable[Tuple[Hashable, ...], TimeControl] = InternTable(
+    maxsize=256
+)
+"""Shared :class:`TimeControl` objects, keyed by their data"""
+
+user_table: InternTable[Tuple[Any, ...], User] = InternTable(maxsize=4096)
+"""Shared :class:`User` objects, keyed by their id, rating and the rest of their data"""
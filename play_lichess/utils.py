@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Callable, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def _slotted_dataclass(**kwargs: Any) -> Callable[[Type[T]], Type[T]]:
+    """Decorator that creates a dataclass with ``__slots__`` instead of a per-instance ``__dict__``
+
+    This is the same as ``@dataclass(slots=True)``, which is only available in Python 3.10+.
+    Subclasses must define ``__slots__ = ()`` to also avoid a ``__dict__``.
+
+    Parameters
+    ----------
+    **kwargs: Any
+        Arguments to pass to :func:`dataclasses.dataclass` (eg. ``frozen=True``)
+    """
+
+    def wrap(cls: Type[T]) -> Type[T]:
+        return _add_slots(dataclass(**kwargs)(cls), kwargs.get("frozen", False))
+
+    return wrap
+
+
+if TYPE_CHECKING:
+    # type checkers only understand the fields and __init__ of the standard decorator
+    from dataclasses import dataclass as slotted_dataclass
+else:
+    slotted_dataclass = _slotted_dataclass
+
+
+def _add_slots(cls: Type[T], frozen: bool) -> Type[T]:
+    """Recreate a dataclass with a ``__slots__`` entry for each field"""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore  # is a dataclass
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # remove the default values, which would conflict with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    if frozen:
+        # the frozen __setattr__ prevents the default pickling of slotted objects
+        cls_dict["__getstate__"] = _getstate
+        cls_dict["__setstate__"] = _setstate
+    metaclass: Any = type(cls)
+    new_cls = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _getstate(self: Any) -> Dict[str, Any]:
+    return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def _setstate(self: Any, state: Dict[str, Any]) -> None:
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
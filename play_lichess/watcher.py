@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Set,
+)
+
+from .client import LichessClient
+from .exceptions import BadArgumentError
+from .match import MatchInfo
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Type
+
+_log = logging.getLogger(__name__)
+
+_TEXT_HEADERS: Mapping[str, str] = {"Content-Type": "text/plain"}
+
+# statuses of a game that has not finished yet
+_PLAYING = frozenset(("created", "started"))
+
+
+class ChallengeEvent(NamedTuple):
+    """Change in the state of a watched challenge
+
+    Attributes
+    ----------
+    match: :class:`MatchInfo`
+        The match created for the challenge
+    status: :class:`str`
+        The status of the game, eg. "started" once both players joined, or how it ended
+        ("mate", "resign", "outoftime", "aborted", etc.)
+    data: Mapping[:class:`str`, Any]
+        The game data sent by Lichess
+    """
+
+    match: MatchInfo
+    status: str
+    data: Mapping[str, Any]
+
+    @property
+    def finished(self) -> bool:
+        """Whether the game is over, after which the challenge is no longer watched"""
+        return self.status not in _PLAYING
+
+
+ChallengeCallback = Callable[[ChallengeEvent], None]
+
+
+class _Stream:
+    """One streaming connection watching up to ``ids_per_stream`` games"""
+
+    __slots__ = ("stream_id", "ids", "added", "sent", "connected", "task")
+
+    def __init__(self) -> None:
+        self.stream_id = uuid.uuid4().hex[:12]
+        # ids that are still watched, and the number of ids ever added to the stream
+        self.ids: Set[str] = set()
+        self.added = 0
+        # ids that Lichess knows about on the current connection
+        self.sent: Set[str] = set()
+        self.connected = False
+        self.task: asyncio.Task[None] | None = None
+
+
+class ChallengeWatcher:
+    """Watcher of created matches over a few streaming connections instead of polling
+
+    Open challenges become games with the same id once both players join, so the watcher
+    follows the challenge ids with the games stream of Lichess (``/api/stream/games/{id}``).
+    Each connection watches up to 500 challenges, and challenges are added to an open
+    connection without reconnecting::
+
+        async with ChallengeWatcher() as watcher:
+            watcher.watch(match)
+            async for event in watcher:
+                print(event.match.challenge_url, event.status)
+
+    Events can also be passed to callbacks with :meth:`add_callback`.
+
+    Note that Lichess only streams games, so a challenge cancelled before both players
+    joined produces no event. Challenges are no longer watched once their game is over.
+
+    Parameters
+    ----------
+    client: Optional[:class:`LichessClient`]
+        The client to open the streams with. The shared default client is used if not specified.
+    ids_per_stream: :class:`int`
+        The maximum number of challenges watched on one connection. The default is 500
+    reconnect_delay: :class:`float`
+        The number of seconds to wait before reopening a stream that failed. The default is 5
+    """
+
+    def __init__(
+        self,
+        *,
+        client: LichessClient | None = None,
+        ids_per_stream: int = 500,
+        reconnect_delay: float = 5,
+    ):
+        if ids_per_stream < 1:
+            raise BadArgumentError("ids_per_stream must be at least 1")
+        self.client = client
+        self.ids_per_stream = ids_per_stream
+        self.reconnect_delay = reconnect_delay
+        self._matches: Dict[str, MatchInfo] = {}
+        self._streams: List[_Stream] = []
+        self._callbacks: List[ChallengeCallback] = []
+        self._queues: List[asyncio.Queue[ChallengeEvent]] = []
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    async def __aenter__(self) -> ChallengeWatcher:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def __aiter__(self) -> AsyncIterator[ChallengeEvent]:
+        return self.events()
+
+    @property
+    def streams(self) -> int:
+        """The number of open streaming connections"""
+        return len(self._streams)
+
+    def add_callback(self, callback: ChallengeCallback) -> None:
+        """Register a function to call with every :class:`ChallengeEvent`
+
+        Parameters
+        ----------
+        callback: Callable[[:class:`ChallengeEvent`], None]
+            The function to call on the event loop when a watched challenge changes
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: ChallengeCallback) -> None:
+        """Unregister a function registered with :meth:`add_callback`"""
+        self._callbacks.remove(callback)
+
+    def watch(self, match: MatchInfo) -> None:
+        """Start watching a created match
+
+        Must be called from a running event loop.
+
+        Parameters
+        ----------
+        match: :class:`MatchInfo`
+            The match to watch
+
+        Raises
+        ------
+        :class:`BadArgumentError`
+            If the watcher was closed.
+        """
+        if self._closed:
+            raise BadArgumentError("The watcher was closed")
+        challenge_id = match.challenge_id
+        if challenge_id in self._matches:
+            return
+        self._matches[challenge_id] = match
+        stream = next((s for s in self._streams if s.added < self.ids_per_stream), None)
+        if stream is None:
+            stream = _Stream()
+            self._streams.append(stream)
+            stream.ids.add(challenge_id)
+            stream.added += 1
+            stream.task = asyncio.ensure_future(self._run(stream))
+            return
+        stream.ids.add(challenge_id)
+        stream.added += 1
+        if stream.connected:
+            asyncio.ensure_future(self._add(stream))
+
+    def watch_many(self, matches: Iterable[MatchInfo]) -> None:
+        """Start watching many created matches. See :meth:`watch`"""
+        for match in matches:
+            self.watch(match)
+
+    def unwatch(self, match: MatchInfo) -> None:
+        """Stop dispatching events of a match
+
+        Parameters
+        ----------
+        match: :class:`MatchInfo`
+            The match to stop watching
+        """
+        challenge_id = match.challenge_id
+        if self._matches.pop(challenge_id, None) is None:
+            return
+        for stream in self._streams:
+            if challenge_id in stream.ids:
+                stream.ids.discard(challenge_id)
+                self._close_if_done(stream)
+                break
+
+    async def events(self) -> AsyncIterator[ChallengeEvent]:
+        """Iterate over the events of the watched challenges until the watcher is closed
+
+        Only events that happen while iterating are yielded.
+
+        Yields
+        ------
+        :class:`ChallengeEvent`
+            The next change in the state of a watched challenge
+        """
+        queue: asyncio.Queue[ChallengeEvent] = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                event = await queue.get()
+                if event is _CLOSED:
+                    return
+                yield event
+        finally:
+            self._queues.remove(queue)
+
+    async def close(self) -> None:
+        """Close all streams and end the iterators of :meth:`events`"""
+        self._closed = True
+        tasks = [stream.task for stream in self._streams if stream.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._streams.clear()
+        self._matches.clear()
+        for queue in self._queues:
+            queue.put_nowait(_CLOSED)
+
+    def _close_if_done(self, stream: _Stream) -> None:
+        """Close a stream that is full and has no challenges left to watch"""
+        if not stream.ids and stream.added >= self.ids_per_stream:
+            self._streams.remove(stream)
+            if stream.task is not None:
+                stream.task.cancel()
+
+    async def _add(self, stream: _Stream) -> None:
+        """Add the ids of a stream that Lichess does not know about to the open connection"""
+        new_ids = stream.ids - stream.sent
+        if not new_ids or not stream.connected:
+            return
+        stream.sent |= new_ids
+        client = self.client or LichessClient.default()
+        try:
+            await client.request(
+                "POST",
+                f"/api/stream/games/{stream.stream_id}/add",
+                data=",".join(new_ids),
+                headers=_TEXT_HEADERS,
+            )
+        except Exception:
+            _log.exception("Could not add challenges to stream %s", stream.stream_id)
+            # the ids are sent again when the stream reconnects
+            stream.sent -= new_ids
+
+    def _on_open(self, stream: _Stream) -> None:
+        stream.connected = True
+        if stream.ids - stream.sent:
+            asyncio.ensure_future(self._add(stream))
+
+    async def _run(self, stream: _Stream) -> None:
+        """Keep a stream open and dispatch its events while it has challenges to watch"""
+        client = self.client or LichessClient.default()
+        try:
+            while stream.ids:
+                stream.sent = set(stream.ids)
+                try:
+                    async for data in client.stream(
+                        "POST",
+                        f"/api/stream/games/{stream.stream_id}",
+                        data=",".join(stream.sent),
+                        headers=_TEXT_HEADERS,
+                        on_open=lambda: self._on_open(stream),
+                    ):
+                        self._dispatch(stream, data)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    _log.exception("Stream %s failed", stream.stream_id)
+                finally:
+                    stream.connected = False
+                if stream.ids:
+                    await asyncio.sleep(self.reconnect_delay)
+        finally:
+            if stream in self._streams:
+                self._streams.remove(stream)
+
+    def _dispatch(self, stream: _Stream, data: Mapping[str, Any]) -> None:
+        match = self._matches.get(data.get("id", ""))
+        if match is None:
+            return
+        event = ChallengeEvent(match, data.get("statusName", ""), data)
+        if event.finished:
+            del self._matches[match.challenge_id]
+            stream.ids.discard(match.challenge_id)
+        for callback in tuple(self._callbacks):
+            try:
+                callback(event)
+            except Exception:
+                _log.exception("Error in challenge callback %r", callback)
+        for queue in self._queues:
+            queue.put_nowait(event)
+        if event.finished:
+            self._close_if_done(stream)
+
+
+_CLOSED: Any = object()
+"""Sentinel put in the queues of :meth:`ChallengeWatcher.events` when the watcher is closed"""
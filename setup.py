@@ -46,4 +46,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[requirements],
+    extras_require={
+        "orjson": ["orjson"],
+        "msgspec": ["msgspec"],
+        "numpy": ["numpy"],
+    },
 )
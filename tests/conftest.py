@@ -0,0 +1,9 @@
+import pytest_asyncio
+
+from play_lichess.testing import MockLichessServer
+
+
+@pytest_asyncio.fixture
+async def lichess_server():
+    async with MockLichessServer() as server:
+        yield server
@@ -0,0 +1,95 @@
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    Color,
+    MatchBatch,
+    RealTimeMatch,
+    TimeControlType,
+    TimeMode,
+    Variant,
+)
+from play_lichess.testing import challenge_response
+
+PARAMS = [
+    {"clock.limit": 180, "clock.increment": 2, "variant": "standard"},
+    {"clock.limit": 180, "clock.increment": 2, "variant": "atomic", "rated": True},
+    {"clock.limit": 600, "clock.increment": 0, "variant": "standard"},
+    {"days": 3, "variant": "standard"},
+    {"variant": "horde"},
+]
+
+
+def payloads():
+    return [challenge_response(f"id{i}", p) for i, p in enumerate(PARAMS)]
+
+
+def test_from_data_and_from_matches_match():
+    from_data = MatchBatch.from_data(payloads())
+    from_matches = MatchBatch.from_matches(
+        RealTimeMatch.from_data(data) for data in payloads()
+    )
+    assert len(from_data) == 5
+    for name in ("variant", "speed", "color", "time_control_type", "clock_limit"):
+        assert from_data.values(name) == from_matches.values(name)
+    assert from_data.values("variant")[1] is Variant.ATOMIC
+    assert from_data.values("rated") == [False, True, False, False, False]
+    assert from_data.values("days") == [None, None, None, 3, None]
+    assert from_data.values("time_control_type")[3] is TimeControlType.CORRESPONDENCE
+    assert from_data.column("clock_limit").tolist() == [180, 180, 600, -1, -1]
+
+
+def test_filter():
+    batch = MatchBatch.from_data(payloads())
+    assert batch.filter(variant=Variant.STANDARD).challenge_ids == [
+        "id0",
+        "id2",
+        "id3",
+    ]
+    assert batch.filter(clock_limit=180, rated=False).challenge_ids == ["id0"]
+    assert batch.filter(variant={Variant.ATOMIC, Variant.HORDE}).challenge_ids == [
+        "id1",
+        "id4",
+    ]
+    assert batch.filter(clock_limit=None).challenge_ids == ["id3", "id4"]
+    assert batch.filter(status="accepted").challenge_ids == []
+    limits = batch.column("clock_limit")
+    assert batch.filter(
+        [limit >= 300 for limit in limits], variant=Variant.STANDARD
+    ).challenge_ids == ["id2"]
+
+    with pytest.raises(BadArgumentError):
+        batch.filter(variant="standard")
+    with pytest.raises(BadArgumentError):
+        batch.filter(opening="e4")
+    with pytest.raises(BadArgumentError):
+        batch.filter(rated=None)
+
+
+def test_count_and_group():
+    batch = MatchBatch.from_data(payloads())
+    assert batch.count_by("variant") == {
+        Variant.STANDARD: 3,
+        Variant.ATOMIC: 1,
+        Variant.HORDE: 1,
+    }
+    assert batch.count_by("clock_limit", "clock_increment")[(180, 2)] == 2
+    assert batch.count_by("color") == {Color.RANDOM: 5}
+    assert batch.count_by("status") == {"created": 5}
+
+    groups = batch.group_by("speed")
+    assert list(groups) == [TimeMode.BLITZ, TimeMode.RAPID, TimeMode.CORRESPONDENCE]
+    assert groups[TimeMode.CORRESPONDENCE].challenge_ids == ["id3", "id4"]
+    # the groups keep working with the status codes of the batch
+    assert groups[TimeMode.BLITZ].filter(status="created").challenge_ids == [
+        "id0",
+        "id1",
+    ]
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    arrays = MatchBatch.from_data(payloads()).to_numpy()
+    assert arrays["clock_limit"].dtype == numpy.int32
+    assert (arrays["clock_limit"] == 180).sum() == 2
+    assert list(arrays["challenge_id"]) == [f"id{i}" for i in range(5)]
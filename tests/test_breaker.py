@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpError,
+    LichessClient,
+    RateLimiter,
+    RealTimeMatch,
+)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_and_fails_fast(lichess_server):
+    lichess_server.failures = [500, 500, 500]
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    limiter = RateLimiter(max_retries=0)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, circuit_breaker=breaker
+    ) as client:
+        for _ in range(3):
+            with pytest.raises(HttpError):
+                await RealTimeMatch.create(client=client)
+        assert breaker.state == "open"
+
+        start = time.monotonic()
+        with pytest.raises(CircuitOpenError) as info:
+            await RealTimeMatch.create(client=client)
+        assert time.monotonic() - start < 0.1
+
+    # the request was not sent
+    assert len(lichess_server.authorizations) == 3
+    assert info.value.failures == 3
+    assert 59 < info.value.retry_after <= 60
+    assert breaker.snapshot()["opened"] == 1
+    assert breaker.snapshot()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_breaker_stops_retries(lichess_server):
+    lichess_server.failures = [500] * 10
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    limiter = RateLimiter(max_retries=5, backoff_base=0.001)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, circuit_breaker=breaker
+    ) as client:
+        with pytest.raises(CircuitOpenError):
+            await RealTimeMatch.create(client=client)
+
+    assert len(lichess_server.authorizations) == 2
+
+
+@pytest.mark.asyncio
+async def test_breaker_counts_connection_errors():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    # nothing listens on this port
+    async with LichessClient(
+        base_url="http://127.0.0.1:9", circuit_breaker=breaker
+    ) as client:
+        for _ in range(2):
+            with pytest.raises(Exception) as info:
+                await RealTimeMatch.create(client=client)
+            assert not isinstance(info.value, CircuitOpenError)
+        with pytest.raises(CircuitOpenError):
+            await RealTimeMatch.create(client=client)
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_circuit(lichess_server):
+    lichess_server.failures = [500]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    limiter = RateLimiter(max_retries=0)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, circuit_breaker=breaker
+    ) as client:
+        with pytest.raises(HttpError):
+            await RealTimeMatch.create(client=client)
+        assert breaker.state == "open"
+        await asyncio.sleep(0.06)
+        assert breaker.state == "half_open"
+        await RealTimeMatch.create(client=client)
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens_circuit(lichess_server):
+    lichess_server.failures = [500, 500]
+    lichess_server.latency = 0.05
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    limiter = RateLimiter(max_retries=0)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, circuit_breaker=breaker
+    ) as client:
+        with pytest.raises(HttpError):
+            await RealTimeMatch.create(client=client)
+        await asyncio.sleep(0.06)
+        probe = asyncio.ensure_future(RealTimeMatch.create(client=client))
+        await asyncio.sleep(0.01)
+        # only one probe is sent at a time
+        with pytest.raises(CircuitOpenError):
+            await RealTimeMatch.create(client=client)
+        with pytest.raises(HttpError):
+            await probe
+
+    assert breaker.state == "open"
+    assert breaker.opened == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_circuit(lichess_server):
+    lichess_server.failures = [400, 400, 400]
+    breaker = CircuitBreaker(failure_threshold=2)
+    async with LichessClient(
+        base_url=lichess_server.base_url, circuit_breaker=breaker
+    ) as client:
+        for _ in range(3):
+            with pytest.raises(HttpError):
+                await RealTimeMatch.create(client=client)
+
+    assert breaker.state == "closed"
+
+
+def test_breaker_arguments():
+    with pytest.raises(BadArgumentError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(BadArgumentError):
+        CircuitBreaker(reset_timeout=-1)
@@ -0,0 +1,94 @@
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    BulkPairing,
+    BulkPairingError,
+    HttpError,
+    LichessClient,
+    RateLimiter,
+    TimeControlType,
+    Variant,
+)
+
+
+@pytest.mark.asyncio
+async def test_bulk_pairing(lichess_server):
+    pairs = [(f"white{i}", f"black{i}") for i in range(5)]
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        pairings = await BulkPairing.create(
+            pairs,
+            token="organizer",
+            clock_limit=180,
+            clock_increment=2,
+            variant=Variant.ATOMIC,
+            rated=True,
+            chunk_size=2,
+            client=client,
+        )
+
+    assert [len(pairing.games) for pairing in pairings] == [2, 2, 1]
+    games = [game for pairing in pairings for game in pairing.games]
+    assert [(game.white, game.black) for game in games] == pairs
+    assert games[0].url == f"https://lichess.org/{games[0].game_id}"
+    pairing = pairings[0]
+    assert pairing.variant == Variant.ATOMIC
+    assert pairing.rated is True
+    assert pairing.time_control is not None
+    assert pairing.time_control.type == TimeControlType.CLOCK
+    assert pairing.time_control.limit == 180
+    assert pairing.time_control.increment == 2
+    form = lichess_server.bulk_requests[0]
+    assert form["players"] == "white0:black0,white1:black1"
+    assert form["rated"] == "true"
+    assert form["clock.limit"] == "180"
+
+
+@pytest.mark.asyncio
+async def test_bulk_pairing_errors(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        with pytest.raises(BadArgumentError):
+            await BulkPairing.create([], token="organizer", client=client)
+        with pytest.raises(BadArgumentError):
+            await BulkPairing.create(
+                [("a", "b")], token="organizer", chunk_size=501, client=client
+            )
+        with pytest.raises(BadArgumentError):
+            await BulkPairing.create(
+                [("a", "b")], token="organizer", days=4, clock_limit=None, client=client
+            )
+        with pytest.raises(HttpError) as error:
+            await BulkPairing.create([("a", "b")], token="", client=client)
+    assert error.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_bulk_pairing_keeps_created_chunks(lichess_server):
+    pairs = [("white0", "black0"), ("white1", "black1"), ("", "black2")]
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        with pytest.raises(BulkPairingError) as error:
+            await BulkPairing.create(
+                pairs, token="organizer", chunk_size=2, client=client
+            )
+        with pytest.raises(HttpError):
+            await BulkPairing.create(pairs[2:], token="organizer", client=client)
+
+    (pairing,) = error.value.pairings
+    assert [(game.white, game.black) for game in pairing.games] == pairs[:2]
+    assert error.value.unpaired == pairs[2:]
+    assert isinstance(error.value.error, HttpError)
+    assert error.value.error.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_pairing_is_not_retried_after_server_error(lichess_server):
+    lichess_server.failures = [503, 503]
+    limiter = RateLimiter(backoff_base=0.01)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter
+    ) as client:
+        with pytest.raises(HttpError) as error:
+            await BulkPairing.create([("a", "b")], token="organizer", client=client)
+
+    assert error.value.status_code == 503
+    assert lichess_server.failures == [503]
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any, Dict, List
+
+import aiohttp
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    CorrespondenceMatch,
+    HttpError,
+    LichessClient,
+    Match,
+    RealTimeMatch,
+    get_json_backend,
+)
+from play_lichess.types import TimeControlType, TimeMode, Variant
+
+
+@pytest.mark.asyncio
+async def test_client_reuses_connection(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        first = await client.create_real_time_match(clock_limit=180, clock_increment=2)
+        second = await RealTimeMatch.create(variant=Variant.ATOMIC, client=client)
+
+    assert client.closed
+    assert isinstance(first, RealTimeMatch)
+    assert first.speed == TimeMode.BLITZ
+    assert first.time_control is not None
+    assert first.time_control.show == "3+2"
+    assert second.variant == Variant.ATOMIC
+    assert len(set(lichess_server.peers)) == 1
+
+
+@pytest.mark.asyncio
+async def test_client_create_methods(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        correspondence = await client.create_correspondence_match(days=3)
+        unlimited = await client.create_unlimited_match(name="Test")
+        match = await client.create_match(clock_limit=None, clock_increment=None)
+
+    assert correspondence.time_control is not None
+    assert correspondence.time_control.days_per_turn == 3
+    assert unlimited.name == "Test"
+    assert match.time_control is not None
+    assert match.time_control.type == TimeControlType.UNLIMITED
+
+
+def test_default_client():
+    assert LichessClient.default() is LichessClient.default()
+
+
+@pytest.mark.asyncio
+async def test_create_many(lichess_server):
+    params: List[Dict[str, Any]] = [
+        {"clock_limit": 60 * i, "clock_increment": 0} for i in range(1, 6)
+    ]
+    params.insert(2, {"clock_limit": 60, "clock_increment": None})
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        results = await Match.create_many(params, concurrency=2, client=client)
+
+    assert [result.index for result in results] == list(range(6))
+    assert [result.ok for result in results] == [True, True, False, True, True, True]
+    assert isinstance(results[2].error, BadArgumentError)
+    assert all(isinstance(result.match, Match) for result in results if result.ok)
+    assert results[5].match is not None
+    assert results[5].match.time_control is not None
+    assert results[5].match.time_control.limit == 300
+
+
+@pytest.mark.asyncio
+async def test_create_as_completed(lichess_server):
+    params = [{"days": 1}] * 5
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        results = [
+            result
+            async for result in CorrespondenceMatch.create_as_completed(
+                params, concurrency=3, client=client
+            )
+        ]
+
+    assert sorted(result.index for result in results) == list(range(5))
+    assert all(result.ok for result in results)
+    assert len(lichess_server.requests) == 5
+
+
+@pytest.mark.asyncio
+async def test_http_error_with_non_json_page(lichess_server):
+    lichess_server.failures = [404]
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        with pytest.raises(HttpError) as exc_info:
+            await RealTimeMatch.create(client=client)
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.response_text == "failure"
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec", "auto"])
+def test_json_backends(name):
+    if name in ("orjson", "msgspec"):
+        pytest.importorskip(name)
+    backend = get_json_backend(name)
+    data = backend.dumps({"clock.limit": 300, "name": "Tést"})
+    assert isinstance(data, bytes)
+    assert backend.loads(data) == {"clock.limit": 300, "name": "Tést"}
+
+
+def test_unknown_json_backend():
+    with pytest.raises(BadArgumentError):
+        get_json_backend("yaml")
+
+
+def test_lazy_without_keep_data():
+    with pytest.raises(BadArgumentError):
+        LichessClient(lazy=True, keep_data=False)
+
+
+@pytest.mark.asyncio
+async def test_create_many_reports_timeouts(lichess_server):
+    lichess_server.latency = 0.5
+    async with LichessClient(base_url=lichess_server.base_url, timeout=0.05) as client:
+        results = await RealTimeMatch.create_many([{}] * 3, client=client)
+
+    assert [result.ok for result in results] == [False, False, False]
+    assert all(isinstance(r.error, asyncio.TimeoutError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_create_many_reports_connection_errors():
+    # nothing listens on this port
+    async with LichessClient(base_url="http://127.0.0.1:9") as client:
+        results = await RealTimeMatch.create_many([{}] * 2, client=client)
+
+    assert all(isinstance(r.error, aiohttp.ClientError) for r in results)
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from play_lichess import (
+    AdaptiveLimiter,
+    BadArgumentError,
+    HttpError,
+    LichessClient,
+    RateLimiter,
+    RealTimeMatch,
+)
+
+
+def rate_limited():
+    return HttpError(429, "Too Many Requests", "/api/challenge/open", "")
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_flat():
+    limiter = AdaptiveLimiter(initial=2, max_limit=8)
+    running = 0
+    peak = 0
+
+    async def send():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.002)
+        running -= 1
+
+    for _ in range(4):
+        await asyncio.gather(*(limiter.run(send) for _ in range(20)))
+
+    assert limiter.limit > 2
+    assert limiter.decreases == 0
+    assert peak <= limiter.max_limit
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_cuts_limit_once_per_window():
+    limiter = AdaptiveLimiter(initial=8)
+
+    async def send():
+        await asyncio.sleep(0.001)
+        raise rate_limited()
+
+    results = await asyncio.gather(
+        *(limiter.run(send) for _ in range(8)), return_exceptions=True
+    )
+    assert all(isinstance(result, HttpError) for result in results)
+    # the requests in flight at the same time only cut the limit once
+    assert limiter.limit == 4
+    assert limiter.decreases == 1
+
+
+@pytest.mark.asyncio
+async def test_latency_spike_cuts_limit():
+    limiter = AdaptiveLimiter(initial=4, latency_tolerance=2, smoothing=1)
+
+    async def send(delay):
+        await asyncio.sleep(delay)
+
+    for _ in range(3):
+        await limiter.run(lambda: send(0.005))
+    await limiter.run(lambda: send(0.05))
+
+    assert limiter.limit == 2
+    assert limiter.snapshot()["decreases"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_cuts_limit_and_waiters_get_slots():
+    limiter = AdaptiveLimiter(initial=2, min_limit=1)
+
+    async def send():
+        await asyncio.sleep(0.01)
+        raise asyncio.TimeoutError
+
+    results = await asyncio.gather(
+        *(limiter.run(send) for _ in range(5)), return_exceptions=True
+    )
+    assert len(results) == 5
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+    assert limiter.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_client_limiter_in_create_many(lichess_server):
+    lichess_server.failures = [429]
+    lichess_server.retry_after = 0.01
+    limiter = AdaptiveLimiter(initial=4, max_limit=6)
+    async with LichessClient(
+        base_url=lichess_server.base_url,
+        concurrency_limiter=limiter,
+        rate_limiter=RateLimiter(),
+    ) as client:
+        results = await RealTimeMatch.create_many(
+            [{}] * 30, concurrency=limiter, client=client
+        )
+
+    assert all(result.ok for result in results)
+    assert limiter.decreases == 1
+    assert len(lichess_server.requests) == 30
+
+
+@pytest.mark.asyncio
+async def test_batch_limiter(lichess_server):
+    limiter = AdaptiveLimiter(initial=2, max_limit=4)
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        results = await RealTimeMatch.create_many(
+            [{}] * 20, concurrency=limiter, client=client
+        )
+    assert [result.index for result in results] == list(range(20))
+    assert limiter.in_flight == 0
+
+
+def test_limiter_arguments():
+    with pytest.raises(BadArgumentError):
+        AdaptiveLimiter(initial=0)
+    with pytest.raises(BadArgumentError):
+        AdaptiveLimiter(initial=10, max_limit=5)
+    with pytest.raises(BadArgumentError):
+        AdaptiveLimiter(backoff=1)
+
+
+@pytest.mark.asyncio
+async def test_total_timeout_cuts_limit(lichess_server):
+    lichess_server.latency = 0.5
+    limiter = AdaptiveLimiter(initial=4)
+    async with LichessClient(
+        base_url=lichess_server.base_url, concurrency_limiter=limiter, timeout=0.05
+    ) as client:
+        results = await RealTimeMatch.create_many([{}] * 3, client=client)
+
+    assert not any(result.ok for result in results)
+    # the calls timed out together, so the limit is only cut once
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,65 @@
+import pytest
+
+from play_lichess import BadArgumentError, LichessClient, RealTimeMatch, validate_fen
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+        "8/8/4k3/8/8/4K3/8/8 w - -",
+        "4k3/8/8/8/8/8/8/4K3 b",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w HAha - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KAkh - 0 1",
+    ],
+)
+def test_valid_fen(fen):
+    validate_fen(fen, strict=True)
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/ppppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppx/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e4 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - a 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 1",
+    ],
+)
+def test_invalid_fen(fen):
+    with pytest.raises(BadArgumentError):
+        validate_fen(fen)
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "rnbq1bnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQ - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNP w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KKkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQAkq - 0 1",
+    ],
+)
+def test_strict_fen(fen):
+    with pytest.raises(BadArgumentError):
+        validate_fen(fen, strict=True)
+    validate_fen(fen)
+
+
+@pytest.mark.asyncio
+async def test_client_checks_fen_strictly_only_when_asked(lichess_server):
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        await RealTimeMatch.create(fen=fen, client=client)
+    async with LichessClient(
+        base_url=lichess_server.base_url, strict_fen=True
+    ) as client:
+        with pytest.raises(BadArgumentError):
+            await RealTimeMatch.create(fen=fen, client=client)
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import play_lichess
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_enums_do_not_import_aiohttp():
+    code = (
+        "import sys\n"
+        "from play_lichess import TimeMode, Variant\n"
+        "Variant.find('atomic')\n"
+        "print('aiohttp' in sys.modules)"
+    )
+    assert run(code) == "False"
+
+
+def test_all_names_are_importable():
+    for name in play_lichess.__all__:
+        assert getattr(play_lichess, name) is not None
+    assert set(play_lichess.__all__) <= set(dir(play_lichess))
+
+
+def test_unknown_name():
+    try:
+        play_lichess.NotAName  # type: ignore
+    except AttributeError as error:
+        assert "NotAName" in str(error)
+    else:
+        raise AssertionError("AttributeError not raised")
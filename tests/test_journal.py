@@ -0,0 +1,80 @@
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    LichessClient,
+    Match,
+    MatchJournal,
+    MatchTemplate,
+    RealTimeMatch,
+    Variant,
+)
+
+
+@pytest.mark.asyncio
+async def test_journal_records_created_matches(lichess_server, tmp_path):
+    path = str(tmp_path / "matches.db")
+    with MatchJournal(path) as journal:
+        async with LichessClient(
+            base_url=lichess_server.base_url, journal=journal
+        ) as client:
+            first = await RealTimeMatch.create(name="Board 1", client=client)
+            second = await MatchTemplate(
+                client=client, variant=Variant.ATOMIC, name="Board 2"
+            ).create()
+        assert len(journal) == 2
+
+    # a new process rebuilds its state from the file
+    with MatchJournal(path) as journal:
+        matches = journal.load()
+        assert list(matches) == [first.challenge_id, second.challenge_id]
+        loaded = matches[first.challenge_id]
+        assert isinstance(loaded, RealTimeMatch)
+        assert loaded == RealTimeMatch.from_bytes(first.to_bytes())
+        assert isinstance(matches[second.challenge_id], Match)
+        assert first.challenge_id in journal
+        assert "missing" not in journal
+        assert journal.get("missing") is None
+        assert journal.find_by_name("Board 2")[0].challenge_id == second.challenge_id
+        assert [m.challenge_id for m in journal.find_by_variant(Variant.ATOMIC)] == [
+            second.challenge_id
+        ]
+
+
+def test_journal_range_scans():
+    with MatchJournal(":memory:") as journal:
+        for i, timestamp in enumerate([100.0, 200.0, 300.0]):
+            match = Match(challenge_id=f"id{i}", challenge_url="url", status="created")
+            journal.record(match, created_at=timestamp)
+        # recording a match again does not change it
+        journal.record(Match(challenge_id="id0", challenge_url="url", status="x"))
+
+        assert [m.challenge_id for m in journal.between(150, 300)] == ["id1"]
+        assert [m.challenge_id for m in journal.between(150)] == ["id1", "id2"]
+        first = journal.get("id0")
+        assert first is not None
+        assert first.status == "created"
+        assert [
+            m.challenge_id
+            for m in journal.find_by_variant(Variant.STANDARD, start=0, end=250)
+        ] == ["id0", "id1"]
+
+
+@pytest.mark.asyncio
+async def test_journal_failure_does_not_lose_match(lichess_server, caplog):
+    journal = MatchJournal(":memory:")
+    journal.close()
+    async with LichessClient(
+        base_url=lichess_server.base_url, journal=journal
+    ) as client:
+        match = await RealTimeMatch.create(client=client)
+
+    assert match.challenge_id
+    assert "Could not record" in caplog.text
+
+
+def test_journal_synchronous():
+    with MatchJournal(":memory:", synchronous="full") as journal:
+        assert journal._scalar("PRAGMA synchronous") == 2
+    with pytest.raises(BadArgumentError):
+        MatchJournal(":memory:", synchronous="NORMAL; DROP TABLE matches")
@@ -0,0 +1,66 @@
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    HttpError,
+    LichessClient,
+    MatchTemplate,
+    Metrics,
+    RateLimiter,
+    RealTimeMatch,
+    Variant,
+)
+from play_lichess.metrics import Histogram
+
+
+def test_histogram_buckets():
+    histogram = Histogram([0.1, 1])
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(0.1, 2), (1, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(3.65)
+
+
+@pytest.mark.asyncio
+async def test_metrics(lichess_server):
+    metrics = Metrics()
+    lichess_server.failures = [404]
+    limiter = RateLimiter(max_retries=0)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, metrics=metrics
+    ) as client:
+        with pytest.raises(HttpError):
+            await RealTimeMatch.create(client=client)
+        await RealTimeMatch.create(client=client, clock_limit=60)
+        await RealTimeMatch.create(client=client, clock_limit=60)
+        await MatchTemplate(client=client, variant=Variant.ATOMIC).create()
+        with pytest.raises(BadArgumentError):
+            await RealTimeMatch.create(client=client, clock_limit=20000)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["created"] == {
+        "standard": {"bullet": 2},
+        "atomic": {"blitz": 1},
+    }
+    assert snapshot["http_errors"] == {404: 1}
+    assert snapshot["bad_arguments"] == 1
+    assert snapshot["in_flight"] == 0
+    assert snapshot["latency"]["blitz"]["count"] == 2
+    assert snapshot["latency"]["bullet"]["buckets"][float("inf")] == 2
+
+    text = metrics.to_prometheus()
+    assert (
+        'play_lichess_matches_created_total{variant="standard",time_mode="bullet"} 2'
+        in text
+    )
+    assert 'play_lichess_http_errors_total{status="404"} 1' in text
+    assert "play_lichess_bad_arguments_total 1" in text
+    assert "# TYPE play_lichess_create_duration_seconds histogram" in text
+    assert (
+        'play_lichess_create_duration_seconds_bucket{time_mode="blitz",le="+Inf"} 2'
+        in text
+    )
+
+    metrics.reset()
+    assert metrics.snapshot()["created"] == {}
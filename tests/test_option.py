@@ -1,3 +1,5 @@
+import pytest
+
 from play_lichess.types import Color, TimeControlType, TimeMode, Variant
 
 
@@ -62,3 +64,25 @@ def test_option_find_by_data():
     assert (
         TimeControlType.find_by_data("correspondence") == TimeControlType.CORRESPONDENCE
     )
+
+
+def test_option_find_case_insensitive():
+    assert Variant.find("racingkings", case_sensitive=False) == Variant.RACING_KINGS
+    assert Variant.find("KING OF THE HILL", case_sensitive=False) == (
+        Variant.KING_OF_THE_HILL
+    )
+    assert Color.find_by_data("Black", case_sensitive=False) == Color.BLACK
+    assert TimeMode.find_by_description("blitz", case_sensitive=False) == (
+        TimeMode.BLITZ
+    )
+
+
+def test_option_find_unknown():
+    with pytest.raises(ValueError):
+        Variant.find("racingkings")
+    with pytest.raises(ValueError):
+        Color.find_by_data("White")
+    with pytest.raises(ValueError):
+        TimeMode.find_by_description("blitz")
+    with pytest.raises(ValueError):
+        TimeControlType.find_by_description("clock")
@@ -2,7 +2,7 @@ __import__("sys").path.append(".")
 import pytest
 
 from play_lichess import CorrespondenceMatch, Match, RealTimeMatch, UnlimitedMatch
-from play_lichess.exceptions import BadArgumentError, HttpError
+from play_lichess.exceptions import BadArgumentError
 from play_lichess.types import Color, TimeControlType, TimeMode, Variant
 
 
@@ -99,7 +99,7 @@ async def test_create_rated():
 
 @pytest.mark.asyncio
 async def test_real_time_lower_bound_minutes():
-    with pytest.raises(HttpError):
+    with pytest.raises(BadArgumentError):
         await RealTimeMatch.create(
             clock_limit=0,
             clock_increment=0,
@@ -108,7 +108,7 @@ async def test_real_time_lower_bound_minutes():
 
 @pytest.mark.asyncio
 async def test_real_time_upper_bound_minutes():
-    with pytest.raises(HttpError):
+    with pytest.raises(BadArgumentError):
         await RealTimeMatch.create(
             clock_limit=10801,
             clock_increment=0,
@@ -118,7 +118,7 @@ async def test_real_time_upper_bound_minutes():
 
 @pytest.mark.asyncio
 async def test_real_time_lower_bound_increment():
-    with pytest.raises(HttpError):
+    with pytest.raises(BadArgumentError):
         await RealTimeMatch.create(
             clock_limit=6 * 60,
             clock_increment=-1,
@@ -128,7 +128,7 @@ async def test_real_time_lower_bound_increment():
 
 @pytest.mark.asyncio
 async def test_real_time_upper_bound_increment():
-    with pytest.raises(HttpError):
+    with pytest.raises(BadArgumentError):
         await RealTimeMatch.create(
             clock_limit=6 * 60,
             clock_increment=181,
@@ -162,3 +162,39 @@ async def test_missing_limit():
             clock_limit=None,
             clock_increment=5,
         )
+
+
+@pytest.mark.asyncio
+async def test_both_clocks_zero():
+    with pytest.raises(BadArgumentError):
+        await RealTimeMatch.create(
+            clock_limit=0,
+            clock_increment=0,
+            variant=Variant.STANDARD,
+        )
+
+
+@pytest.mark.asyncio
+async def test_invalid_days():
+    with pytest.raises(BadArgumentError):
+        await CorrespondenceMatch.create(
+            days=4,  # type: ignore
+        )
+
+
+@pytest.mark.asyncio
+async def test_rated_without_time_control():
+    with pytest.raises(BadArgumentError):
+        await Match.create(
+            rated=True,
+            clock_limit=None,
+            clock_increment=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_invalid_fen():
+    with pytest.raises(BadArgumentError):
+        await UnlimitedMatch.create(
+            fen="rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+        )
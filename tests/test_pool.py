@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from play_lichess import ChallengePool, LichessClient, RealTimeMatch
+
+
+async def _wait_until_full(pool, count, *args, **kwargs):
+    for _ in range(100):
+        if pool.available(*args, **kwargs) == count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("pool was not refilled")
+
+
+@pytest.mark.asyncio
+async def test_pool_serves_ready_challenges(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        async with ChallengePool(size=2, client=client) as pool:
+            pool.register(RealTimeMatch, clock_limit=180, clock_increment=0)
+            await _wait_until_full(
+                pool, 2, RealTimeMatch, clock_limit=180, clock_increment=0
+            )
+
+            first = await pool.acquire(
+                RealTimeMatch, clock_limit=180, clock_increment=0
+            )
+            second = await pool.acquire(
+                RealTimeMatch, clock_limit=180, clock_increment=0
+            )
+            await _wait_until_full(
+                pool, 2, RealTimeMatch, clock_limit=180, clock_increment=0
+            )
+
+    assert isinstance(first, RealTimeMatch)
+    assert first.challenge_id != second.challenge_id
+    assert pool.hits == 2
+    assert pool.misses == 0
+    assert len(lichess_server.requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_pool_discards_expired_challenges(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        async with ChallengePool(size=1, ttl=0.05, client=client) as pool:
+            pool.register(RealTimeMatch)
+            await _wait_until_full(pool, 1, RealTimeMatch)
+            await asyncio.sleep(0.1)
+            await _wait_until_full(pool, 1, RealTimeMatch)
+
+    assert pool.expired >= 1
+    assert len(lichess_server.requests) >= 2
+
+
+@pytest.mark.asyncio
+async def test_pool_creates_when_empty(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        async with ChallengePool(size=1, client=client) as pool:
+            match = await pool.acquire(RealTimeMatch, name="Live")
+
+    assert match.name == "Live"
+    assert pool.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_refilling_after_error(lichess_server, monkeypatch):
+    create_many = RealTimeMatch.create_many
+    calls = []
+
+    async def failing_create_many(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+        return await create_many(*args, **kwargs)
+
+    monkeypatch.setattr(RealTimeMatch, "create_many", failing_create_many)
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        async with ChallengePool(size=1, retry_delay=0.01, client=client) as pool:
+            pool.register(RealTimeMatch)
+            await _wait_until_full(pool, 1, RealTimeMatch)
+
+    assert len(calls) == 2
@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from play_lichess import HttpError, LichessClient, RateLimiter, RealTimeMatch
+from play_lichess.ratelimit import TokenBucket
+from play_lichess.testing import MockLichessServer
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_retry_after_rate_limit(lichess_server):
+    lichess_server.failures = [429]
+    limiter = RateLimiter(cooldown=0.05)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter
+    ) as client:
+        start = time.monotonic()
+        match = await RealTimeMatch.create(client=client)
+
+    assert time.monotonic() - start >= 0.05
+    assert match.challenge_id == "mock0000"
+
+
+@pytest.mark.asyncio
+async def test_retry_server_error(lichess_server):
+    lichess_server.failures = [502, 503]
+    limiter = RateLimiter(backoff_base=0.01)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter
+    ) as client:
+        match = await RealTimeMatch.create(client=client)
+
+    assert match.challenge_id == "mock0000"
+
+
+@pytest.mark.asyncio
+async def test_retries_exhausted(lichess_server):
+    lichess_server.failures = [500, 500, 500]
+    limiter = RateLimiter(max_retries=2, backoff_base=0.01)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter
+    ) as client:
+        with pytest.raises(HttpError) as exc_info:
+            await RealTimeMatch.create(client=client)
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.response_text == "failure"
+    assert not lichess_server.failures
+
+
+@pytest.mark.asyncio
+async def test_client_error_not_retried(lichess_server):
+    lichess_server.failures = [400, 400]
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        with pytest.raises(HttpError):
+            await RealTimeMatch.create(client=client)
+
+    assert lichess_server.failures == [400]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_header():
+    limiter = RateLimiter(max_retries=0)
+    async with MockLichessServer(rate_limit_rate=1, retry_after=30) as server:
+        async with LichessClient(
+            base_url=server.base_url, rate_limiter=limiter
+        ) as client:
+            with pytest.raises(HttpError) as exc_info:
+                await RealTimeMatch.create(client=client)
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == 30
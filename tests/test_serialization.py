@@ -0,0 +1,90 @@
+import pickle
+
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    Color,
+    MatchInfo,
+    RealTimeMatch,
+    TimeControl,
+    TimeMode,
+    User,
+    Variant,
+)
+from play_lichess.serialization import FORMAT_VERSION
+from play_lichess.testing import challenge_response
+
+DATA = challenge_response("abcd1234", {"clock.limit": 180, "clock.increment": 2})
+DATA["challenge"]["challenger"] = {
+    "id": "player",
+    "name": "Player",
+    "username": "Player",
+    "online": True,
+    "rating": 1712,
+    "title": "FM",
+}
+
+
+def test_match_round_trip():
+    match = RealTimeMatch.from_data(DATA, "Board 1")
+    data = match.to_bytes()
+    decoded = RealTimeMatch.from_bytes(data)
+
+    assert isinstance(decoded, RealTimeMatch)
+    assert decoded == RealTimeMatch.from_data(DATA, "Board 1", keep_data=False)
+    assert decoded.challenger is match.challenger
+    assert decoded.time_control is match.time_control
+    assert data[0] == FORMAT_VERSION
+    assert len(data) < len(pickle.dumps(match)) / 10
+
+
+def test_unusual_urls_and_missing_values():
+    match = MatchInfo(
+        challenge_id="id",
+        challenge_url="http://localhost/id",
+        status="created",
+        variant=Variant.HORDE,
+        speed=TimeMode.CORRESPONDENCE,
+        color=Color.BLACK,
+        url_white="http://localhost/id?w",
+    )
+    assert MatchInfo.from_bytes(match.to_bytes()) == match
+
+
+def test_lazy_match_round_trip():
+    match = RealTimeMatch.from_data(DATA, lazy=True)
+    decoded = RealTimeMatch.from_bytes(match.to_bytes())
+    assert decoded.variant == Variant.STANDARD
+    assert decoded.speed == TimeMode.BLITZ
+
+
+def test_user_and_time_control_round_trip():
+    user = User("id", "Name", None, False, None, "GM")
+    assert User.from_bytes(user.to_bytes()) == user
+    time_control = TimeControl.from_data({"type": "correspondence", "daysPerTurn": 3})
+    assert TimeControl.from_bytes(time_control.to_bytes()) is time_control
+    assert time_control.to_dict()["type"] == "correspondence"
+
+
+def test_to_dict():
+    data = RealTimeMatch.from_data(DATA).to_dict()
+    assert data["variant"] == "standard"
+    assert data["time_control"]["show"] == "3+2"
+    assert data["challenger"]["rating"] == 1712
+    assert data["dest_user"] is None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        bytes([FORMAT_VERSION + 1, 3]),
+        RealTimeMatch.from_data(DATA).to_bytes()[:-3],
+        RealTimeMatch.from_data(DATA).to_bytes() + b"\x00",
+        User("id", "Name", None, None, None, None).to_bytes(),
+    ],
+)
+def test_invalid_data(data):
+    with pytest.raises(BadArgumentError):
+        MatchInfo.from_bytes(data)
@@ -0,0 +1,86 @@
+import asyncio
+import gc
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from play_lichess import LichessClient
+from play_lichess import RealTimeMatch as AsyncRealTimeMatch
+from play_lichess.sync import CorrespondenceMatch, RealTimeMatch, SyncClient
+from play_lichess.testing import MockLichessServer
+
+
+@pytest.fixture
+def sync_client():
+    server = MockLichessServer()
+    client = SyncClient(base_url="http://127.0.0.1")
+    # the server runs on the client's background event loop
+    client.run(server.start())
+    client.client.base_url = server.base_url
+    yield client, server
+    client.run(server.stop())
+    client.close()
+
+
+def test_sync_create(sync_client):
+    client, server = sync_client
+    match = RealTimeMatch.create(clock_limit=180, clock_increment=0, client=client)
+    correspondence = client.create_correspondence_match(days=2)
+
+    assert isinstance(match, AsyncRealTimeMatch)
+    assert match.time_control is not None
+    assert match.time_control.show == "3+0"
+    assert correspondence.time_control is not None
+    assert correspondence.time_control.days_per_turn == 2
+
+
+def test_sync_from_many_threads(sync_client):
+    client, server = sync_client
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        matches = list(
+            executor.map(
+                lambda i: client.create_real_time_match(name=f"Board {i}"), range(20)
+            )
+        )
+
+    assert sorted(match.name for match in matches) == sorted(
+        f"Board {i}" for i in range(20)
+    )
+    assert len(set(server.peers)) <= 8
+
+
+def test_sync_batch(sync_client):
+    client, server = sync_client
+    results = CorrespondenceMatch.create_many([{"days": 1}] * 5, client=client)
+    futures = [client.submit_create(AsyncRealTimeMatch) for _ in range(3)]
+
+    assert all(result.ok for result in results)
+    assert all(isinstance(future.result(), AsyncRealTimeMatch) for future in futures)
+    assert len(server.requests) == 8
+
+
+def test_sync_client_closed():
+    client = SyncClient()
+    client.close()
+    assert client.closed
+    client.close()
+
+
+def test_client_closed_with_asyncio_run(sync_client):
+    _, server = sync_client
+    client = LichessClient(base_url=server.base_url)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            asyncio.run(AsyncRealTimeMatch.create(client=client))
+            gc.collect()
+
+    assert client.closed
+    # on Python 3.8, asyncio.run also drops the event loop left by earlier tests
+    assert not [
+        w
+        for w in caught
+        if issubclass(w.category, ResourceWarning)
+        and "event loop" not in str(w.message)
+    ]
@@ -0,0 +1,54 @@
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    LichessClient,
+    Match,
+    MatchTemplate,
+    RealTimeMatch,
+    Variant,
+)
+
+
+@pytest.mark.asyncio
+async def test_template_create(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        template = MatchTemplate(
+            clock_limit=180,
+            clock_increment=2,
+            variant=Variant.ATOMIC,
+            name="Club",
+            client=client,
+        )
+        first = await template.create()
+        second = await template.create(name='Board "2"')
+
+    assert isinstance(first, Match)
+    assert first.name == "Club"
+    assert second.name == 'Board "2"'
+    assert second.variant == Variant.ATOMIC
+    expected = {
+        "rated": False,
+        "clock.limit": 180,
+        "clock.increment": 2,
+        "variant": "atomic",
+    }
+    assert lichess_server.requests == [
+        {**expected, "name": "Club"},
+        {**expected, "name": 'Board "2"'},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_template_match_class(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        template = MatchTemplate(match_class=RealTimeMatch)
+        match = await template.create(name="Test", client=client)
+
+    assert isinstance(match, RealTimeMatch)
+    assert lichess_server.requests[0]["name"] == "Test"
+
+
+def test_template_validates_once():
+    with pytest.raises(BadArgumentError):
+        MatchTemplate(days=1, clock_limit=300, clock_increment=0)
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from play_lichess import LichessClient, MatchTemplate, RealTimeMatch, Timeout
+
+
+@pytest.mark.asyncio
+async def test_call_total_timeout(lichess_server):
+    lichess_server.latency = 0.5
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        start = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await RealTimeMatch.create(client=client, timeout=0.05)
+        assert time.monotonic() - start < 0.4
+
+        # the client can still be used after the call was cancelled
+        lichess_server.latency = 0
+        await RealTimeMatch.create(client=client)
+
+
+@pytest.mark.asyncio
+async def test_total_timeout_includes_rate_limit_pause(lichess_server):
+    lichess_server.failures = [429]
+    lichess_server.retry_after = 5
+    async with LichessClient(
+        base_url=lichess_server.base_url, timeout=Timeout(total=0.1)
+    ) as client:
+        with pytest.raises(asyncio.TimeoutError):
+            await MatchTemplate(client=client).create()
+
+
+@pytest.mark.asyncio
+async def test_read_timeout(lichess_server):
+    lichess_server.latency = 0.5
+    async with LichessClient(
+        base_url=lichess_server.base_url, timeout=Timeout(read=0.05)
+    ) as client:
+        with pytest.raises(asyncio.TimeoutError):
+            await RealTimeMatch.create(client=client)
+        # a call can set its own limits
+        match = await RealTimeMatch.create(
+            client=client, timeout=Timeout(total=2, read=1)
+        )
+    assert match.challenge_id
+
+
+@pytest.mark.asyncio
+async def test_warm_up(lichess_server):
+    traces = []
+    async with LichessClient(
+        base_url=lichess_server.base_url,
+        hooks=[traces.append],
+        warm_up_connections=2,
+        limit_per_host=2,
+        ttl_dns_cache=60,
+    ) as client:
+        await RealTimeMatch.create(client=client)
+        assert await client.warm_up() == 1
+
+    assert traces[0].connection_reused
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failure_does_not_raise():
+    # nothing listens on this port
+    async with LichessClient(base_url="http://127.0.0.1:9") as client:
+        assert await client.warm_up(2) == 0
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from play_lichess import (
+    BadArgumentError,
+    HttpError,
+    LichessClient,
+    RateLimiter,
+    RealTimeMatch,
+    TokenPool,
+)
+
+
+@pytest.mark.asyncio
+async def test_round_robin_skips_limited_token(lichess_server):
+    lichess_server.failures = [429]
+    pool = TokenPool(["a", "b", "c"], cooldown=60)
+    async with LichessClient(base_url=lichess_server.base_url, tokens=pool) as client:
+        start = time.monotonic()
+        for _ in range(4):
+            await RealTimeMatch.create(client=client)
+
+    # the rate-limited request is retried at once with the next token
+    assert time.monotonic() - start < 1
+    assert lichess_server.authorizations == [
+        "Bearer a",
+        "Bearer b",
+        "Bearer c",
+        "Bearer b",
+        "Bearer c",
+    ]
+    assert [state.rate_limited for state in pool.states] == [1, 0, 0]
+    assert pool.available == 2
+
+
+def test_token_not_in_repr():
+    pool = TokenPool(["lip_secret"])
+    assert "secret" not in repr(pool.states[0])
+
+
+@pytest.mark.asyncio
+async def test_least_recently_limited(lichess_server):
+    lichess_server.failures = [429, 429]
+    pool = TokenPool(["a", "b", "c"], strategy="least_recently_limited", cooldown=0.05)
+    async with LichessClient(base_url=lichess_server.base_url, tokens=pool) as client:
+        await RealTimeMatch.create(client=client)
+        time.sleep(0.06)
+        await RealTimeMatch.create(client=client)
+
+    # a and b were limited, so c is preferred once they are available again
+    assert lichess_server.authorizations == [
+        "Bearer a",
+        "Bearer b",
+        "Bearer c",
+        "Bearer c",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_all_tokens_limited(lichess_server):
+    lichess_server.failures = [429, 429]
+    limiter = RateLimiter(max_retries=0)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, tokens=["a", "b"]
+    ) as client:
+        with pytest.raises(HttpError):
+            await RealTimeMatch.create(client=client)
+    assert client.token_pool is not None
+    assert client.token_pool.available == 0
+
+
+def test_invalid_pool():
+    with pytest.raises(BadArgumentError):
+        TokenPool([])
+    with pytest.raises(BadArgumentError):
+        TokenPool(["a"], strategy="random")
@@ -0,0 +1,95 @@
+import pytest
+
+from play_lichess import (
+    HttpError,
+    LichessClient,
+    MatchTemplate,
+    RateLimiter,
+    RealTimeMatch,
+    RequestTrace,
+)
+
+
+@pytest.mark.asyncio
+async def test_trace_phases(lichess_server):
+    traces = []
+    async with LichessClient(
+        base_url=lichess_server.base_url, hooks=[traces.append]
+    ) as client:
+        first = await RealTimeMatch.create(client=client)
+        await RealTimeMatch.create(client=client)
+
+    assert len(traces) == 2
+    trace = traces[0]
+    assert isinstance(trace, RequestTrace)
+    assert trace.method == "POST"
+    assert trace.url == f"{lichess_server.base_url}/api/challenge/open"
+    assert trace.status == 200
+    assert trace.attempts == 1
+    assert trace.result is first
+    assert trace.error is None
+    assert not trace.connection_reused
+    assert trace.total is not None
+    for phase in (trace.connect, trace.server, trace.download, trace.parse):
+        assert phase is not None and 0 <= phase <= trace.total
+    assert traces[1].connection_reused
+    assert traces[1].connect is None
+
+
+@pytest.mark.asyncio
+async def test_trace_retries_and_errors(lichess_server):
+    traces = []
+    lichess_server.failures = [503, 404]
+    limiter = RateLimiter(backoff_base=0.01)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, hooks=[traces.append]
+    ) as client:
+        with pytest.raises(HttpError):
+            await MatchTemplate(client=client).create()
+
+    (trace,) = traces
+    assert trace.attempts == 2
+    assert trace.status == 404
+    assert isinstance(trace.error, HttpError)
+    assert trace.result is None
+    assert trace.parse is None
+
+
+@pytest.mark.asyncio
+async def test_trace_phases_of_last_attempt(lichess_server):
+    traces = []
+    lichess_server.failures = [503]
+    limiter = RateLimiter(backoff_base=0.01)
+    async with LichessClient(
+        base_url=lichess_server.base_url, rate_limiter=limiter, hooks=[traces.append]
+    ) as client:
+        await MatchTemplate(client=client).create()
+
+    (trace,) = traces
+    assert trace.attempts == 2
+    assert trace.status == 200
+    assert trace.connection_reused
+    assert trace.connect is None
+    assert trace.dns is None
+
+
+@pytest.mark.asyncio
+async def test_remove_hook_and_failing_hook(lichess_server, caplog):
+    traces = []
+
+    def broken_hook(trace):
+        raise RuntimeError("broken")
+
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        client.add_hook(broken_hook)
+        client.add_hook(traces.append)
+        await RealTimeMatch.create(client=client)
+        client.remove_hook(traces.append)
+        await RealTimeMatch.create(client=client)
+
+    assert len(traces) == 1
+    assert "Error in request hook" in caplog.text
+    # hooks added after the session was opened still get the overall timings
+    assert traces[0].connect is None and traces[0].total is not None
+    with pytest.raises(ValueError):
+        client.remove_hook(traces.append)
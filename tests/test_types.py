@@ -0,0 +1,79 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from play_lichess import BadArgumentError, MatchInfo, RealTimeMatch, TimeControl, User
+from play_lichess.intern import InternStats, InternTable
+from play_lichess.testing import challenge_response
+from play_lichess.types import TimeControlType, time_control_table
+
+
+def test_slotted_types():
+    match = RealTimeMatch.from_data(challenge_response("abcd1234", {}), "Test")
+    assert not hasattr(match, "__dict__")
+    assert match.time_control is not None
+    assert not hasattr(match.time_control, "__dict__")
+    assert pickle.loads(pickle.dumps(match)) == match
+
+
+def test_value_types_are_frozen():
+    time_control = TimeControl(TimeControlType.CLOCK, 300, 0, "5+0", None)
+    user = User("alice", "Alice", None, None, 1500, None)
+    assert hash(time_control) == hash(
+        TimeControl(TimeControlType.CLOCK, 300, 0, "5+0", None)
+    )
+    assert pickle.loads(pickle.dumps(user)) == user
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        user.rating = 1600  # type: ignore
+
+
+def test_from_data_keep_data():
+    data = challenge_response("abcd1234", {"clock.limit": 60, "clock.increment": 1})
+    assert MatchInfo.from_data(data)._data is data
+    match = MatchInfo.from_data(data, keep_data=False)
+    assert match._data is None
+    assert match.challenge_id == "abcd1234"
+
+
+def test_from_data_lazy():
+    data = challenge_response("abcd1234", {"days": 3})
+    data["challenge"]["variant"]["key"] = "unknownVariant"
+    match = MatchInfo.from_data(data, "Test", lazy=True)
+    assert match.challenge_url == "https://lichess.org/abcd1234"
+    assert match.url_black == "https://lichess.org/abcd1234?color=black"
+    assert match.name == "Test"
+    assert match.time_control is not None
+    assert match.time_control.days_per_turn == 3
+    assert match.time_control is match.time_control
+    with pytest.raises(ValueError):
+        match.variant
+
+
+def test_from_data_lazy_equals_eager():
+    data = challenge_response("abcd1234", {"clock.limit": 60, "clock.increment": 1})
+    assert MatchInfo.from_data(data, lazy=True) == MatchInfo.from_data(data)
+    with pytest.raises(BadArgumentError):
+        MatchInfo.from_data(data, lazy=True, keep_data=False)
+
+
+def test_time_controls_are_shared():
+    time_control_table.clear()
+    first = TimeControl.from_data({"type": "clock", "limit": 180, "increment": 2})
+    second = TimeControl.from_data({"type": "clock", "limit": 180, "increment": 2})
+    other = TimeControl.from_data({"type": "clock", "limit": 180, "increment": 0})
+    assert first is second
+    assert other is not first
+    assert time_control_table.stats() == InternStats(1, 2, 2, 256)
+
+
+def test_intern_table_evicts_least_recently_used():
+    table: InternTable[str, User] = InternTable(maxsize=2)
+    alice = table.get("alice", lambda: User("alice", "Alice", None, None, 1500, None))
+    table.get("bob", lambda: User("bob", "Bob", None, None, 1600, None))
+    assert table.get("alice", lambda: alice) is alice
+    table.get("carol", lambda: User("carol", "Carol", None, None, 1700, None))
+    assert len(table) == 2
+    assert table.stats().hits == 1
+    table.get("bob", lambda: User("bob", "Bob", None, None, 1600, None))
+    assert table.stats().misses == 4
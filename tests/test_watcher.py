@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from play_lichess import ChallengeWatcher, LichessClient, RealTimeMatch
+
+
+async def wait_for(condition, timeout=2):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+@pytest.mark.asyncio
+async def test_watch_events(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        results = await RealTimeMatch.create_many([{}] * 5, client=client)
+        matches = []
+        for result in results:
+            assert result.match is not None
+            matches.append(result.match)
+        first, second, third, fourth, fifth = matches
+        lichess_server.update_game(first.challenge_id)
+        callback_events = []
+        async with ChallengeWatcher(client=client, ids_per_stream=3) as watcher:
+            watcher.add_callback(callback_events.append)
+            watcher.watch_many([first, second, third])
+            # more challenges than fit on one stream open another stream
+            watcher.watch_many([fourth, fifth])
+            assert watcher.streams == 2
+            assert len(watcher) == 5
+
+            events = []
+
+            async def collect():
+                async for event in watcher:
+                    events.append(event)
+
+            task = asyncio.ensure_future(collect())
+            await asyncio.sleep(0)
+            await wait_for(lambda: len(callback_events) == 1)
+            assert callback_events[0].match is first
+            assert callback_events[0].status == "started"
+            assert not callback_events[0].finished
+
+            await wait_for(lambda: len(lichess_server._streams) == 2)
+            lichess_server.update_game(second.challenge_id)
+            lichess_server.update_game(fifth.challenge_id)
+            lichess_server.update_game(first.challenge_id, "mate")
+            await wait_for(lambda: len(events) == 4)
+
+        await task
+        assert {(e.match.challenge_id, e.status) for e in events} == {
+            (first.challenge_id, "started"),
+            (second.challenge_id, "started"),
+            (fifth.challenge_id, "started"),
+            (first.challenge_id, "mate"),
+        }
+        assert [e.finished for e in events].count(True) == 1
+        assert len(watcher) == 0
+        assert watcher.streams == 0
+
+
+@pytest.mark.asyncio
+async def test_watch_added_to_open_stream(lichess_server):
+    async with LichessClient(base_url=lichess_server.base_url) as client:
+        first = await RealTimeMatch.create(client=client)
+        second = await RealTimeMatch.create(client=client)
+        events = []
+        async with ChallengeWatcher(client=client) as watcher:
+            watcher.add_callback(events.append)
+            watcher.watch(first)
+            await wait_for(lambda: len(lichess_server._streams) == 1)
+            watcher.watch(second)
+            ids, _ = next(iter(lichess_server._streams.values()))
+            await wait_for(lambda: second.challenge_id in ids)
+            assert watcher.streams == 1
+            lichess_server.update_game(second.challenge_id, "aborted")
+            await wait_for(lambda: len(events) == 1)
+
+        assert events[0].match is second
+        assert events[0].finished